@@ -12,5 +12,10 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Serve the read-heavy endpoints with their async views (see backend.async_api).
+os.environ.setdefault('ASYNC_READ_VIEWS', '1')
+# Requests may run on a fresh thread each time, which would leave a persistent
+# connection behind per thread; pool connections instead (DB_POOL_MAX_SIZE).
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
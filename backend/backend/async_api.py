@@ -0,0 +1,110 @@
+"""Async read paths for ASGI deployments.
+
+DRF views are synchronous, so under an ASGI server each request occupies a
+worker thread for its whole duration. The read endpoints the dashboards poll
+(task list, intern list, ``/api/users/me/``) also have ``async def``
+implementations built from the helpers here: JWT authentication through
+``CachedJWTAuthentication.aauthenticate``, the async ORM, and DRF's
+``JSONRenderer`` so the bytes match the sync views.
+
+``split_read_view`` sends GET/HEAD to the async implementation and every other
+method to the existing DRF view; ``split_async_view`` does the same for other
+methods (login POSTs go to ``users.views.login_async``, which awaits password
+hashing on a thread pool). They only do so when ``settings.ASYNC_READ_VIEWS``
+is on, which ``backend/asgi.py`` enables; under WSGI the URLs keep their
+plain sync views.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from users.authentication import CachedJWTAuthentication
+from .metrics import measure_serialization
+
+
+_authenticator = CachedJWTAuthentication()
+_renderer = JSONRenderer()
+
+
+def json_response(data, status=status.HTTP_200_OK, headers=None):
+    with measure_serialization():
+        content = _renderer.render(data)
+    return HttpResponse(content, status=status, content_type="application/json", headers=headers)
+
+
+def error_response(detail, status):
+    return json_response({"detail": detail}, status=status)
+
+
+def async_api_view(func=None, *, authenticators=None, public=False):
+    """Wrap ``async def func(request, ...)`` with JWT authentication and DRF-style errors.
+
+    ``func`` receives a DRF ``Request`` (for ``query_params``, ``data`` and
+    pagination) with ``user`` and ``auth`` set; unauthenticated requests get
+    the same 401 body and ``WWW-Authenticate`` header as the sync views.
+    ``authenticators`` are tried in order and default to the header-based JWT
+    authentication; ``public`` views skip authentication.
+    """
+    if func is None:
+        return functools.partial(async_api_view, authenticators=authenticators, public=public)
+    authenticators = authenticators or [_authenticator]
+
+    @functools.wraps(func)
+    async def view(request, *args, **kwargs):
+        try:
+            if public:
+                result = AnonymousUser(), None
+            else:
+                for authenticator in authenticators:
+                    result = await authenticator.aauthenticate(request)
+                    if result is not None:
+                        break
+                else:
+                    raise exceptions.NotAuthenticated()
+            api_request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+            api_request.user, api_request.auth = result
+            return await func(api_request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            headers = None
+            if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                headers = {"WWW-Authenticate": authenticators[0].authenticate_header(request)}
+            data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+            return json_response(data, status=exc.status_code, headers=headers)
+
+    return view
+
+
+def split_read_view(sync_view, async_get):
+    """Serve GET/HEAD with ``async_get`` and other methods with ``sync_view``.
+
+    Returns ``sync_view`` unchanged unless ``settings.ASYNC_READ_VIEWS`` is on.
+    """
+    return split_async_view(sync_view, async_get, methods=("GET", "HEAD"))
+
+
+def split_async_view(sync_view, async_view, methods):
+    """Serve ``methods`` with ``async_view`` and the rest with ``sync_view``.
+
+    Returns ``sync_view`` unchanged unless ``settings.ASYNC_READ_VIEWS`` is on.
+    """
+    if not settings.ASYNC_READ_VIEWS:
+        return sync_view
+    sync_handler = sync_to_async(sync_view)
+
+    @csrf_exempt
+    async def view(request, *args, **kwargs):
+        if request.method in methods:
+            return await async_view(request, *args, **kwargs)
+        return await sync_handler(request, *args, **kwargs)
+
+    # Lets backend.metrics.declared_query_budget find the view's budget.
+    view.sync_view = sync_view
+    return view
@@ -0,0 +1,341 @@
+"""Per-request instrumentation: SQL count and time, serialization time, size.
+
+``RequestMetricsMiddleware`` opens a ``RequestStats`` for each request in a
+context variable. Every database connection gets ``record_query`` as an
+execute wrapper, and ``TimedJSONRenderer`` (plus ``async_api.json_response``)
+time JSON rendering through ``measure_serialization``; context variables
+follow the request into ``sync_to_async`` threads, so async views are
+measured too.
+
+Each response gets a ``Server-Timing`` header, requests over
+``METRICS_SLOW_REQUEST_MS`` or ``METRICS_SLOW_REQUEST_QUERIES`` are logged,
+and totals per route are kept in ``registry`` and served in Prometheus text
+format by ``backend.views.metrics``. The registry is per process, so each
+worker has to be scraped on its own.
+
+Streaming responses (exports, event streams) are measured up to the point
+the response starts; their body is not counted.
+"""
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connections
+from django.db.backends.signals import connection_created
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.renderers import JSONRenderer
+
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROCESS_STARTED = time.time()
+
+
+class RequestStats:
+    __slots__ = ("sql_count", "sql_time", "serialize_time")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.serialize_time = 0.0
+
+
+_current = contextvars.ContextVar("request_stats", default=None)
+
+
+def current_stats():
+    """The ``RequestStats`` of the request being handled, or None outside one."""
+    return _current.get()
+
+
+def record_query(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.sql_count += 1
+        stats.sql_time += time.perf_counter() - started
+
+
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+connection_created.connect(install_query_recorder, dispatch_uid="backend.metrics.install_query_recorder")
+
+
+@contextmanager
+def measure_serialization():
+    stats = _current.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stats is not None:
+            stats.serialize_time += time.perf_counter() - started
+
+
+class TimedJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with measure_serialization():
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+def query_budget(max_queries):
+    """Declare the most SQL statements a GET on the view may run.
+
+    Works on view functions and ``APIView`` classes. Reads over budget are
+    logged, and ``backend.tests.QueryScalingTests`` fails on them. Writes are
+    not budgeted; they legitimately vary with what they touch.
+    """
+    def decorate(view):
+        view.query_budget = max_queries
+        return view
+    return decorate
+
+
+def declared_query_budget(callback):
+    """The ``query_budget`` of a URL callback, looking through ``as_view`` and ``split_read_view``."""
+    while callback is not None:
+        budget = getattr(callback, "query_budget", None)
+        if budget is None:
+            budget = getattr(getattr(callback, "view_class", None), "query_budget", None)
+        if budget is not None:
+            return budget
+        callback = getattr(callback, "sync_view", None)
+    return None
+
+
+class MetricsRegistry:
+    """Thread-safe per-route totals rendered in Prometheus text format."""
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._routes = {}
+
+    def observe(self, method, route, status, duration, stats, size):
+        with self._lock:
+            key = (method, route, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            totals = self._routes.get(route)
+            if totals is None:
+                totals = self._routes[route] = {
+                    "count": 0, "duration": 0.0, "sql_count": 0, "sql_time": 0.0,
+                    "serialize_time": 0.0, "size": 0, "buckets": [0] * len(self.buckets),
+                }
+            totals["count"] += 1
+            totals["duration"] += duration
+            totals["sql_count"] += stats.sql_count
+            totals["sql_time"] += stats.sql_time
+            totals["serialize_time"] += stats.serialize_time
+            totals["size"] += size
+            index = bisect_left(self.buckets, duration)
+            if index < len(self.buckets):
+                totals["buckets"][index] += 1
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._routes.clear()
+
+    def render(self):
+        with self._lock:
+            requests = sorted(self._requests.items())
+            routes = sorted((route, {**totals, "buckets": list(totals["buckets"])}) for route, totals in self._routes.items())
+
+        lines = [
+            "# HELP http_requests_total Requests handled, by method, route and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        lines += [
+            f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}'
+            for (method, route, status), count in requests
+        ]
+        lines += [
+            "# HELP http_request_duration_seconds Time to produce the response.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for route, totals in routes:
+            label = f'route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, totals["buckets"]):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{label},le="+Inf"}} {totals["count"]}')
+            lines.append(f'http_request_duration_seconds_sum{{{label}}} {totals["duration"]:.6f}')
+            lines.append(f'http_request_duration_seconds_count{{{label}}} {totals["count"]}')
+        for name, key, kind, help_text in (
+            ("http_request_db_queries_total", "sql_count", "counter", "SQL statements executed."),
+            ("http_request_db_seconds_total", "sql_time", "counter", "Time spent executing SQL."),
+            ("http_request_serialize_seconds_total", "serialize_time", "counter", "Time spent rendering JSON."),
+            ("http_response_bytes_total", "size", "counter", "Response body bytes (non-streaming)."),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for route, totals in routes:
+                value = totals[key]
+                value = f"{value:.6f}" if isinstance(value, float) else value
+                lines.append(f'{name}{{route="{_escape(route)}"}} {value}')
+        return lines
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+
+
+def _route(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return "/" + match.route if match.route is not None else match.view_name
+
+
+def _is_staff(request) -> bool:
+    # DRF stores the user it authenticated on the Django request. A lazy
+    # session user that nobody evaluated is left alone: loading it would
+    # cost a query (and cannot run in the async path).
+    user = request.__dict__.get("user")
+    if user is None or (isinstance(user, SimpleLazyObject) and user._wrapped is empty):
+        return False
+    return bool(getattr(user, "is_staff", False) or getattr(user, "role", None) == "ADMIN")
+
+
+def _finish(request, response, started, stats):
+    duration = time.perf_counter() - started
+    size = 0 if response.streaming else len(response.content)
+    route = _route(request)
+    registry.observe(request.method, route, response.status_code, duration, stats, size)
+
+    if settings.DEBUG or _is_staff(request):
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={stats.sql_time * 1000:.1f};desc="{stats.sql_count} queries"',
+            f"serialize;dur={stats.serialize_time * 1000:.1f}",
+            f"total;dur={duration * 1000:.1f}",
+        ])
+    match = getattr(request, "resolver_match", None)
+    budget = None
+    if match is not None and request.method in ("GET", "HEAD"):
+        budget = declared_query_budget(match.func)
+    if budget is not None and stats.sql_count > budget:
+        logger.warning(
+            "Request %s %s (%s) ran %d queries, over its budget of %d",
+            request.method, request.path, route, stats.sql_count, budget,
+        )
+    if duration * 1000 >= settings.METRICS_SLOW_REQUEST_MS or stats.sql_count >= settings.METRICS_SLOW_REQUEST_QUERIES:
+        logger.warning(
+            "Slow request %s %s (%s): %d ms, %d queries in %d ms, serialize %d ms, %d bytes",
+            request.method, request.path, route, duration * 1000, stats.sql_count,
+            stats.sql_time * 1000, stats.serialize_time * 1000, size,
+        )
+    return response
+
+
+class RequestMetricsMiddleware:
+    """Measure each request; see the module docstring."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        # Connections opened before this module was imported missed the signal.
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats, started = RequestStats(), time.perf_counter()
+        token = _current.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return _finish(request, response, started, stats)
+
+    async def __acall__(self, request):
+        stats, started = RequestStats(), time.perf_counter()
+        token = _current.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return _finish(request, response, started, stats)
+
+
+POOL_STATS = ("pool_min", "pool_max", "pool_size", "pool_available", "requests_waiting")
+
+
+def pool_stats(alias="default"):
+    """Size and usage of the connection pool of ``alias``, or None when it is not pooled."""
+    # Only the PostgreSQL backend has a pool, and only when OPTIONS["pool"] is set.
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+    stats = pool.get_stats()
+    return {name: stats.get(name, 0) for name in POOL_STATS}
+
+
+def check_health():
+    """Probe the database and cache; return ``(healthy, checks)``."""
+    checks = {}
+    started = time.perf_counter()
+    try:
+        with connections["default"].cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        checks["database"] = {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+    except DatabaseError as exc:
+        logger.exception("Database health check failed")
+        checks["database"] = {"ok": False, "error": str(exc)}
+    pool = pool_stats()
+    if pool is not None:
+        checks["database"]["pool"] = pool
+
+    started = time.perf_counter()
+    try:
+        cache = caches["default"]
+        cache.set("health-check", 1, 10)
+        ok = cache.get("health-check") == 1
+        checks["cache"] = {"ok": ok, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+    except Exception as exc:  # Any cache backend error means the cache is down.
+        logger.exception("Cache health check failed")
+        checks["cache"] = {"ok": False, "error": str(exc)}
+    return all(check["ok"] for check in checks.values()), checks
+
+
+_last_health = {"at": None, "healthy": True}
+_last_health_lock = threading.Lock()
+
+
+def cached_health() -> bool:
+    """Overall ``check_health`` result, probed at most every ``HEALTH_CHECK_CACHE_SECONDS``.
+
+    For unauthenticated callers, so polling ``/`` cannot drive probe traffic.
+    """
+    now = time.monotonic()
+    with _last_health_lock:
+        at = _last_health["at"]
+        if at is not None and now - at < settings.HEALTH_CHECK_CACHE_SECONDS:
+            return _last_health["healthy"]
+    healthy, _ = check_health()
+    with _last_health_lock:
+        _last_health.update(at=now, healthy=healthy)
+    return healthy
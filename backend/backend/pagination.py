@@ -0,0 +1,146 @@
+import json
+import operator
+from base64 import b64decode, b64encode
+from functools import reduce
+from urllib import parse
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+from rest_framework.utils.urls import replace_query_param
+
+
+def _plain(value):
+    # Dates keep full precision (DjangoJSONEncoder drops microseconds).
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (int, float, str)) or value is None:
+        return value
+    return str(value)
+
+
+class KeysetCursorPagination(CursorPagination):
+    """Cursor (keyset) pagination used by every list endpoint.
+
+    The page is selected with a ``WHERE`` on the ordering key instead of an
+    ``OFFSET``, so deep pages cost the same as the first one. Views declare
+    their ordering with an ``ordering`` attribute whose last field must be
+    unique (e.g. ``("-created_at", "-id")``). Unlike DRF's ``CursorPagination``,
+    the cursor carries the value of *every* ordering field and the page is
+    sought with the row comparison ``(a, id) > (x, y)`` (written out as
+    ``a > x OR (a = x AND id > y)`` so mixed directions work), so any number
+    of rows tied on the leading field page correctly without offsets.
+
+    Page size comes from ``REST_FRAMEWORK["PAGE_SIZE"]`` and can be lowered or
+    raised per request with ``?page_size=`` up to ``REST_FRAMEWORK["MAX_PAGE_SIZE"]``.
+    """
+
+    ordering = ("-id",)
+    page_size_query_param = "page_size"
+
+    @property
+    def max_page_size(self):
+        return settings.REST_FRAMEWORK.get("MAX_PAGE_SIZE", 1000)
+
+    def get_ordering(self, request, queryset, view):
+        if any(issubclass(backend, OrderingFilter) for backend in getattr(view, "filter_backends", [])):
+            return super().get_ordering(request, queryset, view)
+        ordering = getattr(view, "ordering", None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse, position = self.cursor or (False, None)
+
+        queryset = queryset.order_by(*(_reverse_ordering(self.ordering) if reverse else self.ordering))
+        if position is not None:
+            try:
+                queryset = queryset.filter(self._seek(position, reverse))
+            except (DjangoValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message) from None
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _seek(self, position, reverse):
+        """Rows after ``position`` in the (possibly reversed) ordering."""
+        terms, equal = [], Q()
+        for term, value in zip(self.ordering, position):
+            field = term.lstrip("-")
+            descending = term.startswith("-") != reverse
+            terms.append(equal & Q(**{f"{field}__{'lt' if descending else 'gt'}": value}))
+            equal &= Q(**{field: value})
+        return reduce(operator.or_, terms)
+
+    def _position(self, item):
+        return [
+            _plain(item[term.lstrip("-")] if isinstance(item, dict) else getattr(item, term.lstrip("-")))
+            for term in self.ordering
+        ]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        # An empty page past the end restarts from the first page.
+        position = self._position(self.page[-1]) if self.page else None
+        return self.encode_cursor((False, position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        position = self._position(self.page[0]) if self.page else None
+        return self.encode_cursor((True, position))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            tokens = parse.parse_qs(b64decode(encoded.encode("ascii")).decode("ascii"))
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+            position = tokens.get("p", [None])[0]
+            if position is not None:
+                position = json.loads(position)
+                if not isinstance(position, list) or len(position) != len(self.ordering):
+                    raise ValueError
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message) from None
+        return reverse, position
+
+    def encode_cursor(self, cursor):
+        reverse, position = cursor
+        tokens = {}
+        if reverse:
+            tokens["r"] = "1"
+        if position is not None:
+            tokens["p"] = json.dumps(position, separators=(",", ":"))
+        encoded = b64encode(parse.urlencode(tokens).encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        # The page query is the only database access. Like Django's own async
+        # QuerySet methods, it runs through sync_to_async.
+        return await sync_to_async(self.paginate_queryset)(queryset, request, view)
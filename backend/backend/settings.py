@@ -10,9 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 from datetime import timedelta
 
+from django.conf import global_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -48,6 +51,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the whole middleware stack.
+    'backend.metrics.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -81,16 +86,65 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Connection settings come from DB_* environment variables; the defaults
+# match a local PostgreSQL.
+#
+# DB_CONN_MAX_AGE keeps a connection open across requests for that many
+# seconds ("none" for no limit, 0 to reconnect on every request), checked
+# before reuse when DB_CONN_HEALTH_CHECKS is on. Under ASGI each request may
+# run on a new thread, so backend/asgi.py turns persistent connections off;
+# use the pool there instead.
+#
+# DB_POOL_MAX_SIZE > 0 switches to psycopg 3's connection pool (needs
+# psycopg[pool]) holding DB_POOL_MIN_SIZE to DB_POOL_MAX_SIZE connections per
+# process; a request waits up to DB_POOL_TIMEOUT seconds for a free one.
+# Pooling replaces persistent connections, so CONN_MAX_AGE is 0 then.
+#
+# DB_STATEMENT_TIMEOUT_MS > 0 makes PostgreSQL cancel longer statements.
+
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', '0'))
+DB_CONN_MAX_AGE = os.environ.get('DB_CONN_MAX_AGE', '60')
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', '0'))
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'postgres',
-        'USER': 'postgres',
-        'PASSWORD': '310314',
-        'HOST': 'localhost',
-        'PORT': '5432',
+        'NAME': os.environ.get('DB_NAME', 'postgres'),
+        'USER': os.environ.get('DB_USER', 'postgres'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'HOST': os.environ.get('DB_HOST', 'localhost'),
+        'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': 0 if DB_POOL_MAX_SIZE else (
+            None if DB_CONN_MAX_AGE.lower() == 'none' else int(DB_CONN_MAX_AGE)
+        ),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', '1') == '1',
+        'OPTIONS': {},
     }
 }
+if DB_POOL_MAX_SIZE:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', '2')),
+        'max_size': DB_POOL_MAX_SIZE,
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', '10')),
+    }
+if DB_STATEMENT_TIMEOUT_MS:
+    DATABASES['default']['OPTIONS']['options'] = f'-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}'
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory is per process; with several workers use a shared backend such
+# as django.core.cache.backends.redis.RedisCache so invalidation reaches all.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Intern dashboard response cache (see interns/cache.py)
+DASHBOARD_CACHE_ALIAS = 'default'
+DASHBOARD_CACHE_TIMEOUT = 300  # seconds
 
 
 # Password validation
@@ -111,6 +165,44 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# The profile picks the hasher for new hashes; the others stay installed so
+# existing hashes still verify and are rehashed on the next successful login.
+# 'argon2' requires the argon2-cffi package.
+
+PASSWORD_HASHER_PROFILE = 'pbkdf2'
+
+PASSWORD_HASHER_PARAMS = {
+    'pbkdf2_iterations': 1_000_000,
+    'scrypt_work_factor': 2 ** 14,
+    'argon2_time_cost': 2,
+    'argon2_memory_cost': 102400,  # KiB
+    'argon2_parallelism': 8,
+}
+
+PASSWORD_HASHER_PROFILES = {
+    'pbkdf2': 'users.hashers.TunedPBKDF2PasswordHasher',
+    'scrypt': 'users.hashers.TunedScryptPasswordHasher',
+    'argon2': 'users.hashers.TunedArgon2PasswordHasher',
+}
+
+# The preferred hasher first, then the other profiles and Django's default
+# hashers so hashes stored in any of their formats still verify (and are
+# upgraded on the next login).
+PASSWORD_HASHERS = [PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]] + [
+    hasher for profile, hasher in PASSWORD_HASHER_PROFILES.items()
+    if profile != PASSWORD_HASHER_PROFILE
+] + global_settings.PASSWORD_HASHERS
+
+AUTHENTICATION_BACKENDS = ['users.backends.PooledModelBackend']
+
+# Login load shedding (see users/login.py)
+LOGIN_HASH_WORKERS = 4  # roughly one per core reserved for password hashing
+LOGIN_HASH_QUEUE = 64  # logins allowed to wait for a worker before 503
+LOGIN_FAILURE_LIMIT = 5  # failed attempts per account ...
+LOGIN_FAILURE_WINDOW = 300  # ... within this many seconds before 429
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -150,11 +242,20 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # List endpoints return cursor-paginated pages: {"next", "previous", "results"}
+    'DEFAULT_PAGINATION_CLASS': 'backend.pagination.KeysetCursorPagination',
+    # JSONRenderer that reports its time to backend.metrics.
+    'DEFAULT_RENDERER_CLASSES': [
+        'backend.metrics.TimedJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'PAGE_SIZE': 100,
+    'MAX_PAGE_SIZE': 1000,
 }
 
 # JWT Settings
@@ -165,6 +266,57 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
 }
 
+# Authenticated users are resolved through an in-process LRU (see
+# users/authentication.py); entries are dropped on User save/delete.
+AUTH_USER_CACHE_TTL = 60  # seconds
+AUTH_USER_CACHE_SIZE = 10000
+
+# Tokens for ``?access_token=`` (users.authentication.QueryToken) are only
+# checked when a stream connects, so they can expire quickly.
+QUERY_TOKEN_LIFETIME = timedelta(seconds=60)
+
+# Task change events streamed over SSE (see tasks/events.py). The in-process
+# broker only reaches streams served by the same process.
+#
+# Under WSGI every open stream holds a worker thread, so streams close after
+# TASK_EVENTS_WSGI_STREAM_SECONDS and the client reconnects; still size the
+# server for one thread per open dashboard on top of request traffic (e.g.
+# gunicorn --workers 4 --threads 8 serves about 32 dashboards plus requests),
+# or serve under ASGI, where a waiting stream costs a coroutine.
+TASK_EVENTS_BROKER = 'tasks.events.InProcessBroker'
+TASK_EVENTS_QUEUE_SIZE = 1000  # events buffered per stream before it is told to resync
+TASK_EVENTS_HEARTBEAT = 15  # seconds between keep-alive comments
+TASK_EVENTS_STREAM_SECONDS = 300  # ASGI streams close after this; clients reconnect
+TASK_EVENTS_WSGI_STREAM_SECONDS = 30
+TASK_EVENTS_RETRY_MS = 3000
+
+# Delta sync (/api/tasks/changes/). Rows are only reported once they are
+# older than the settle window, so slow transactions that commit late are
+# not skipped; tombstones older than the retention force a full resync.
+TASK_CHANGES_SETTLE_SECONDS = 2
+TASK_TOMBSTONE_RETENTION_DAYS = 90
+
+# Overdue engine (see tasks/overdue.py) and the task_digest command.
+TASK_DUE_SOON_DAYS = 3
+TASK_DIGEST_BATCH_SIZE = 2000  # open tasks read per keyset query
+TASK_DIGEST_MAX_ITEMS = 20  # tasks listed per digest; counts cover the rest
+
+# Route GETs on the task list, intern list and users/me, and login POSTs, to
+# their async views (see backend/async_api.py). backend/asgi.py turns this on;
+# WSGI keeps it off.
+ASYNC_READ_VIEWS = os.environ.get('ASYNC_READ_VIEWS', '0') == '1'
+
+# Request instrumentation (see backend/metrics.py). Requests at or over
+# either threshold are logged by the "backend.metrics" logger; /metrics
+# requires "Authorization: Bearer <METRICS_TOKEN>", and is refused outright
+# when no token is set unless DEBUG is on.
+METRICS_SLOW_REQUEST_MS = int(os.environ.get('METRICS_SLOW_REQUEST_MS', '500'))
+METRICS_SLOW_REQUEST_QUERIES = int(os.environ.get('METRICS_SLOW_REQUEST_QUERIES', '50'))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+# Without the token, "/" only reports ok/degraded, from a probe reused for
+# this long; Server-Timing is only sent to staff, or to anyone with DEBUG on.
+HEALTH_CHECK_CACHE_SECONDS = 5
+
 # Custom user model
 AUTH_USER_MODEL = 'users.User'
 
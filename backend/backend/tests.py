@@ -0,0 +1,204 @@
+import re
+from datetime import date, timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.test import APIClient
+
+from interns.models import InternProfile
+from reports.rollups import update_rollups
+from tasks.models import Task
+from tasks.views import TaskListCreateView
+from users.authentication import user_cache
+from . import metrics
+from .metrics import RequestMetricsMiddleware, declared_query_budget, registry
+
+
+User = get_user_model()
+
+
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_server_timing_reports_queries(self):
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, 200)
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="\d+ queries", serialize;dur=[\d.]+, total;dur=[\d.]+')
+        self.assertGreater(int(re.search(r'"(\d+) queries"', timing).group(1)), 0)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_endpoint(self):
+        self.client.get("/api/tasks/")
+        body = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret").content.decode()
+        self.assertIn("backend_up 1", body)
+        self.assertIn('http_requests_total{method="GET",route="/api/tasks/",status="200"} 1', body)
+        self.assertRegex(body, r'http_request_db_queries_total\{route="/api/tasks/"\} [1-9]')
+        self.assertIn('http_request_duration_seconds_bucket{route="/api/tasks/",le="+Inf"} 1', body)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 401)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret").status_code, 200)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_metrics_without_token_only_in_debug(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        with self.settings(DEBUG=True):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    @override_settings(METRICS_SLOW_REQUEST_QUERIES=1)
+    def test_slow_requests_are_logged(self):
+        with self.assertLogs("backend.metrics", level="WARNING") as logs:
+            self.client.get("/api/tasks/")
+        self.assertIn("Slow request GET /api/tasks/", logs.output[0])
+
+    def test_async_requests_count_queries(self):
+        async def view(request):
+            await sync_to_async(lambda: list(User.objects.all()))()
+            await User.objects.acount()
+            return HttpResponse("ok")
+
+        middleware = RequestMetricsMiddleware(view)
+        request = RequestFactory().get("/anything/")
+        request.user = self.admin
+        response = async_to_sync(middleware)(request)
+        self.assertIn('desc="2 queries"', response["Server-Timing"])
+
+    def test_server_timing_is_for_staff_or_debug(self):
+        intern = User.objects.create(email="intern@example.com", role="INTERN")
+        self.client.force_authenticate(intern)
+        self.assertNotIn("Server-Timing", self.client.get("/api/tasks/"))
+        with self.settings(DEBUG=True):
+            self.assertIn("Server-Timing", self.client.get("/api/tasks/"))
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_status_reports_health(self):
+        response = self.client.get("/", HTTP_AUTHORIZATION="Bearer secret")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "ok")
+        self.assertTrue(response.json()["checks"]["database"]["ok"])
+        self.assertNotIn("pool", response.json()["checks"]["database"])
+
+    @override_settings(METRICS_TOKEN="secret", HEALTH_CHECK_CACHE_SECONDS=60)
+    def test_anonymous_status_hides_details(self):
+        error = DatabaseError("connection to server at db.internal, user app failed")
+        with mock.patch.object(metrics, "_last_health", {"at": None, "healthy": True}), \
+                mock.patch.object(connection, "cursor", side_effect=error), \
+                self.assertLogs("backend.metrics", level="ERROR"):
+            response = self.client.get("/")
+            self.assertEqual((response.status_code, response.json()), (503, {"status": "degraded"}))
+            # The probe result is reused instead of running again.
+            with mock.patch.object(metrics, "check_health") as check_health:
+                self.assertEqual(self.client.get("/").status_code, 503)
+            check_health.assert_not_called()
+            detailed = self.client.get("/", HTTP_AUTHORIZATION="Bearer secret").json()
+        self.assertIn("db.internal", detailed["checks"]["database"]["error"])
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_pool_stats_are_reported(self):
+        self.assertEqual(self.client.get("/").json(), {"status": "ok"})
+        pool = mock.Mock()
+        pool.get_stats.return_value = {"pool_min": 2, "pool_max": 10, "pool_size": 4, "pool_available": 3}
+        with mock.patch.object(connection, "pool", pool, create=True):
+            status = self.client.get("/", HTTP_AUTHORIZATION="Bearer secret").json()
+            metrics = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret").content.decode()
+        self.assertEqual(status["checks"]["database"]["pool"], {
+            "pool_min": 2, "pool_max": 10, "pool_size": 4, "pool_available": 3, "requests_waiting": 0,
+        })
+        self.assertIn('backend_db_pool_connections{stat="pool_available"} 3', metrics)
+
+
+def iter_routes(patterns=None, prefix=""):
+    """Yield ``(route, callback)`` for every URL pattern, outside the admin."""
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.app_name == "admin":
+                continue
+            yield from iter_routes(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            yield "/" + prefix + str(pattern.pattern), pattern.callback
+
+
+class QueryScalingTests(TestCase):
+    """N+1 guard: GET every URL with N and 10N interns and tasks.
+
+    A request whose query count grows with the data has a per-row query;
+    views that declare a ``query_budget`` must also stay within it.
+    """
+
+    N = 3
+
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.interns = []
+        self.client = APIClient()
+
+    def _seed(self, count):
+        departments = ["Engineering", "Design", "Marketing"]
+        for i in range(len(self.interns), count):
+            intern = InternProfile.objects.create(
+                user=User.objects.create(email=f"intern{i}@example.com", first_name=f"I{i}", role="INTERN"),
+                department=departments[i % len(departments)],
+            )
+            for j in range(2):
+                Task.objects.create(
+                    title=f"t{i}.{j}", assigned_to=intern, due_date=date.today() + timedelta(days=j - 1),
+                    progress=100 if j else 0,
+                )
+            self.interns.append(intern)
+        with override_settings(TASK_CHANGES_SETTLE_SECONDS=0):
+            update_rollups(full=True)
+
+    def _path(self, route, task_id):
+        values = {"pk": task_id if route.endswith("/tasks/<int:pk>/") else self.interns[0].pk, "task_id": task_id}
+        return re.sub(r"<(?:\w+:)?(\w+)>", lambda m: str(values[m.group(1)]), route)
+
+    def _measure(self, user):
+        self.client.force_authenticate(user)
+        task_id = self.interns[0].tasks.order_by("id").first().pk
+        counts = {}
+        for route, callback in iter_routes():
+            path = self._path(route, task_id)
+            cache.clear()
+            user_cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(path)
+                if response.streaming and not response.get("Content-Type", "").startswith("text/event-stream"):
+                    b"".join(response.streaming_content)
+            counts[route] = (len(queries), declared_query_budget(callback))
+        return counts
+
+    def test_query_counts_do_not_grow_with_data(self):
+        self._seed(self.N)
+        small = {"admin": self._measure(self.admin), "intern": self._measure(self.interns[0].user)}
+        self._seed(self.N * 10)
+        large = {"admin": self._measure(self.admin), "intern": self._measure(self.interns[0].user)}
+
+        for role, counts in large.items():
+            for route, (count, budget) in counts.items():
+                with self.subTest(role=role, route=route):
+                    self.assertLessEqual(count, small[role][route][0], f"{route} queries grow with the data")
+                    if budget is not None:
+                        self.assertLessEqual(count, budget, f"{route} is over its query budget")
+
+    @override_settings(METRICS_SLOW_REQUEST_QUERIES=1000)
+    def test_reads_over_budget_are_logged(self):
+        self._seed(self.N)
+        self.client.force_authenticate(self.admin)
+        with mock.patch.object(TaskListCreateView, "query_budget", 1):
+            with self.assertLogs("backend.metrics", level="WARNING") as logs:
+                self.client.get("/api/tasks/")
+        self.assertIn("over its budget of 1", logs.output[0])
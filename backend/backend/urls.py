@@ -17,12 +17,14 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from .views import backend_status
+from .views import backend_status, metrics
 
 urlpatterns = [
     path('', backend_status, name='backend_status'),
+    path('metrics', metrics, name='metrics'),
     path('admin/', admin.site.urls),
     path('api/users/', include('users.urls')),
     path('api/interns/', include('interns.urls')),
     path('api/tasks/', include('tasks.urls')),
+    path('api/reports/', include('reports.urls')),
 ]
@@ -1,18 +1,83 @@
-from django.http import JsonResponse
+import hmac
+import time
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 
+from .metrics import PROCESS_STARTED, cached_health, check_health, registry
+
+
+def _metrics_denied(request):
+    """Return the response refusing ``request`` the metrics, or None to allow it."""
+    token = settings.METRICS_TOKEN
+    if not token:
+        # Without a token metrics are only open in local development.
+        return None if settings.DEBUG else HttpResponse(status=403)
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+    return None
+
+
 @csrf_exempt
 def backend_status(request):
     """
-    Simple status endpoint to confirm Django backend is running
+    Health of the API process and its dependencies; 503 when one is down
+
+    Anyone gets the status; check details (errors, pool stats) need the
+    ``/metrics`` token.
+    """
+    if _metrics_denied(request) is not None:
+        healthy = cached_health()
+        return JsonResponse({"status": "ok" if healthy else "degraded"}, status=200 if healthy else 503)
+    healthy, checks = check_health()
+    return JsonResponse(
+        {
+            "status": "ok" if healthy else "degraded",
+            "uptime_seconds": round(time.time() - PROCESS_STARTED),
+            "checks": checks,
+        },
+        status=200 if healthy else 503,
+    )
+
+
+@csrf_exempt
+def metrics(request):
+    """
+    Prometheus scrape endpoint: per-route request totals plus health gauges
     """
-    return JsonResponse({
-        'status': 'Backend is running successfully',
-        'message': 'Django API server is operational',
-        'available_endpoints': [
-            '/api/auth/login/',
-            '/api/auth/register/',
-            '/api/auth/refresh/',
-            '/admin/'
+    denied = _metrics_denied(request)
+    if denied is not None:
+        return denied
+
+    healthy, checks = check_health()
+    lines = [
+        "# HELP backend_up Whether the database and cache health checks pass.",
+        "# TYPE backend_up gauge",
+        f"backend_up {int(healthy)}",
+        "# HELP backend_health_check_ok Result of each health check.",
+        "# TYPE backend_health_check_ok gauge",
+    ]
+    lines += [f'backend_health_check_ok{{check="{name}"}} {int(check["ok"])}' for name, check in checks.items()]
+    lines += [
+        "# HELP backend_health_check_latency_seconds Latency of each passing health check.",
+        "# TYPE backend_health_check_latency_seconds gauge",
+    ]
+    lines += [
+        f'backend_health_check_latency_seconds{{check="{name}"}} {check["latency_ms"] / 1000:.6f}'
+        for name, check in checks.items() if check["ok"]
+    ]
+    pool = checks.get("database", {}).get("pool")
+    if pool is not None:
+        lines += [
+            "# HELP backend_db_pool_connections Database pool counters (pool_size, pool_available, ...).",
+            "# TYPE backend_db_pool_connections gauge",
         ]
-    })
+        lines += [f'backend_db_pool_connections{{stat="{name}"}} {value}' for name, value in pool.items()]
+    lines += [
+        "# HELP process_start_time_seconds Start time of the process since the epoch.",
+        "# TYPE process_start_time_seconds gauge",
+        f"process_start_time_seconds {PROCESS_STARTED:.3f}",
+    ]
+    lines += registry.render()
+    return HttpResponse("\n".join(lines) + "\n", content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,21 @@
+"""Row-level visibility shared by the API views.
+
+Models whose rows are not visible to everyone expose a ``visible_to(user)``
+queryset method (``Task.objects``, ``InternProfile.objects``) that filters
+in SQL. Generic views get it through ``VisibleToUserMixin`` and other views
+call it directly, then look objects up inside the filtered queryset: a row
+the user may not see is simply not found (404), so no view loads an object
+to compare owners afterwards.
+"""
+
+
+class VisibleToUserMixin:
+    """Restrict a generic view's ``get_queryset()`` to ``visible_to(request.user)``.
+
+    Applied in ``get_queryset`` rather than as a filter backend, so views
+    that replace ``filter_backends`` or call ``get_queryset()`` directly
+    still never see other users' rows.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().visible_to(self.request.user)
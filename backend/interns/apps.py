@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class InternsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interns'
+
+    def ready(self):
+        from . import signals  # noqa: F401
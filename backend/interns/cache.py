@@ -0,0 +1,153 @@
+"""Response cache for the intern dashboard endpoints.
+
+Entries live in the Django cache named by ``settings.DASHBOARD_CACHE_ALIAS``
+(local memory by default; point it at a Redis cache when running several
+workers so invalidation is shared). Keys embed a *generation* token: admins
+share the global generation, an intern's own view uses that intern's
+generation. Task and profile writes replace the affected tokens after commit,
+so stale entries are never read again and simply expire.
+
+The generation also yields the ``ETag``/``Last-Modified`` validators, which
+lets a conditional request be answered with 304 from one cache lookup,
+without touching the database or the serializers.
+"""
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+
+GLOBAL_SCOPE = "all"
+
+
+def _cache():
+    return caches[settings.DASHBOARD_CACHE_ALIAS]
+
+
+def _generation_key(scope):
+    return f"dashboard:generation:{scope}"
+
+
+def _new_generation(previous=None):
+    # A random token (not a counter) so an evicted generation can never
+    # collide with entries cached under an earlier one. Last-Modified has
+    # one-second resolution, so it must move forward on every bump.
+    modified = int(timezone.now().timestamp())
+    if previous:
+        modified = max(modified, previous["modified"] + 1)
+    return {"token": uuid.uuid4().hex, "modified": modified}
+
+
+def get_generation(scope):
+    return _cache().get_or_set(_generation_key(scope), _new_generation, timeout=None)
+
+
+def invalidate_dashboard(intern_ids=()):
+    """Invalidate admin entries and those of ``intern_ids`` once the transaction commits."""
+    scopes = [GLOBAL_SCOPE] + [f"intern:{intern_id}" for intern_id in intern_ids if intern_id is not None]
+
+    def bump():
+        keys = [_generation_key(scope) for scope in scopes]
+        current = _cache().get_many(keys)
+        _cache().set_many({key: _new_generation(current.get(key)) for key in keys}, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def _scope(user):
+    return GLOBAL_SCOPE if getattr(user, "role", None) == "ADMIN" else f"intern:{user.pk}"
+
+
+def _entry(request, name, scope, generation):
+    # The absolute URL, not just the path: paginated responses embed
+    # absolute next/previous links built from the request's scheme and host.
+    query = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    key = f"dashboard:{name}:{scope}:{generation['token']}:{query}"
+    validators = {
+        "ETag": f'"{hashlib.md5(key.encode()).hexdigest()}"',
+        "Last-Modified": http_date(generation["modified"]),
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization",
+    }
+    return key, validators
+
+
+def _not_modified(request, etag, modified):
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+    if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    return if_modified_since is not None and modified <= if_modified_since
+
+
+class DashboardCacheMixin:
+    """Cache successful GET responses per role and answer conditional GETs with 304.
+
+    Admins share one entry per URL; everyone else gets an entry of their own
+    keyed on their user id. Views name their entries with
+    ``dashboard_cache_name`` and may refuse a request in
+    ``check_dashboard_access``, which runs before any cache lookup or 304.
+    """
+
+    dashboard_cache_name = None
+
+    def check_dashboard_access(self, request):
+        """Return an error ``Response`` to refuse ``request``, or None."""
+        return None
+
+    def get(self, request, *args, **kwargs):
+        return self.cached_response(request, super().get, *args, **kwargs)
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        """Answer from the cache, falling back to ``handler`` on a miss.
+
+        Views that define their own ``get`` call this explicitly.
+        """
+        if self.dashboard_cache_name is None:
+            raise ImproperlyConfigured(f"{type(self).__name__} must set dashboard_cache_name.")
+        denied = self.check_dashboard_access(request)
+        if denied is not None:
+            return denied
+        scope = _scope(request.user)
+        generation = get_generation(scope)
+        key, validators = _entry(request, self.dashboard_cache_name, scope, generation)
+
+        if _not_modified(request, validators["ETag"], generation["modified"]):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=validators)
+
+        data = _cache().get(key)
+        if data is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            _cache().set(key, data, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+        return Response(data, headers=validators)
+
+
+async def adashboard_data(request, name, build):
+    """Async ``DashboardCacheMixin.get`` for the views in ``backend.async_api``.
+
+    Returns ``(data, validators)``; ``data`` is None when the client's copy is
+    current (answer 304). ``build`` is an async callable producing the data
+    on a miss. Entries are shared with the sync views.
+    """
+    scope = _scope(request.user)
+    generation = await _cache().aget_or_set(_generation_key(scope), _new_generation, timeout=None)
+    key, validators = _entry(request, name, scope, generation)
+
+    if _not_modified(request, validators["ETag"], generation["modified"]):
+        return None, validators
+
+    data = await _cache().aget(key)
+    if data is None:
+        data = await build()
+        await _cache().aset(key, data, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+    return data, validators
@@ -0,0 +1,93 @@
+"""Denormalized per-intern task counters.
+
+Counters live on ``InternProfile`` so dashboard reads never touch the tasks
+table. ``Task.save()`` and task deletes refresh them through the signal
+handlers in ``tasks.signals``; code that bypasses model signals
+(``bulk_create``, ``bulk_update``, ``QuerySet.update``) must call
+``refresh_task_counters`` itself with the affected intern ids.
+"""
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from .cache import invalidate_dashboard
+from .models import InternProfile
+
+
+COUNTER_FIELDS = [
+    "task_count",
+    "completed_task_count",
+    "in_progress_task_count",
+    "started_task_count",
+    "not_started_task_count",
+    "overdue_task_count",
+    "last_task_activity_at",
+    "progress",
+]
+
+
+def task_counter_aggregates(today=None):
+    """Aggregates over ``Task`` rows producing each counter field."""
+    today = today or timezone.localdate()
+    return {
+        "task_count": Count("id"),
+        "completed_task_count": Count("id", filter=Q(status="COMPLETED")),
+        "in_progress_task_count": Count("id", filter=Q(status="IN_PROGRESS", progress__gt=0)),
+        "started_task_count": Count("id", filter=Q(is_started=True)),
+        "not_started_task_count": Count("id", filter=Q(progress=0)),
+        "overdue_task_count": Count("id", filter=Q(due_date__lt=today) & ~Q(status="COMPLETED")),
+        "last_task_activity_at": Max("updated_at"),
+    }
+
+
+def empty_counters():
+    return {field: 0 for field in COUNTER_FIELDS} | {"last_task_activity_at": None}
+
+
+def compute_task_counters(intern_ids, today=None):
+    """Return ``{intern_id: counters}`` for ``intern_ids`` using one grouped query."""
+    from tasks.models import Task
+
+    counters = {intern_id: empty_counters() for intern_id in intern_ids}
+    rows = (
+        Task.objects.filter(assigned_to_id__in=intern_ids)
+        .order_by()
+        .values("assigned_to_id")
+        .annotate(**task_counter_aggregates(today))
+    )
+    for row in rows:
+        intern_id = row.pop("assigned_to_id")
+        total, completed = row["task_count"], row["completed_task_count"]
+        row["progress"] = round((completed / total) * 100) if total else 0
+        counters[intern_id] = row
+    return counters
+
+
+def apply_counters(profile, counters) -> bool:
+    """Copy ``counters`` onto ``profile``; return True if anything changed."""
+    changed = False
+    for field in COUNTER_FIELDS:
+        if getattr(profile, field) != counters[field]:
+            setattr(profile, field, counters[field])
+            changed = True
+    return changed
+
+
+def refresh_task_counters(intern_ids):
+    """Recompute the counters of the given interns inside the current transaction.
+
+    Profile rows are locked first so concurrent task writes for the same intern
+    serialize and the aggregate always sees the other writer's committed rows.
+    """
+    intern_ids = sorted({intern_id for intern_id in intern_ids if intern_id is not None})
+    if not intern_ids:
+        return
+    with transaction.atomic():
+        profiles = list(
+            InternProfile.objects.select_for_update().filter(pk__in=intern_ids).order_by("pk")
+        )
+        counters = compute_task_counters([profile.pk for profile in profiles])
+        changed = [profile for profile in profiles if apply_counters(profile, counters[profile.pk])]
+        if changed:
+            InternProfile.objects.bulk_update(changed, COUNTER_FIELDS)
+            invalidate_dashboard([profile.pk for profile in changed])
@@ -0,0 +1,226 @@
+"""Bulk intern import from CSV or XLSX.
+
+Rows are parsed one at a time, validated with the same rules as
+``InternListCreateView.post``, checked for existing emails with one IN query
+per chunk (case-insensitively), and inserted with ``bulk_create`` inside a
+single transaction. The import is all-or-nothing: if any row is invalid
+nothing is written and every row error is reported. Emails registered by a
+concurrent request between the check and the insert are reported the same
+way, with ``conflict`` set.
+
+The ``password`` column is optional. Rows without one get an unusable
+password (the intern sets one later), which keeps a 10k-row import at a few
+seconds; rows with one are hashed in parallel on ``LOGIN_HASH_WORKERS``
+threads, and hashing then dominates the import time.
+"""
+import codecs
+import csv
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from .cache import invalidate_dashboard
+from .models import InternProfile
+
+
+User = get_user_model()
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_COLUMNS = ["name", "email", "department", "password"]
+
+
+class ImportFormatError(Exception):
+    """The uploaded file cannot be parsed at all."""
+
+
+def _text_lines(fileobj):
+    # The csv module accepts NUL bytes, but no database text column does.
+    for line in codecs.iterdecode(fileobj, "utf-8-sig"):
+        if "\x00" in line:
+            raise ImportFormatError("The file is not a valid CSV file.")
+        yield line
+
+
+def read_csv_rows(fileobj):
+    """Yield one dict per CSV row from a binary file object, decoding lazily."""
+    reader = csv.DictReader(_text_lines(fileobj))
+    try:
+        if reader.fieldnames is None:
+            raise ImportFormatError("The file is empty.")
+        missing = {"name", "email", "department"} - {name.strip().lower() for name in reader.fieldnames}
+        if missing:
+            raise ImportFormatError(f"Missing column(s): {', '.join(sorted(missing))}.")
+        for row in reader:
+            yield {(key or "").strip().lower(): value for key, value in row.items()}
+    except csv.Error as exc:
+        raise ImportFormatError(f"The file is not a valid CSV file (line {reader.line_num}: {exc}).") from exc
+
+
+def read_xlsx_rows(fileobj):
+    """Yield one dict per row of the first worksheet (requires openpyxl)."""
+    try:
+        from openpyxl import load_workbook
+        from openpyxl.utils.exceptions import InvalidFileException
+    except ImportError as exc:
+        raise ImportFormatError("XLSX import requires the openpyxl package.") from exc
+
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError) as exc:
+        # KeyError: a zip archive without the workbook parts.
+        raise ImportFormatError("The file is not a valid XLSX workbook.") from exc
+    if not workbook.worksheets:
+        raise ImportFormatError("The file is empty.")
+    sheet = workbook.worksheets[0]
+    rows = sheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        raise ImportFormatError("The file is empty.")
+    columns = [str(cell or "").strip().lower() for cell in header]
+    missing = {"name", "email", "department"} - set(columns)
+    if missing:
+        raise ImportFormatError(f"Missing column(s): {', '.join(sorted(missing))}.")
+    for values in rows:
+        yield {column: "" if value is None else str(value) for column, value in zip(columns, values)}
+
+
+def read_rows(fileobj, filename):
+    if filename.lower().endswith(".xlsx"):
+        return read_xlsx_rows(fileobj)
+    return read_csv_rows(fileobj)
+
+
+def _validate(row):
+    name = (row.get("name") or "").strip()
+    email = (row.get("email") or "").strip().lower()
+    department = (row.get("department") or "").strip()
+    password = row.get("password") or ""
+
+    errors = {}
+    if not name:
+        errors["name"] = ["This field is required."]
+    if not email:
+        errors["email"] = ["This field is required."]
+    else:
+        try:
+            validate_email(email)
+        except ValidationError:
+            errors["email"] = ["Enter a valid email address."]
+    if not department:
+        errors["department"] = ["This field is required."]
+    if password and len(password) < 8:
+        errors["password"] = ["Ensure this field has at least 8 characters."]
+
+    parts = name.split(" ", 1)
+    cleaned = {
+        "email": email,
+        "first_name": parts[0] if parts else "",
+        "last_name": parts[1] if len(parts) > 1 else "",
+        "department": department,
+        "password": password,
+    }
+    return cleaned, errors
+
+
+def _existing_emails(emails):
+    existing = set()
+    emails = list(emails)
+    for start in range(0, len(emails), IMPORT_CHUNK_SIZE):
+        chunk = emails[start:start + IMPORT_CHUNK_SIZE]
+        existing.update(
+            User.objects.annotate(email_lower=Lower("email"))
+            .filter(email_lower__in=chunk)
+            .values_list("email_lower", flat=True)
+        )
+    return existing
+
+
+def _existing_email_errors(valid):
+    existing = _existing_emails(cleaned["email"] for _, cleaned in valid)
+    return [
+        {"row": line, "errors": {"email": ["A user with this email already exists."]}}
+        for line, cleaned in valid
+        if cleaned["email"] in existing
+    ]
+
+
+def _hash_passwords(rows):
+    passwords = [row["password"] for row in rows if row["password"]]
+    hashed = iter([])
+    if passwords:
+        with ThreadPoolExecutor(max_workers=settings.LOGIN_HASH_WORKERS) as pool:
+            hashed = iter(list(pool.map(make_password, passwords)))
+    for row in rows:
+        # make_password(None) produces an unusable password.
+        row["password"] = next(hashed) if row["password"] else make_password(None)
+
+
+def import_interns(rows, dry_run=False):
+    """Validate and create interns from ``rows``; return a report dict.
+
+    ``rows`` is any iterable of dicts keyed by ``IMPORT_COLUMNS``; data rows are
+    numbered from 2 in the report so they match spreadsheet line numbers.
+    """
+    valid, errors, seen = [], [], {}
+    for line, row in enumerate(rows, start=2):
+        cleaned, row_errors = _validate(row)
+        email = cleaned["email"]
+        if email and email in seen:
+            row_errors.setdefault("email", []).append(f"Duplicate of row {seen[email]}.")
+        if email:
+            seen.setdefault(email, line)
+        if row_errors:
+            errors.append({"row": line, "errors": row_errors})
+        else:
+            valid.append((line, cleaned))
+
+    total = len(valid) + len(errors)
+    errors += _existing_email_errors(valid)
+    errors.sort(key=lambda error: error["row"])
+
+    report = {"rows": total, "created": 0, "errors": errors, "conflict": False}
+    if errors or dry_run:
+        return report
+
+    cleaned_rows = [cleaned for _, cleaned in valid]
+    _hash_passwords(cleaned_rows)
+    try:
+        _insert(cleaned_rows)
+    except IntegrityError:
+        # Another request created some of these users after the check above.
+        report["conflict"] = True
+        report["errors"] = _existing_email_errors(valid) or [
+            {"row": None, "errors": {"email": ["A user with one of these emails was just created."]}}
+        ]
+        return report
+    report["created"] = len(cleaned_rows)
+    return report
+
+
+def _insert(cleaned_rows):
+    with transaction.atomic():
+        for start in range(0, len(cleaned_rows), IMPORT_CHUNK_SIZE):
+            chunk = cleaned_rows[start:start + IMPORT_CHUNK_SIZE]
+            users = User.objects.bulk_create([
+                User(
+                    email=row["email"],
+                    password=row["password"],
+                    first_name=row["first_name"],
+                    last_name=row["last_name"],
+                    role="INTERN",
+                )
+                for row in chunk
+            ])
+            InternProfile.objects.bulk_create([
+                InternProfile(user_id=user.pk, department=row["department"], status="Active", progress=0)
+                for user, row in zip(users, chunk)
+            ])
+        # bulk_create skips post_save, so invalidate the dashboard explicitly.
+        invalidate_dashboard()
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from interns.importer import ImportFormatError, import_interns, read_rows
+
+
+class Command(BaseCommand):
+    help = "Import interns from a CSV or XLSX file (columns: name, email, department, password)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row and report errors without creating anything.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        try:
+            with open(path, "rb") as fileobj:
+                report = import_interns(read_rows(fileobj, path), dry_run=options["dry_run"])
+        except OSError as exc:
+            raise CommandError(str(exc)) from exc
+        except (ImportFormatError, UnicodeDecodeError) as exc:
+            raise CommandError(f"{path}: {exc}") from exc
+
+        for error in report["errors"]:
+            for field, messages in error["errors"].items():
+                self.stderr.write(f"Row {error['row']}: {field}: {' '.join(messages)}")
+        if report["errors"]:
+            raise CommandError(f"{len(report['errors'])} of {report['rows']} rows invalid; nothing imported.")
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"{report['rows']} rows valid."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Imported {report['created']} interns."))
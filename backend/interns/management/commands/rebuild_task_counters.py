@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from interns.cache import invalidate_dashboard
+from interns.counters import COUNTER_FIELDS, apply_counters, compute_task_counters
+from interns.models import InternProfile
+
+
+class Command(BaseCommand):
+    help = "Rebuild (or verify) the denormalized task counters on intern profiles."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report profiles whose counters are out of date; do not write.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        verify = options["verify"]
+        checked = stale = 0
+        last_pk = None
+
+        while True:
+            # Keyset batches keep each transaction and lock set small.
+            with transaction.atomic():
+                qs = InternProfile.objects.order_by("pk")
+                if not verify:
+                    qs = qs.select_for_update()
+                if last_pk is not None:
+                    qs = qs.filter(pk__gt=last_pk)
+                profiles = list(qs[:batch_size])
+                if not profiles:
+                    break
+                last_pk = profiles[-1].pk
+
+                counters = compute_task_counters([profile.pk for profile in profiles])
+                changed = [p for p in profiles if apply_counters(p, counters[p.pk])]
+                if changed and not verify:
+                    InternProfile.objects.bulk_update(changed, COUNTER_FIELDS)
+                    invalidate_dashboard([profile.pk for profile in changed])
+
+            checked += len(profiles)
+            stale += len(changed)
+            if verify:
+                for profile in changed:
+                    self.stdout.write(f"Stale counters for intern {profile.pk}")
+
+        if verify and stale:
+            raise CommandError(f"Checked {checked} interns, {stale} out of date.")
+        action = "out of date" if verify else "rebuilt"
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} interns, {stale} {action}."))
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interns', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='internprofile',
+            name='completed_task_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='internprofile',
+            name='in_progress_task_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='internprofile',
+            name='last_task_activity_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='internprofile',
+            name='not_started_task_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='internprofile',
+            name='overdue_task_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='internprofile',
+            name='started_task_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='internprofile',
+            name='task_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -2,6 +2,16 @@ from django.db import models
 from django.conf import settings
 
 
+class InternProfileQuerySet(models.QuerySet):
+    def visible_to(self, user):
+        """Profiles ``user`` may see: all for admins, otherwise only their own."""
+        if getattr(user, "role", None) == "ADMIN":
+            return self.all()
+        if user is None or not user.is_authenticated:
+            return self.none()
+        return self.filter(pk=user.pk)
+
+
 class InternProfile(models.Model):
     """Profile data specific to an intern.
 
@@ -17,6 +27,19 @@ class InternProfile(models.Model):
     status = models.CharField(max_length=20, default="Active")
     progress = models.PositiveIntegerField(default=0)
 
+    # Denormalized task counters, kept in sync by interns.counters whenever a
+    # task assigned to this intern changes. The overdue count is as of the
+    # last task write or counter rebuild.
+    task_count = models.PositiveIntegerField(default=0)
+    completed_task_count = models.PositiveIntegerField(default=0)
+    in_progress_task_count = models.PositiveIntegerField(default=0)
+    started_task_count = models.PositiveIntegerField(default=0)
+    not_started_task_count = models.PositiveIntegerField(default=0)
+    overdue_task_count = models.PositiveIntegerField(default=0)
+    last_task_activity_at = models.DateTimeField(null=True, blank=True)
+
+    objects = InternProfileQuerySet.as_manager()
+
     def __str__(self) -> str:
         return f"InternProfile(user_id={self.user_id}, department={self.department})"
 
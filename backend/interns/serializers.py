@@ -1,7 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import InternProfile
-from tasks.models import Task
 
 # Basic InternSerializer for InternProfile
 # In your interns/serializers.py
@@ -23,9 +22,14 @@ class InternSerializer(serializers.ModelSerializer):
 User = get_user_model()
 
 class InternWithProgressSerializer(serializers.ModelSerializer):
+    """Intern row for the admin dashboard.
+
+    Task statistics come from the denormalized counters on the profile (see
+    ``interns.counters``), so serializing never queries the tasks table.
+    """
+    id = serializers.IntegerField(source='user.id', read_only=True)
     name = serializers.SerializerMethodField()
     email = serializers.SerializerMethodField()
-    progress = serializers.SerializerMethodField()
     task_stats = serializers.SerializerMethodField()
 
     class Meta:
@@ -38,19 +42,10 @@ class InternWithProgressSerializer(serializers.ModelSerializer):
     def get_email(self, obj):
         return obj.user.email
 
-    def get_progress(self, obj):
-        tasks = Task.objects.filter(assigned_to=obj)
-        if not tasks.exists():
-            return 0
-        
-        completed_tasks = tasks.filter(status="COMPLETED")
-        return round((completed_tasks.count() / tasks.count()) * 100)
-
     def get_task_stats(self, obj):
-        tasks = Task.objects.filter(assigned_to=obj)
         return {
-            'total': tasks.count(),
-            'completed': tasks.filter(status="COMPLETED").count(),
-            'in_progress': tasks.filter(status="IN_PROGRESS", progress__gt=0).count(),
-            'not_started': tasks.filter(progress=0).count()
-        }
\ No newline at end of file
+            'total': obj.task_count,
+            'completed': obj.completed_task_count,
+            'in_progress': obj.in_progress_task_count,
+            'not_started': obj.not_started_task_count,
+        }
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_dashboard
+from .models import InternProfile
+
+
+@receiver([post_save, post_delete], sender=InternProfile)
+def invalidate_dashboard_on_profile_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_dashboard([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_dashboard_on_user_change(sender, instance, raw=False, **kwargs):
+    # Names and emails are part of every dashboard row.
+    if not raw and getattr(instance, "role", None) == "INTERN":
+        invalidate_dashboard([instance.pk])
@@ -1,3 +1,407 @@
-from django.test import TestCase
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tasks.models import Task
+from . import importer
+from .models import InternProfile
+from .views import intern_list_async
+
+
+User = get_user_model()
+
+
+def make_intern(index, department="Engineering"):
+    # Plain create() skips password hashing, which dominates seeding time.
+    user = User.objects.create(
+        email=f"intern{index}@example.com",
+        first_name="Intern",
+        last_name=str(index),
+        role="INTERN",
+    )
+    return InternProfile.objects.create(user=user, department=department)
+
+
+class InternWithProgressListViewTests(TestCase):
+    url = "/api/interns/with-progress/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _seed(self, start, count):
+        # Dashboard cache invalidation runs on commit.
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(start, start + count):
+                intern = make_intern(i)
+                Task.objects.create(title="a", assigned_to=intern, due_date=date.today(), progress=100)
+                Task.objects.create(title="b", assigned_to=intern, due_date=date.today(), progress=50)
+                Task.objects.create(title="c", assigned_to=intern, due_date=date.today())
+
+    def _query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_task_stats_come_from_counters(self):
+        self._seed(0, 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            make_intern(99)
+        _, response = self._query_count()
+        rows = {row["email"]: row for row in response.json()["results"]}
+
+        busy = rows["intern0@example.com"]
+        self.assertEqual(busy["progress"], 33)
+        self.assertEqual(
+            busy["task_stats"],
+            {"total": 3, "completed": 1, "in_progress": 1, "not_started": 1},
+        )
+        idle = rows["intern99@example.com"]
+        self.assertEqual(idle["progress"], 0)
+        self.assertEqual(idle["task_stats"]["total"], 0)
+
+    def test_query_count_does_not_grow_with_interns(self):
+        self._seed(0, 2)
+        small, _ = self._query_count()
+        self._seed(2, 20)
+        large, response = self._query_count()
+        self.assertEqual(len(response.json()["results"]), 22)
+        self.assertEqual(small, large)
+
+
+class InternListCreateViewTests(TestCase):
+    url = "/api/interns/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_list_is_cursor_paginated_by_user_id(self):
+        interns = [make_intern(i) for i in range(5)]
+        seen = []
+        response = self.client.get(self.url, {"page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertLessEqual(len(body["results"]), 2)
+            seen.extend(row["id"] for row in body["results"])
+            if not body["next"]:
+                break
+            response = self.client.get(body["next"])
+        self.assertEqual(seen, [intern.user_id for intern in interns])
+
+    def test_interns_retrieve_only_their_own_profile(self):
+        own, other = make_intern(1), make_intern(2)
+        self.client.force_authenticate(own.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(f"{self.url}{own.pk}/").status_code, 200)
+        self.assertEqual(self.client.get(f"{self.url}{other.pk}/").status_code, 404)
+        self.assertEqual(list(InternProfile.objects.visible_to(own.user)), [own])
+
+        self.client.force_authenticate(self.admin)
+        self.assertEqual(self.client.get(f"{self.url}{other.pk}/").status_code, 200)
+
+
+class InternAsyncListViewTests(TestCase):
+    url = "/api/interns/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.interns = [make_intern(i) for i in range(3)]
+
+    def _get(self, user, **headers):
+        request = RequestFactory().get(
+            self.url, {"page_size": 2}, HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}", **headers
+        )
+        return async_to_sync(intern_list_async)(request)
+
+    def test_matches_sync_view_and_shares_its_cache(self):
+        response = self._get(self.admin)
+        self.assertEqual(response.status_code, 200)
+
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        sync = client.get(self.url, {"page_size": 2})
+        self.assertEqual(response.content, sync.content)
+        self.assertEqual(response["ETag"], sync["ETag"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._get(self.admin, HTTP_IF_NONE_MATCH=sync["ETag"]).status_code, 304)
+
+    def test_interns_are_forbidden(self):
+        self.assertEqual(self._get(self.interns[0].user).status_code, 403)
+
+def import_file(*lines, name="interns.csv"):
+    return SimpleUploadedFile(name, "\n".join(lines).encode(), content_type="text/csv")
+
+
+@override_settings(PASSWORD_HASHER_PARAMS={**settings.PASSWORD_HASHER_PARAMS, "pbkdf2_iterations": 1000})
+class InternImportTests(TestCase):
+    url = "/api/interns/import/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_import_creates_users_and_profiles_in_constant_queries(self):
+        rows = [f"Intern {i},Intern{i}@Example.com,Engineering," for i in range(50)]
+        upload = import_file("name,email,department,password", *rows)
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json(), {"rows": 50, "created": 50, "errors": [], "conflict": False})
+
+        profile = InternProfile.objects.select_related("user").get(user__email="intern7@example.com")
+        self.assertEqual(profile.department, "Engineering")
+        self.assertEqual((profile.user.first_name, profile.user.last_name), ("Intern", "7"))
+        self.assertEqual(profile.user.role, "INTERN")
+        self.assertFalse(profile.user.has_usable_password())
+
+    def test_password_column_is_hashed(self):
+        upload = import_file("name,email,department,password", "Ada Lovelace,ada@example.com,Research,longenough")
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(User.objects.get(email="ada@example.com").check_password("longenough"))
+
+    def test_invalid_rows_are_reported_and_nothing_is_created(self):
+        # Existing emails match case-insensitively.
+        User.objects.create(email="Taken@Example.com", role="INTERN")
+        upload = import_file(
+            "name,email,department",
+            "Ok Row,ok@example.com,Engineering",
+            ",missing-name@example.com,Engineering",
+            "Bad Email,not-an-email,Engineering",
+            "Taken,taken@example.com,Engineering",
+            "Dupe,OK@example.com,Engineering",
+        )
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 400)
+        body = response.json()
+        self.assertEqual(body["created"], 0)
+        self.assertEqual([error["row"] for error in body["errors"]], [3, 4, 5, 6])
+        self.assertIn("name", body["errors"][0]["errors"])
+        self.assertIn("already exists", body["errors"][2]["errors"]["email"][0])
+        self.assertIn("Duplicate of row 2", body["errors"][3]["errors"]["email"][0])
+        self.assertFalse(User.objects.filter(email="ok@example.com").exists())
+
+    def test_concurrently_created_email_is_a_conflict(self):
+        upload = import_file("name,email,department", "Ok Row,ok@example.com,Engineering", "Late,late@example.com,Design")
+        existing_emails, raced = importer._existing_emails, []
+
+        def check_then_race(emails):
+            if raced:
+                return existing_emails(emails)
+            # The check passes, then another request registers the email.
+            raced.append(User.objects.create(email="late@example.com", role="INTERN"))
+            return set()
+
+        with mock.patch.object(importer, "_existing_emails", check_then_race):
+            response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 409, response.content)
+        self.assertEqual(response.json()["errors"], [
+            {"row": 3, "errors": {"email": ["A user with this email already exists."]}},
+        ])
+        self.assertFalse(User.objects.filter(email="ok@example.com").exists())
+
+    def test_dry_run_and_missing_columns(self):
+        upload = import_file("name,email,department", "Ok Row,ok@example.com,Engineering")
+        response = self.client.post(f"{self.url}?dry_run=1", {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["rows"], 1)
+        self.assertFalse(User.objects.filter(email="ok@example.com").exists())
+
+        response = self.client.post(self.url, {"file": import_file("name,email")}, format="multipart")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("department", response.json()["file"][0])
+
+    def test_corrupt_files_are_rejected(self):
+        uploads = {
+            "nul byte": import_file("name,email,department", "Ok\x00Row,ok@example.com,Engineering"),
+            "oversized field": import_file("name,email,department", f'"{"x" * 200_000}",ok@example.com,Engineering'),
+            "not a zip": import_file("name,email,department", name="interns.xlsx"),
+        }
+        for case, upload in uploads.items():
+            with self.subTest(case):
+                response = self.client.post(self.url, {"file": upload}, format="multipart")
+                self.assertEqual(response.status_code, 400, response.content)
+                self.assertIn("file", response.json())
+        self.assertFalse(User.objects.filter(email="ok@example.com").exists())
+
+    def test_interns_cannot_import(self):
+        self.client.force_authenticate(make_intern(1).user)
+        upload = import_file("name,email,department", "Ok Row,ok@example.com,Engineering")
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 403)
+
+    def test_management_command(self):
+        path = self.enterContext(tempfile.TemporaryDirectory()) + "/interns.csv"
+        with open(path, "w") as fileobj:
+            fileobj.write("name,email,department\nOk Row,ok@example.com,Engineering\n")
+        out = StringIO()
+        call_command("import_interns", path, stdout=out)
+        self.assertIn("Imported 1 interns", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("import_interns", path, stdout=StringIO(), stderr=StringIO())
+
+
+class DashboardCacheTests(TestCase):
+    url = "/api/interns/with-progress/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.intern = make_intern(1)
+        self.other = make_intern(2)
+        self.client = APIClient()
+
+    def _get(self, user, **headers):
+        self.client.force_authenticate(user)
+        return self.client.get(self.url, headers=headers)
+
+    def test_conditional_get_returns_304_without_queries(self):
+        first = self._get(self.admin)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("ETag", first)
+        self.assertIn("Last-Modified", first)
+
+        with self.assertNumQueries(0):
+            response = self._get(self.admin, **{"If-None-Match": first["ETag"]})
+        self.assertEqual(response.status_code, 304)
+        with self.assertNumQueries(0):
+            response = self._get(self.admin, **{"If-Modified-Since": first["Last-Modified"]})
+        self.assertEqual(response.status_code, 304)
+
+        with self.assertNumQueries(0):
+            cached = self._get(self.admin)
+        self.assertEqual(cached.json(), first.json())
+
+    def test_task_change_invalidates_admin_and_owner_only(self):
+        admin_etag = self._get(self.admin)["ETag"]
+        own_etag = self._get(self.intern.user)["ETag"]
+        other_etag = self._get(self.other.user)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(title="t", assigned_to=self.intern, due_date=date.today())
+
+        response = self._get(self.admin, **{"If-None-Match": admin_etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["task_stats"]["total"], 1)
+        self.assertEqual(self._get(self.intern.user, **{"If-None-Match": own_etag}).status_code, 200)
+        self.assertEqual(self._get(self.other.user, **{"If-None-Match": other_etag}).status_code, 304)
+
+    def test_counter_rebuild_invalidates_entries(self):
+        Task.objects.create(title="t", assigned_to=self.intern, due_date=date.today())
+        # QuerySet.update bypasses the signal handlers.
+        InternProfile.objects.update(task_count=0)
+        etag = self._get(self.admin)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(CommandError):
+                call_command("rebuild_task_counters", "--verify", stdout=StringIO())
+        self.assertEqual(self._get(self.admin, **{"If-None-Match": etag}).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("rebuild_task_counters", stdout=StringIO())
+        response = self._get(self.admin, **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["task_stats"]["total"], 1)
+
+    def test_interns_do_not_share_entries(self):
+        own = self._get(self.intern.user).json()["results"]
+        other = self._get(self.other.user).json()["results"]
+        self.assertEqual([row["id"] for row in own], [self.intern.user_id])
+        self.assertEqual([row["id"] for row in other], [self.other.user_id])
+
+    def test_permission_is_checked_before_conditional_requests(self):
+        self._get(self.admin)
+        self.client.force_authenticate(self.intern.user)
+        for headers in ({"If-None-Match": "*"}, {"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}):
+            self.assertEqual(self.client.get("/api/interns/", headers=headers).status_code, 403)
+
+    def test_entries_are_named_and_keyed_on_host(self):
+        with mock.patch("interns.cache._cache") as dashboard_cache:
+            dashboard_cache.return_value.get.return_value = None
+            self._get(self.admin)
+            key = dashboard_cache.return_value.set.call_args.args[0]
+        self.assertTrue(key.startswith("dashboard:with-progress:"), key)
+
+        self.client.force_authenticate(self.admin)
+        links = [
+            self.client.get("/api/interns/", {"page_size": 1}, headers={"Host": host}).json()["next"]
+            for host in ("a.example.com", "b.example.com")
+        ]
+        self.assertTrue(links[0].startswith("http://a.example.com/"), links)
+        self.assertTrue(links[1].startswith("http://b.example.com/"), links)
+
+
+class InternTaskCounterTests(TestCase):
+    def setUp(self):
+        self.intern = make_intern(1)
+        self.other = make_intern(2)
+
+    def _counters(self, intern):
+        intern.refresh_from_db()
+        return (
+            intern.task_count,
+            intern.completed_task_count,
+            intern.started_task_count,
+            intern.not_started_task_count,
+            intern.overdue_task_count,
+            intern.progress,
+        )
+
+    def test_counters_follow_task_lifecycle(self):
+        overdue = Task.objects.create(
+            title="late", assigned_to=self.intern, due_date=date.today() - timedelta(days=1)
+        )
+        task = Task.objects.create(title="t", assigned_to=self.intern, due_date=date.today())
+        self.assertEqual(self._counters(self.intern), (2, 0, 0, 2, 1, 0))
+
+        task.is_started = True
+        task.progress = 100
+        task.save()
+        self.assertEqual(self._counters(self.intern), (2, 1, 1, 1, 1, 50))
+        self.assertIsNotNone(self.intern.last_task_activity_at)
+
+        overdue.delete()
+        self.assertEqual(self._counters(self.intern), (1, 1, 1, 0, 0, 100))
+
+    def test_reassignment_refreshes_both_interns(self):
+        task = Task.objects.create(title="t", assigned_to=self.intern, due_date=date.today())
+        task = Task.objects.get(pk=task.pk)
+        task.assigned_to = self.other
+        task.save()
+        self.assertEqual(self._counters(self.intern)[0], 0)
+        self.assertEqual(self._counters(self.other)[0], 1)
+
+    def test_rebuild_command_repairs_stale_counters(self):
+        Task.objects.create(title="t", assigned_to=self.intern, due_date=date.today())
+        # QuerySet.update bypasses the signal handlers.
+        InternProfile.objects.update(task_count=0)
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_task_counters", "--verify", stdout=StringIO())
+        call_command("rebuild_task_counters", "--batch-size", "1", stdout=StringIO())
+        call_command("rebuild_task_counters", "--verify", stdout=StringIO())
+        self.assertEqual(self._counters(self.intern)[0], 1)
@@ -1,12 +1,15 @@
 from django.urls import path
-from .views import InternListCreateView, InternRetrieveView, InternWithProgressListView
+
+from backend.async_api import split_read_view
+from .views import InternImportView, InternListCreateView, InternRetrieveView, InternWithProgressListView, intern_list_async
 
 
 app_name = "interns"
 
 urlpatterns = [
-    path("", InternListCreateView.as_view(), name="intern-list-create"),
+    path("", split_read_view(InternListCreateView.as_view(), intern_list_async), name="intern-list-create"),
     path("<int:pk>/", InternRetrieveView.as_view(), name="intern-retrieve"),
+    path("import/", InternImportView.as_view(), name="intern-import"),
     path("with-progress/", InternWithProgressListView.as_view(), name="intern-list-with-progress"),
 ]
 
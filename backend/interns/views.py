@@ -1,27 +1,35 @@
 from rest_framework import permissions, status
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 
+from backend.async_api import async_api_view, error_response, json_response
+from backend.metrics import query_budget
+from .cache import DashboardCacheMixin, adashboard_data
+from .importer import ImportFormatError, import_interns, read_rows
 from .models import InternProfile
 from .serializers import InternSerializer, InternWithProgressSerializer
 
 # List interns with progress and task statistics for admin dashboard
 from rest_framework import generics
 
-class InternWithProgressListView(generics.ListAPIView):
+@query_budget(3)
+class InternWithProgressListView(DashboardCacheMixin, generics.ListAPIView):
     serializer_class = InternWithProgressSerializer
     permission_classes = [permissions.IsAuthenticated]
+    ordering = ("user_id",)
     queryset = InternProfile.objects.all()
+    dashboard_cache_name = "with-progress"
 
     def get_queryset(self):
-        # Only admins can see all interns
-        if hasattr(self.request.user, 'role') and self.request.user.role == 'ADMIN':
-            return InternProfile.objects.select_related('user').all()
-        # Others see only themselves
-        return InternProfile.objects.filter(user=self.request.user)
+        # Task counts are read from the denormalized counters on the profile,
+        # so this is a single query with no join against the tasks table.
+        # Admins see all interns, others only themselves.
+        return InternProfile.objects.visible_to(self.request.user).select_related('user').order_by('user_id')
 
 
 User = get_user_model()
@@ -31,22 +39,34 @@ def _is_admin(user) -> bool:
     return getattr(user, "role", None) == "ADMIN"
 
 
-class InternListCreateView(APIView):
+@query_budget(3)
+class InternListCreateView(DashboardCacheMixin, APIView):
     """List all interns (admin only) and create an intern (admin only)."""
 
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
+    ordering = ("user_id",)
+    dashboard_cache_name = "list"
 
     def get(self, request):
+        # Defining get() here shadows DashboardCacheMixin.get, so go through its cache explicitly.
+        return self.cached_response(request, self.list_interns)
+
+    def check_dashboard_access(self, request):
         if not _is_admin(request.user):
             return Response({"detail": "Only admins can list interns."}, status=status.HTTP_403_FORBIDDEN)
+        return None
 
+    def list_interns(self, request):
         qs = (
             InternProfile.objects.select_related("user")
             .filter(user__role="INTERN")
             .order_by("user__id")
         )
-        data = InternSerializer(qs, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        data = InternSerializer(page, many=True).data
+        return paginator.get_paginated_response(data)
 
     @transaction.atomic
     def post(self, request):
@@ -98,19 +118,70 @@ class InternListCreateView(APIView):
         return Response(data, status=status.HTTP_201_CREATED)
 
 
+
+@async_api_view
+async def intern_list_async(request):
+    """Async GET for ``InternListCreateView``, served under ASGI."""
+    if not _is_admin(request.user):
+        return error_response("Only admins can list interns.", status.HTTP_403_FORBIDDEN)
+
+    async def build():
+        qs = (
+            InternProfile.objects.select_related("user")
+            .filter(user__role="INTERN")
+            .order_by("user__id")
+        )
+        paginator = InternListCreateView.pagination_class()
+        page = await paginator.apaginate_queryset(qs, request, view=InternListCreateView)
+        return paginator.get_paginated_response(InternSerializer(page, many=True).data).data
+
+    data, headers = await adashboard_data(request, InternListCreateView.dashboard_cache_name, build)
+    if data is None:
+        return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return json_response(data, headers=headers)
+
+@query_budget(3)
 class InternRetrieveView(APIView):
-    """Retrieve a single intern by user id. Admin can access any; interns only their own."""
+    """Retrieve a single intern by user id. Admin can access any; interns only their own (404 otherwise)."""
 
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, pk: int):
-        if not (_is_admin(request.user) or request.user.id == pk):
-            return Response({"detail": "Not authorized to view this intern."}, status=status.HTTP_403_FORBIDDEN)
-
         profile = get_object_or_404(
-            InternProfile.objects.select_related("user").filter(user__role="INTERN"),
+            InternProfile.objects.visible_to(request.user).select_related("user").filter(user__role="INTERN"),
             pk=pk,
         )
         data = InternSerializer(profile).data
         return Response(data, status=status.HTTP_200_OK)
 
+
+
+class InternImportView(APIView):
+    """Admin-only bulk import of interns from an uploaded CSV or XLSX ``file``.
+
+    All rows are validated first; nothing is created unless every row is valid.
+    ``?dry_run=1`` only validates. 409 when a concurrent request registered
+    one of the emails before the insert.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        if not _is_admin(request.user):
+            return Response({"detail": "Only admins can import interns."}, status=status.HTTP_403_FORBIDDEN)
+
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response({"file": ["This field is required."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        dry_run = request.query_params.get("dry_run") in ("1", "true")
+        try:
+            report = import_interns(read_rows(upload, upload.name), dry_run=dry_run)
+        except (ImportFormatError, UnicodeDecodeError) as exc:
+            return Response({"file": [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+
+        if report["conflict"]:
+            return Response(report, status=status.HTTP_409_CONFLICT)
+        if report["errors"]:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED)
@@ -1,3 +1,21 @@
 from django.contrib import admin
+from .models import DailyDepartmentRollup, DailyInternRollup, RollupState
 
-# Register your models here.
+
+@admin.register(DailyInternRollup)
+class DailyInternRollupAdmin(admin.ModelAdmin):
+    list_display = ("intern_id", "department", "day", "tasks_created", "tasks_started", "tasks_completed", "tasks_overdue")
+    list_filter = ("department",)
+    date_hierarchy = "day"
+
+
+@admin.register(DailyDepartmentRollup)
+class DailyDepartmentRollupAdmin(admin.ModelAdmin):
+    list_display = ("department", "day", "tasks_created", "tasks_started", "tasks_completed", "tasks_overdue")
+    list_filter = ("department",)
+    date_hierarchy = "day"
+
+
+@admin.register(RollupState)
+class RollupStateAdmin(admin.ModelAdmin):
+    list_display = ("name", "processed_until")
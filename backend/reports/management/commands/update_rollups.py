@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from reports.rollups import update_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the daily task rollups for interns whose tasks changed since the last run. "
+        "Run it from cron every few minutes, and at least once a day so overdue counts advance."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Recompute every intern, not just changed ones.")
+
+    def handle(self, *args, **options):
+        count = update_rollups(full=options["full"])
+        self.stdout.write(self.style.SUCCESS(f"Recomputed rollups for {count} interns."))
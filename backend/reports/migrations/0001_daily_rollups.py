@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupState',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('processed_until', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailyDepartmentRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('tasks_created', models.PositiveIntegerField(default=0)),
+                ('tasks_started', models.PositiveIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('tasks_overdue', models.PositiveIntegerField(default=0)),
+                ('time_to_start_total', models.DurationField(default=0)),
+                ('time_to_complete_total', models.DurationField(default=0)),
+                ('department', models.CharField(max_length=100)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day', 'id'], name='rollup_dept_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('department', 'day'), name='rollup_dept_day_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyInternRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('tasks_created', models.PositiveIntegerField(default=0)),
+                ('tasks_started', models.PositiveIntegerField(default=0)),
+                ('tasks_completed', models.PositiveIntegerField(default=0)),
+                ('tasks_overdue', models.PositiveIntegerField(default=0)),
+                ('time_to_start_total', models.DurationField(default=0)),
+                ('time_to_complete_total', models.DurationField(default=0)),
+                ('intern_id', models.BigIntegerField()),
+                ('department', models.CharField(max_length=100)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day', 'id'], name='rollup_intern_day_idx'), models.Index(fields=['department', 'day'], name='rollup_intern_dept_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('intern_id', 'day'), name='rollup_intern_day_uniq')],
+            },
+        ),
+    ]
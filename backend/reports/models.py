@@ -1,3 +1,67 @@
 from django.db import models
 
-# Create your models here.
+
+class RollupMetrics(models.Model):
+    """Per-day task activity shared by the intern and department rollups.
+
+    Counts are of events that happened on ``day``: tasks created, started and
+    completed that day, and tasks whose due date was that day but which were
+    not completed by then. Durations are stored as totals with their sample
+    counts so department rows (and any date range) can be summed exactly;
+    time-to-start is ``started_at - created_at`` and time-to-complete is
+    ``completed_at - created_at``.
+    """
+
+    day = models.DateField()
+    tasks_created = models.PositiveIntegerField(default=0)
+    tasks_started = models.PositiveIntegerField(default=0)
+    tasks_completed = models.PositiveIntegerField(default=0)
+    tasks_overdue = models.PositiveIntegerField(default=0)
+    time_to_start_total = models.DurationField(default=0)
+    time_to_complete_total = models.DurationField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class DailyInternRollup(RollupMetrics):
+    # Plain columns rather than a foreign key: history outlives the intern.
+    intern_id = models.BigIntegerField()
+    department = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["intern_id", "day"], name="rollup_intern_day_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["day", "id"], name="rollup_intern_day_idx"),
+            models.Index(fields=["department", "day"], name="rollup_intern_dept_day_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"DailyInternRollup(intern_id={self.intern_id}, day={self.day})"
+
+
+class DailyDepartmentRollup(RollupMetrics):
+    department = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["department", "day"], name="rollup_dept_day_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["day", "id"], name="rollup_dept_day_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"DailyDepartmentRollup(department={self.department}, day={self.day})"
+
+
+class RollupState(models.Model):
+    """High-water mark of the incremental rollup job (see ``reports.rollups``)."""
+
+    name = models.CharField(max_length=50, primary_key=True)
+    processed_until = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"RollupState(name={self.name}, processed_until={self.processed_until})"
@@ -0,0 +1,173 @@
+"""Incremental daily rollups of task activity.
+
+``update_rollups`` finds the interns whose rollups may have changed since the
+previous run and recomputes all of their days:
+
+* interns with a task written (``Task.updated_at``) since the last run,
+* interns who lost a task (``TaskTombstone``: deleted or reassigned away),
+* interns with a task whose due date has passed since the last run, because
+  overdue counts move with the calendar rather than with writes.
+
+Recomputing an intern's whole history (a handful of grouped queries over an
+indexed, per-intern slice of the task table) keeps the job correct when a
+task's dates move, without knowing their previous values. Department rows for
+every (department, day) an intern touched before or after are then re-summed
+from the intern rows, so the read endpoints never touch the task table.
+
+Changing an intern's department does not touch their tasks; rebuild with
+``update_rollups --full`` afterwards to move their history.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from interns.models import InternProfile
+from tasks.models import Task, TaskTombstone
+from .models import DailyDepartmentRollup, DailyInternRollup, RollupState
+
+
+ROLLUP_STATE = "daily"
+ROLLUP_BATCH_SIZE = 500
+METRIC_FIELDS = [
+    "tasks_created",
+    "tasks_started",
+    "tasks_completed",
+    "tasks_overdue",
+    "time_to_start_total",
+    "time_to_complete_total",
+]
+
+
+def _empty_metrics():
+    return {
+        "tasks_created": 0,
+        "tasks_started": 0,
+        "tasks_completed": 0,
+        "tasks_overdue": 0,
+        "time_to_start_total": timedelta(0),
+        "time_to_complete_total": timedelta(0),
+    }
+
+
+def _since_created(field):
+    return ExpressionWrapper(F(field) - F("created_at"), output_field=DurationField())
+
+
+def touched_interns(since, until, today):
+    """Ids of interns whose rollups may have changed in ``(since, until]``."""
+    if since is None:
+        ids = set(InternProfile.objects.values_list("pk", flat=True))
+        return ids | set(DailyInternRollup.objects.values_list("intern_id", flat=True).distinct())
+
+    written = Task.objects.filter(updated_at__gt=since, updated_at__lte=until)
+    removed = TaskTombstone.objects.filter(deleted_at__gt=since, deleted_at__lte=until)
+    came_due = Task.objects.filter(due_date__gte=timezone.localdate(since), due_date__lt=today)
+    ids = set(written.values_list("assigned_to_id", flat=True).distinct())
+    ids |= set(removed.exclude(intern_id=None).values_list("intern_id", flat=True).distinct())
+    ids |= set(came_due.values_list("assigned_to_id", flat=True).distinct())
+    return ids
+
+
+def compute_intern_rollups(intern_ids, today):
+    """Return ``{(intern_id, day): metrics}`` for every active day of ``intern_ids``."""
+    rollups = defaultdict(_empty_metrics)
+    tasks = Task.objects.filter(assigned_to_id__in=intern_ids).order_by()
+
+    for row in tasks.values("assigned_to_id", day=TruncDate("created_at")).annotate(n=Count("id")):
+        rollups[row["assigned_to_id"], row["day"]]["tasks_created"] = row["n"]
+
+    started = (
+        tasks.filter(started_at__isnull=False)
+        .values("assigned_to_id", day=TruncDate("started_at"))
+        .annotate(n=Count("id"), total=Sum(_since_created("started_at")))
+    )
+    for row in started:
+        metrics = rollups[row["assigned_to_id"], row["day"]]
+        metrics["tasks_started"], metrics["time_to_start_total"] = row["n"], row["total"]
+
+    completed = (
+        tasks.filter(completed_at__isnull=False)
+        .values("assigned_to_id", day=TruncDate("completed_at"))
+        .annotate(n=Count("id"), total=Sum(_since_created("completed_at")))
+    )
+    for row in completed:
+        metrics = rollups[row["assigned_to_id"], row["day"]]
+        metrics["tasks_completed"], metrics["time_to_complete_total"] = row["n"], row["total"]
+
+    # Overdue on its due date: not completed by the end of that day.
+    overdue = (
+        tasks.filter(due_date__lt=today)
+        .filter(Q(completed_at__isnull=True) | Q(completed_at__date__gt=F("due_date")))
+        .values("assigned_to_id", "due_date")
+        .annotate(n=Count("id"))
+    )
+    for row in overdue:
+        rollups[row["assigned_to_id"], row["due_date"]]["tasks_overdue"] = row["n"]
+
+    return rollups
+
+
+def refresh_department_rollups(pairs):
+    """Re-sum the department rows for ``(department, day)`` pairs from the intern rows."""
+    days_by_department = defaultdict(set)
+    for department, day in pairs:
+        days_by_department[department].add(day)
+
+    for department, days in days_by_department.items():
+        DailyDepartmentRollup.objects.filter(department=department, day__in=days).delete()
+        sums = (
+            DailyInternRollup.objects.filter(department=department, day__in=days)
+            .order_by()
+            .values("day")
+            .annotate(**{field: Sum(field) for field in METRIC_FIELDS})
+        )
+        DailyDepartmentRollup.objects.bulk_create(
+            [DailyDepartmentRollup(department=department, **row) for row in sums], batch_size=1000
+        )
+
+
+def refresh_intern_rollups(intern_ids, today):
+    """Rewrite every rollup row of ``intern_ids`` and the department rows they feed."""
+    departments = dict(InternProfile.objects.filter(pk__in=intern_ids).values_list("pk", "department"))
+    existing = DailyInternRollup.objects.filter(intern_id__in=intern_ids)
+    affected = set(existing.values_list("department", "day"))
+    existing.delete()
+
+    rows = [
+        DailyInternRollup(intern_id=intern_id, day=day, department=departments[intern_id], **metrics)
+        for (intern_id, day), metrics in compute_intern_rollups(intern_ids, today).items()
+        if intern_id in departments
+    ]
+    DailyInternRollup.objects.bulk_create(rows, batch_size=1000)
+    affected |= {(row.department, row.day) for row in rows}
+    refresh_department_rollups(affected)
+
+
+def update_rollups(full=False, now=None):
+    """Bring the rollups up to date; return the number of interns recomputed.
+
+    Changes newer than ``TASK_CHANGES_SETTLE_SECONDS`` are left for the next
+    run, as in delta sync, so a transaction that commits late is not skipped.
+    """
+    now = now or timezone.now()
+    until = now - timedelta(seconds=settings.TASK_CHANGES_SETTLE_SECONDS)
+    today = timezone.localdate(now)
+
+    with transaction.atomic():
+        # The state row lock keeps concurrent runs from interleaving.
+        RollupState.objects.get_or_create(name=ROLLUP_STATE)
+        state = RollupState.objects.select_for_update().get(name=ROLLUP_STATE)
+        since = None if full else state.processed_until
+
+        intern_ids = sorted(touched_interns(since, until, today))
+        for start in range(0, len(intern_ids), ROLLUP_BATCH_SIZE):
+            refresh_intern_rollups(intern_ids[start:start + ROLLUP_BATCH_SIZE], today)
+
+        state.processed_until = until
+        state.save(update_fields=["processed_until"])
+    return len(intern_ids)
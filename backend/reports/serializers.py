@@ -0,0 +1,43 @@
+from rest_framework import serializers
+
+from .models import DailyDepartmentRollup, DailyInternRollup
+
+
+ROLLUP_METRIC_FIELDS = [
+    "day",
+    "tasks_created",
+    "tasks_started",
+    "tasks_completed",
+    "tasks_overdue",
+    "mean_time_to_start_seconds",
+    "mean_time_to_complete_seconds",
+]
+
+
+def _mean_seconds(total, count):
+    return round(total.total_seconds() / count, 1) if count else None
+
+
+class RollupSerializer(serializers.ModelSerializer):
+    """Daily rollup row; mean durations are null on days with no samples."""
+
+    mean_time_to_start_seconds = serializers.SerializerMethodField()
+    mean_time_to_complete_seconds = serializers.SerializerMethodField()
+
+    def get_mean_time_to_start_seconds(self, obj):
+        return _mean_seconds(obj.time_to_start_total, obj.tasks_started)
+
+    def get_mean_time_to_complete_seconds(self, obj):
+        return _mean_seconds(obj.time_to_complete_total, obj.tasks_completed)
+
+
+class InternRollupSerializer(RollupSerializer):
+    class Meta:
+        model = DailyInternRollup
+        fields = ["intern_id", "department", *ROLLUP_METRIC_FIELDS]
+
+
+class DepartmentRollupSerializer(RollupSerializer):
+    class Meta:
+        model = DailyDepartmentRollup
+        fields = ["department", *ROLLUP_METRIC_FIELDS]
@@ -1,3 +1,178 @@
+import json
+from datetime import date, datetime, timedelta
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from interns.models import InternProfile
+from tasks.models import Task
+from .models import DailyDepartmentRollup, DailyInternRollup
+from .rollups import update_rollups
+
+
+User = get_user_model()
+
+
+class InternExportTests(TestCase):
+    url = "/api/reports/interns/export/"
+
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.intern_user = User.objects.create(
+            email="intern@example.com", first_name="Ada", last_name="Lovelace", role="INTERN"
+        )
+        InternProfile.objects.create(user=self.intern_user, department="Engineering")
+        self.client = APIClient()
+
+    def test_admin_streams_interns(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["id"], self.intern_user.id)
+        self.assertEqual(rows[0]["name"], "Ada Lovelace")
+        self.assertEqual(rows[0]["task_count"], 0)
+
+    def test_interns_cannot_export(self):
+        self.client.force_authenticate(self.intern_user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
+
+
+def _at(day, hour=12):
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()) + timedelta(hours=hour))
+
+
+class RollupTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.ada = User.objects.create(email="ada@example.com", role="INTERN")
+        self.bob = User.objects.create(email="bob@example.com", role="INTERN")
+        self.ada_profile = InternProfile.objects.create(user=self.ada, department="Engineering")
+        self.bob_profile = InternProfile.objects.create(user=self.bob, department="Engineering")
+        self.today = timezone.localdate()
+        self.day1 = self.today - timedelta(days=5)
+        self.day2 = self.today - timedelta(days=4)
+        self.client = APIClient()
+
+    def _task(self, intern, created, started=None, completed=None, due=None, touched=None):
+        task = Task.objects.create(title="t", assigned_to=intern, due_date=due or self.today + timedelta(days=30))
+        Task.objects.filter(pk=task.pk).update(
+            created_at=created,
+            started_at=started,
+            completed_at=completed,
+            status="COMPLETED" if completed else "NOT_STARTED",
+            updated_at=touched or created,
+        )
+        return task
+
+    def test_rollups_count_events_per_day(self):
+        self._task(self.ada_profile, _at(self.day1, 9), started=_at(self.day1, 11), completed=_at(self.day2, 9))
+        self._task(self.ada_profile, _at(self.day1, 10), started=_at(self.day1, 14))
+        self._task(self.bob_profile, _at(self.day2, 9), due=self.day2)
+        self.assertEqual(update_rollups(), 2)
+
+        day1 = DailyInternRollup.objects.get(intern_id=self.ada.id, day=self.day1)
+        self.assertEqual((day1.tasks_created, day1.tasks_started, day1.tasks_completed), (2, 2, 0))
+        self.assertEqual(day1.time_to_start_total, timedelta(hours=6))
+        day2 = DailyInternRollup.objects.get(intern_id=self.ada.id, day=self.day2)
+        self.assertEqual((day2.tasks_completed, day2.time_to_complete_total), (1, timedelta(hours=24)))
+
+        department = DailyDepartmentRollup.objects.get(department="Engineering", day=self.day2)
+        self.assertEqual((department.tasks_created, department.tasks_completed, department.tasks_overdue), (1, 1, 1))
+
+    def test_incremental_run_only_recomputes_touched_interns(self):
+        self._task(self.ada_profile, _at(self.day1))
+        bob_task = self._task(self.bob_profile, _at(self.day1))
+        start = timezone.now() - timedelta(minutes=10)
+        update_rollups(now=start)
+        bob_row = DailyInternRollup.objects.get(intern_id=self.bob.id)
+
+        self._task(self.ada_profile, _at(self.day1), touched=start + timedelta(minutes=1))
+        self.assertEqual(update_rollups(now=start + timedelta(minutes=5)), 1)
+        self.assertEqual(DailyInternRollup.objects.get(intern_id=self.bob.id).pk, bob_row.pk)
+        self.assertEqual(DailyDepartmentRollup.objects.get(day=self.day1).tasks_created, 3)
+
+        bob_task.delete()
+        self.assertEqual(update_rollups(now=timezone.now() + timedelta(seconds=5)), 1)
+        self.assertFalse(DailyInternRollup.objects.filter(intern_id=self.bob.id).exists())
+        self.assertEqual(DailyDepartmentRollup.objects.get(day=self.day1).tasks_created, 2)
+
+    def test_intern_sees_only_own_rollups(self):
+        self._task(self.ada_profile, _at(self.day1), started=_at(self.day1, 13))
+        self._task(self.bob_profile, _at(self.day2))
+        update_rollups()
+
+        self.client.force_authenticate(self.ada)
+        response = self.client.get("/api/reports/rollups/interns/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["intern_id"] for row in response.data["results"]], [self.ada.id])
+        self.assertEqual(response.data["results"][0]["mean_time_to_start_seconds"], 3600.0)
+        self.assertIsNone(response.data["results"][0]["mean_time_to_complete_seconds"])
+
+        response = self.client.get("/api/reports/rollups/departments/")
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_filters_department_rollups_by_day(self):
+        self._task(self.ada_profile, _at(self.day1))
+        self._task(self.bob_profile, _at(self.day2))
+        update_rollups()
+
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(
+            "/api/reports/rollups/departments/", {"start": self.day2.isoformat(), "department": "Engineering"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["day"] for row in response.data["results"]], [self.day2.isoformat()])
+        response = self.client.get("/api/reports/rollups/departments/", {"start": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+
+
+class DepartmentStatsTests(TestCase):
+    url = "/api/reports/departments/"
+
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        engineering = [
+            InternProfile.objects.create(
+                user=User.objects.create(email=f"eng{i}@example.com", role="INTERN"), department="Engineering"
+            )
+            for i in range(2)
+        ]
+        self.design = InternProfile.objects.create(
+            user=User.objects.create(email="design@example.com", role="INTERN"), department="Design"
+        )
+        yesterday = date.today() - timedelta(days=1)
+        done = Task.objects.create(title="done", assigned_to=engineering[0], due_date=yesterday, progress=100)
+        Task.objects.create(title="late", assigned_to=engineering[0], due_date=yesterday)
+        Task.objects.create(title="open", assigned_to=engineering[1], due_date=date.today() + timedelta(days=3))
+        Task.objects.filter(pk=done.pk).update(created_at=timezone.now() - timedelta(days=10))
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_grouped_stats_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [
+            {"department": "Design", "intern_count": 1, "task_count": 0, "completed_task_count": 0,
+             "overdue_task_count": 0, "completion_rate": None},
+            {"department": "Engineering", "intern_count": 2, "task_count": 3, "completed_task_count": 1,
+             "overdue_task_count": 1, "completion_rate": 33.3},
+        ])
+
+    def test_date_range_narrows_tasks_not_interns(self):
+        response = self.client.get(self.url, {"created_after": (date.today() - timedelta(days=2)).isoformat()})
+        engineering = response.data[1]
+        self.assertEqual((engineering["intern_count"], engineering["task_count"]), (2, 2))
+        self.assertEqual(engineering["completed_task_count"], 0)
+
+        response = self.client.get(self.url, {"completed_before": "not-a-date"})
+        self.assertEqual(response.status_code, 400)
 
-# Create your tests here.
+    def test_interns_are_forbidden(self):
+        self.client.force_authenticate(self.design.user)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
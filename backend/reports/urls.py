@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import DepartmentRollupListView, DepartmentStatsView, InternExportView, InternRollupListView
+
+
+app_name = "reports"
+
+urlpatterns = [
+    path("interns/export/", InternExportView.as_view(), name="intern-export"),
+    path("departments/", DepartmentStatsView.as_view(), name="department-stats"),
+    path("rollups/interns/", InternRollupListView.as_view(), name="intern-rollups"),
+    path("rollups/departments/", DepartmentRollupListView.as_view(), name="department-rollups"),
+]
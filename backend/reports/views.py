@@ -1,3 +1,201 @@
-from django.shortcuts import render
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from backend.exports import export_format, iterate_values, streaming_export
+from backend.metrics import query_budget
+from interns.models import InternProfile
+from .models import DailyDepartmentRollup, DailyInternRollup
+from .serializers import DepartmentRollupSerializer, InternRollupSerializer
+
+
+def _is_admin(user) -> bool:
+    return getattr(user, "role", None) == "ADMIN"
+
+
+INTERN_EXPORT_FIELDS = [
+    "user_id",
+    "user__first_name",
+    "user__last_name",
+    "user__email",
+    "department",
+    "status",
+    "progress",
+    "task_count",
+    "completed_task_count",
+    "in_progress_task_count",
+    "not_started_task_count",
+    "overdue_task_count",
+    "last_task_activity_at",
+]
+INTERN_EXPORT_COLUMNS = [
+    "id",
+    "name",
+    "email",
+    "department",
+    "status",
+    "progress",
+    "task_count",
+    "completed_task_count",
+    "in_progress_task_count",
+    "not_started_task_count",
+    "overdue_task_count",
+    "last_task_activity_at",
+]
+
+
+def _intern_export_row(row):
+    row["id"] = row.pop("user_id")
+    row["name"] = f"{row.pop('user__first_name')} {row.pop('user__last_name')}"
+    row["email"] = row.pop("user__email")
+    return row
+
+
+@query_budget(3)
+class InternExportView(APIView):
+    """Stream every intern with their task counters (admin only)."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        if not _is_admin(request.user):
+            return Response({"detail": "Only admins can export interns."}, status=status.HTTP_403_FORBIDDEN)
+        fmt = export_format(request)
+        if fmt is None:
+            return Response({"detail": "Unsupported export format."}, status=status.HTTP_400_BAD_REQUEST)
+
+        qs = InternProfile.objects.filter(user__role="INTERN").order_by("user_id")
+        rows = map(_intern_export_row, iterate_values(qs, INTERN_EXPORT_FIELDS))
+        return streaming_export(rows, INTERN_EXPORT_COLUMNS, fmt, filename="interns")
+
+
+def _date_params(request, names):
+    """Parse optional ``YYYY-MM-DD`` query params; return ``(dates, errors)``."""
+    dates, errors = {}, {}
+    for name in names:
+        value = request.query_params.get(name)
+        if not value:
+            continue
+        try:
+            dates[name] = parse_date(value)
+        except ValueError:
+            dates[name] = None
+        if dates[name] is None:
+            errors[name] = ["Enter a date as YYYY-MM-DD."]
+    return dates, errors
+
+
+class RollupListView(generics.ListAPIView):
+    """Daily rollup rows in ``(day, id)`` order, filtered by ``?start=`` / ``?end=``.
+
+    Reads only the precomputed tables (see ``reports.rollups``), never the
+    task table, so charts over long ranges stay cheap.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    ordering = ("day", "id")
+
+    def list(self, request, *args, **kwargs):
+        self.dates, errors = _date_params(request, ("start", "end"))
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        return super().list(request, *args, **kwargs)
+
+    def filter_days(self, qs):
+        if "start" in self.dates:
+            qs = qs.filter(day__gte=self.dates["start"])
+        if "end" in self.dates:
+            qs = qs.filter(day__lte=self.dates["end"])
+        if self.request.query_params.get("department"):
+            qs = qs.filter(department=self.request.query_params["department"])
+        return qs
+
+
+@query_budget(3)
+class InternRollupListView(RollupListView):
+    """Per-intern daily rollups; admins may filter by ``?intern=``, interns see their own."""
+
+    serializer_class = InternRollupSerializer
+
+    def get_queryset(self):
+        qs = self.filter_days(DailyInternRollup.objects.all())
+        if not _is_admin(self.request.user):
+            return qs.filter(intern_id=self.request.user.id)
+        intern = self.request.query_params.get("intern")
+        if intern and intern.isdigit():
+            qs = qs.filter(intern_id=int(intern))
+        return qs
+
+
+@query_budget(3)
+class DepartmentRollupListView(RollupListView):
+    """Per-department daily rollups (admin only), filtered by ``?department=``."""
+
+    serializer_class = DepartmentRollupSerializer
+
+    def list(self, request, *args, **kwargs):
+        if not _is_admin(request.user):
+            return Response(
+                {"detail": "Only admins can view department reports."}, status=status.HTTP_403_FORBIDDEN
+            )
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        return self.filter_days(DailyDepartmentRollup.objects.all())
+
+
+DEPARTMENT_DATE_FILTERS = {
+    "created_after": "tasks__created_at__date__gte",
+    "created_before": "tasks__created_at__date__lte",
+    "completed_after": "tasks__completed_at__date__gte",
+    "completed_before": "tasks__completed_at__date__lte",
+}
+
+
+@query_budget(2)
+class DepartmentStatsView(APIView):
+    """Per-department intern and task totals (admin only).
+
+    One ``GROUP BY department`` over interns left-joined to their tasks. The
+    optional ``created_after`` / ``created_before`` / ``completed_after`` /
+    ``completed_before`` dates (inclusive) narrow the tasks that are counted;
+    departments keep their full ``intern_count`` either way.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        if not _is_admin(request.user):
+            return Response({"detail": "Only admins can view department reports."}, status=status.HTTP_403_FORBIDDEN)
+        dates, errors = _date_params(request, DEPARTMENT_DATE_FILTERS)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # Filters go into each aggregate rather than WHERE so interns without
+        # matching tasks still count towards their department.
+        in_range = Q(tasks__isnull=False)
+        for name, value in dates.items():
+            in_range &= Q(**{DEPARTMENT_DATE_FILTERS[name]: value})
+        today = timezone.localdate()
+        completed = Q(tasks__status="COMPLETED")
+        rows = (
+            InternProfile.objects.filter(user__role="INTERN")
+            .order_by()
+            .values("department")
+            .annotate(
+                intern_count=Count("pk", distinct=True),
+                task_count=Count("tasks", filter=in_range),
+                completed_task_count=Count("tasks", filter=in_range & completed),
+                overdue_task_count=Count("tasks", filter=in_range & ~completed & Q(tasks__due_date__lt=today)),
+            )
+            .order_by("department")
+        )
+        data = []
+        for row in rows:
+            total = row["task_count"]
+            row["completion_rate"] = round(row["completed_task_count"] / total * 100, 1) if total else None
+            data.append(row)
+        return Response(data)
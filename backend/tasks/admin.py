@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Task
+from .models import Task, TaskTombstone
 
 
 @admin.register(Task)
@@ -25,3 +25,9 @@ class TaskAdmin(admin.ModelAdmin):
         }),
     )
 
+
+
+@admin.register(TaskTombstone)
+class TaskTombstoneAdmin(admin.ModelAdmin):
+    list_display = ("id", "task_id", "intern_id", "reason", "deleted_at")
+    list_filter = ("reason",)
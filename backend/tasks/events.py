@@ -0,0 +1,276 @@
+"""Task change events pushed to dashboards over Server-Sent Events.
+
+``Task`` save/delete hooks (``tasks.signals``) and the bulk endpoints call
+``publish_tasks`` / ``publish_tasks_deleted``. Once the transaction commits,
+the changed rows are loaded with one query, rendered exactly like the task
+list rows and handed to the broker, which fans them out to every open stream
+whose user may see the task. Nothing is loaded when nobody is listening.
+
+The broker is pluggable through ``settings.TASK_EVENTS_BROKER``. The default
+``InProcessBroker`` only reaches streams served by the same process; a
+multi-process deployment plugs in a broker that relays ``publish`` through
+e.g. Redis pub/sub and calls ``deliver`` on its local subscriptions.
+
+Streams do not replay missed events. A client that reconnects (or gets a
+``resync`` event after falling too far behind) should refetch its list.
+"""
+import asyncio
+import itertools
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from .models import Task
+from .serializers import TASK_READ_FIELDS, task_rows_representation
+
+
+TASK_CREATED = "task.created"
+TASK_UPDATED = "task.updated"
+TASK_DELETED = "task.deleted"
+
+# QueryToken scope accepted by the event stream (see TaskEventTokenView).
+EVENTS_TOKEN_SCOPE = "tasks.events"
+
+# Queued in place of an event when a subscriber's queue is full.
+_OVERFLOW = object()
+
+_json = JSONRenderer()
+
+
+class BaseBroker:
+    """Fan-out of task events to subscriptions."""
+
+    def publish(self, event):
+        raise NotImplementedError
+
+    def subscribe(self, subscription):
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription):
+        raise NotImplementedError
+
+    def has_subscribers(self) -> bool:
+        # Brokers that relay across processes cannot know; assume someone listens.
+        return True
+
+
+class InProcessBroker(BaseBroker):
+    def __init__(self):
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def publish(self, event):
+        with self._lock:
+            event = {**event, "id": next(self._ids)}
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+    def subscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.add(subscription)
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def has_subscribers(self):
+        return bool(self._subscriptions)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.TASK_EVENTS_BROKER)()
+    return _broker
+
+
+def publish_tasks(event_type, task_ids, previous_intern_ids=None):
+    """Publish ``event_type`` for ``task_ids`` once the current transaction commits.
+
+    ``previous_intern_ids`` maps task id to its assignee before the change, so
+    an intern whose task was reassigned away sees it deleted.
+    """
+    task_ids = list(task_ids)
+    previous_intern_ids = previous_intern_ids or {}
+
+    def send():
+        broker = get_broker()
+        if not task_ids or not broker.has_subscribers():
+            return
+        rows = list(
+            Task.objects.filter(id__in=task_ids).order_by("id").values(*TASK_READ_FIELDS, "assigned_to_id")
+        )
+        intern_ids = [row.pop("assigned_to_id") for row in rows]
+        for intern_id, data in zip(intern_ids, task_rows_representation(rows)):
+            broker.publish({
+                "type": event_type,
+                "intern_id": intern_id,
+                "previous_intern_id": previous_intern_ids.get(data["id"]),
+                "data": data,
+            })
+
+    transaction.on_commit(send)
+
+
+def publish_tasks_deleted(deleted):
+    """Publish ``TASK_DELETED`` for ``(task_id, intern_id)`` pairs once the transaction commits."""
+    deleted = list(deleted)
+
+    def send():
+        broker = get_broker()
+        for task_id, intern_id in deleted:
+            broker.publish({
+                "type": TASK_DELETED,
+                "intern_id": intern_id,
+                "previous_intern_id": None,
+                "data": {"id": task_id},
+            })
+
+    transaction.on_commit(send)
+
+
+def format_event(event_type, data, event_id=None) -> str:
+    lines = [f"event: {event_type}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    # Same encoding as the JSON API, so rows match the task list byte for byte.
+    lines.append(f"data: {_json.render(data).decode()}")
+    return "\n".join(lines) + "\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets DRF negotiate ``Accept: text/event-stream``; errors become an ``error`` event."""
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return format_event("error", data).encode()
+
+
+class Subscription:
+    """One client's view of the event stream, filtered by what its user may see."""
+
+    def __init__(self, user, broker=None):
+        self.user = user
+        self.broker = broker or get_broker()
+        self.is_admin = getattr(user, "role", None) == "ADMIN"
+
+    def visible(self, event):
+        """Return ``(type, data)`` to send for ``event``, or None to skip it."""
+        if self.is_admin or event["intern_id"] == self.user.pk:
+            return event["type"], event["data"]
+        if event["previous_intern_id"] == self.user.pk:
+            return TASK_DELETED, {"id": event["data"]["id"]}
+        return None
+
+    def render(self, event):
+        if event is _OVERFLOW:
+            return format_event("resync", {})
+        event_type, data = self.visible(event)
+        return format_event(event_type, data, event["id"])
+
+    def preamble(self):
+        return f"retry: {settings.TASK_EVENTS_RETRY_MS}\n\n"
+
+
+class SyncSubscription(Subscription):
+    """Blocking stream for WSGI; each open stream holds a worker thread.
+
+    Streams close after ``TASK_EVENTS_WSGI_STREAM_SECONDS`` so the thread is
+    returned to the server between reconnects.
+    """
+
+    def __init__(self, user, broker=None):
+        super().__init__(user, broker)
+        self._queue = queue.Queue(maxsize=settings.TASK_EVENTS_QUEUE_SIZE)
+
+    def deliver(self, event):
+        if self.visible(event) is None:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.broker.unsubscribe(self)
+            with self._queue.mutex:
+                self._queue.queue.clear()
+            self._queue.put_nowait(_OVERFLOW)
+
+    def stream(self):
+        self.broker.subscribe(self)
+        try:
+            yield self.preamble()
+            # Streams end after a while so threads are recycled; EventSource reconnects.
+            deadline = time.monotonic() + settings.TASK_EVENTS_WSGI_STREAM_SECONDS
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    event = self._queue.get(timeout=min(settings.TASK_EVENTS_HEARTBEAT, remaining))
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield self.render(event)
+                if event is _OVERFLOW:
+                    return
+        finally:
+            self.broker.unsubscribe(self)
+
+
+class AsyncSubscription(Subscription):
+    """Stream for ASGI; waiting clients cost a coroutine, not a thread."""
+
+    def __init__(self, user, broker=None):
+        super().__init__(user, broker)
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=settings.TASK_EVENTS_QUEUE_SIZE)
+
+    def deliver(self, event):
+        # Called from whichever thread committed the change.
+        if self.visible(event) is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The loop is gone; the stream can no longer be read.
+            self.broker.unsubscribe(self)
+
+    def _put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.broker.unsubscribe(self)
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_OVERFLOW)
+
+    async def stream(self):
+        self.broker.subscribe(self)
+        try:
+            yield self.preamble()
+            deadline = time.monotonic() + settings.TASK_EVENTS_STREAM_SECONDS
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    event = await asyncio.wait_for(
+                        self._queue.get(), timeout=min(settings.TASK_EVENTS_HEARTBEAT, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield self.render(event)
+                if event is _OVERFLOW:
+                    return
+        finally:
+            self.broker.unsubscribe(self)
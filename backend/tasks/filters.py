@@ -0,0 +1,127 @@
+"""Query parameters of the task list.
+
+``TaskFilter`` narrows the list by column filters, the overdue filters of
+``tasks.overdue`` and ``?search=``; ``TaskOrderingFilter`` handles
+``?ordering=``. Both are plain DRF filter backends, so the keyset paginator
+picks up the requested ordering and the async list applies them through
+``filter_tasks``.
+
+Search uses PostgreSQL full-text search over title and description, matching
+the ``task_search_idx`` GIN expression index. Other databases fall back to a
+case-insensitive substring match, which scans the table.
+"""
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.contrib.postgres.search import SearchQuery
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from .models import TASK_SEARCH_CONFIG, TASK_SEARCH_VECTOR, Task
+from .overdue import date_param, filter_due
+
+
+PRIORITY_RANK = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
+
+
+def _choices(params, name, valid, convert=str.upper):
+    """Parse a comma-separated ``?name=`` into a list of ``valid`` values, or None."""
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        values = [convert(item.strip()) for item in value.split(",")]
+    except ValueError:
+        values = None
+    if not values or any(item not in valid for item in values):
+        raise ValidationError({name: [f"Choose from {', '.join(str(item) for item in valid)}."]})
+    return values
+
+
+def _int_list(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return [int(item) for item in value.split(",")]
+    except ValueError:
+        raise ValidationError({name: ["Enter comma-separated ids."]}) from None
+
+
+def search_tasks(queryset, terms):
+    if connection.vendor == "postgresql":
+        # The filter expression must match the index expression to use it.
+        query = SearchQuery(terms, config=TASK_SEARCH_CONFIG, search_type="websearch")
+        return queryset.alias(search=TASK_SEARCH_VECTOR).filter(search=query)
+    return queryset.filter(Q(title__icontains=terms) | Q(description__icontains=terms))
+
+
+class TaskFilter(BaseFilterBackend):
+    """Task list filters.
+
+    ``status``, ``priority``, ``progress`` and ``assignee`` (intern user ids)
+    take comma-separated values; ``department`` is the assignee's department;
+    ``due_after`` / ``due_before`` bound ``due_date`` (exclusive); ``overdue``
+    and ``due_before`` are described in ``tasks.overdue.filter_due``;
+    ``search`` matches title and description.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        statuses = _choices(params, "status", [code for code, _ in Task.STATUS_CHOICES])
+        if statuses:
+            queryset = queryset.filter(status__in=statuses)
+        priorities = _choices(params, "priority", list(PRIORITY_RANK))
+        if priorities:
+            queryset = queryset.filter(priority__in=priorities)
+        progress = _choices(params, "progress", [value for value, _ in Task.PROGRESS_CHOICES], convert=int)
+        if progress:
+            queryset = queryset.filter(progress__in=progress)
+        assignees = _int_list(params, "assignee")
+        if assignees:
+            queryset = queryset.filter(assigned_to_id__in=assignees)
+        if params.get("department"):
+            queryset = queryset.filter(assigned_to__department=params["department"])
+        due_after = date_param(params, "due_after")
+        if due_after:
+            queryset = queryset.filter(due_date__gt=due_after)
+        queryset = filter_due(queryset, params)
+        terms = (params.get("search") or "").strip()
+        if terms:
+            queryset = search_tasks(queryset, terms)
+        return queryset
+
+
+class TaskOrderingFilter(OrderingFilter):
+    """``?ordering=`` on due date, priority or creation time, newest first by default.
+
+    ``priority`` sorts by rank (low < medium < high) rather than by its code,
+    and ``id`` is appended so the keyset paginator always sees a total order;
+    its cursor holds both values, so ties on the first field page by id.
+    """
+
+    ordering_fields = ["due_date", "priority", "created_at"]
+
+    def get_ordering(self, request, queryset, view):
+        ordering = [
+            term.replace("priority", "priority_rank")
+            for term in super().get_ordering(request, queryset, view) or ()
+        ]
+        if not any(term.lstrip("-") == "id" for term in ordering):
+            ordering.append("-id" if ordering and ordering[0].startswith("-") else "id")
+        return tuple(ordering)
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if any(term.lstrip("-") == "priority_rank" for term in ordering):
+            queryset = queryset.annotate(priority_rank=Case(
+                *(When(priority=code, then=Value(rank)) for code, rank in PRIORITY_RANK.items()),
+                output_field=IntegerField(),
+            ))
+        return queryset.order_by(*ordering)
+
+
+def filter_tasks(request, queryset, view):
+    """Run ``view``'s filter backends; used where DRF's ``filter_queryset`` is not."""
+    for backend in view.filter_backends:
+        queryset = backend().filter_queryset(request, queryset, view)
+    return queryset
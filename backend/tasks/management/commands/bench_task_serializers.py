@@ -0,0 +1,80 @@
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from interns.models import InternProfile
+from tasks.models import Task
+from tasks.serializers import TASK_READ_FIELDS, TaskSerializer, task_rows_representation
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark TaskSerializer against the values()-based fast path "
+        "(serialization + JSON rendering, in memory, no database)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        for count in options["rows"]:
+            tasks, rows = self._build(count)
+            slow = self._best(options["repeat"], lambda: renderer.render(TaskSerializer(tasks, many=True).data))
+            fast = self._best(options["repeat"], lambda: renderer.render(task_rows_representation(rows)))
+            self.stdout.write(
+                f"{count:>8} rows  TaskSerializer {count / slow:>10,.0f} rows/s  "
+                f"fast path {count / fast:>10,.0f} rows/s  ({slow / fast:.1f}x)"
+            )
+
+    def _best(self, repeat, fn):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def _build(self, count):
+        now = timezone.now()
+        interns = [
+            InternProfile(
+                user=User(id=i, first_name=f"Intern{i}", last_name="Test", email=f"intern{i}@example.com"),
+                department="Engineering",
+            )
+            for i in range(100)
+        ]
+        tasks = []
+        for i in range(count):
+            progress = (0, 25, 50, 75, 100)[i % 5]
+            tasks.append(Task(
+                id=i,
+                title=f"Task {i}",
+                description="Benchmark task",
+                assigned_to=interns[i % len(interns)],
+                due_date=date.today() + timedelta(days=i % 30),
+                priority=("LOW", "MEDIUM", "HIGH")[i % 3],
+                status="COMPLETED" if progress == 100 else "IN_PROGRESS",
+                progress=progress,
+                is_started=progress > 0,
+                started_at=now if progress else None,
+                completed_at=now if progress == 100 else None,
+                created_at=now,
+                updated_at=now,
+            ))
+        rows = [self._row(task) for task in tasks]
+        return tasks, rows
+
+    def _row(self, task):
+        user = task.assigned_to.user
+        values = {
+            "assigned_to__user__first_name": user.first_name,
+            "assigned_to__user__last_name": user.last_name,
+            "assigned_to__user__email": user.email,
+        }
+        return {field: values[field] if field in values else getattr(task, field) for field in TASK_READ_FIELDS}
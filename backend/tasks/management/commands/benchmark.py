@@ -0,0 +1,245 @@
+"""Benchmark the main endpoints in-process and store the results as JSON.
+
+Generate a dataset first, then run the suite once per database you want to
+compare, pointing Django at each one::
+
+    python manage.py generate_dataset --interns 1000 --tasks-per-intern 50
+    python manage.py benchmark --output benchmarks/sqlite.json
+    python manage.py benchmark --compare benchmarks/sqlite.json
+
+Requests go through the full Django stack (middleware, JWT authentication,
+views, rendering) with the test client, one at a time, so the numbers are
+per-request cost without network or server overhead; use
+``loadtest_read_views`` for concurrency. ``task_interaction`` writes to the
+dataset's tasks, so run it against a benchmark database only.
+
+Connections are released after each request as a server does, so the
+``CONN_MAX_AGE`` and pool settings (``DB_*`` environment variables) apply.
+``health`` (``GET /`` with the ``METRICS_TOKEN``, a single ``SELECT 1``) is
+cheap enough that its latency is mostly connection overhead; without a token
+(and with ``DEBUG`` off) ``/`` answers from its cached probe instead. Compare
+it across settings::
+
+    DB_CONN_MAX_AGE=0 python manage.py benchmark --output benchmarks/reconnect.json
+    DB_CONN_MAX_AGE=60 python manage.py benchmark --compare benchmarks/reconnect.json
+    DB_POOL_MAX_SIZE=4 python manage.py benchmark --compare benchmarks/reconnect.json
+
+Each result file records the commit, database and dataset size next to the
+p50/p99 latency, requests/s and rows/s of every scenario, so files from
+different commits can be compared with ``--compare``.
+"""
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+from django.test import Client
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from interns.cache import invalidate_dashboard
+from tasks.models import Task
+from users.models import User
+
+
+SCENARIOS = ["health", "tasks", "interns_with_progress", "task_interaction", "login"]
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _database():
+    connection.ensure_connection()
+    version = getattr(connection, "pg_version", None) or getattr(connection.Database, "sqlite_version", None)
+    return {
+        "vendor": connection.vendor,
+        "version": str(version or ""),
+        "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+        "pool": connection.settings_dict["OPTIONS"].get("pool"),
+    }
+
+
+class Scenarios:
+    """One method per scenario, each returning ``(response, rows)`` for one request.
+
+    An optional ``prepare_<scenario>`` method runs before each request,
+    outside the timed section.
+    """
+
+    def __init__(self, domain, password):
+        self.client = Client()
+        self.password = password
+        self.admin = User.objects.filter(email=f"admin@{domain}").first()
+        self.intern = User.objects.filter(email=f"intern0@{domain}").first()
+        if self.admin is None or self.intern is None:
+            raise CommandError(f"No dataset for @{domain}; run generate_dataset first.")
+        self.admin_auth = f"Bearer {AccessToken.for_user(self.admin)}"
+        self.intern_auth = f"Bearer {AccessToken.for_user(self.intern)}"
+        task_ids = list(Task.objects.filter(assigned_to_id=self.intern.pk).values_list("id", flat=True)[:50])
+        if not task_ids:
+            raise CommandError(f"{self.intern.email} has no tasks; generate with --tasks-per-intern > 0.")
+        self.interactions = itertools.cycle(itertools.product(task_ids, [25, 50, 75]))
+
+    def health(self):
+        # The token gets a fresh probe rather than the anonymous cached status.
+        return self.client.get("/", HTTP_AUTHORIZATION=f"Bearer {settings.METRICS_TOKEN}"), 1
+
+    def tasks(self):
+        response = self.client.get("/api/tasks/", {"page_size": 100}, HTTP_AUTHORIZATION=self.admin_auth)
+        return response, len(response.json()["results"])
+
+    def prepare_interns_with_progress(self):
+        # Measure the database path, not the dashboard cache. Outside a
+        # transaction the new generation takes effect immediately.
+        invalidate_dashboard()
+
+    def interns_with_progress(self):
+        response = self.client.get("/api/interns/with-progress/", HTTP_AUTHORIZATION=self.admin_auth)
+        return response, len(response.json()["results"])
+
+    def task_interaction(self):
+        task_id, progress = next(self.interactions)
+        response = self.client.post(
+            f"/api/tasks/{task_id}/interact/", {"action": "update_progress", "progress": progress},
+            content_type="application/json", HTTP_AUTHORIZATION=self.intern_auth,
+        )
+        return response, 1
+
+    def login(self):
+        response = self.client.post(
+            "/api/users/login/", {"email": self.intern.email, "password": self.password},
+            content_type="application/json",
+        )
+        return response, 1
+
+
+def _release_connections():
+    # The test client keeps connections open; close or return them the way
+    # request_finished does under a server. Not inside a transaction (tests).
+    if not connection.in_atomic_block:
+        close_old_connections()
+
+
+def run_scenario(fn, requests, warmup, prepare=None):
+    prepare = prepare or (lambda: None)
+    for _ in range(warmup):
+        prepare()
+        fn()
+        _release_connections()
+    latencies, rows, errors = [], 0, 0
+    for _ in range(requests):
+        prepare()
+        request_started = time.perf_counter()
+        response, count = fn()
+        _release_connections()
+        latencies.append(time.perf_counter() - request_started)
+        if response.status_code >= 400:
+            errors += 1
+        else:
+            rows += count
+    # Throughput over the timed requests only, without prepare().
+    elapsed = sum(latencies)
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "requests_per_sec": round(requests / elapsed, 1),
+        "rows_per_sec": round(rows / elapsed, 1),
+    }
+
+
+def _change(old, new):
+    return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure p50/p99 latency and rows/s of the health check, task list, intern progress "
+        "list, task interaction and login on the configured database; write the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scenario", action="append", choices=SCENARIOS, dest="scenarios")
+        parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario.")
+        parser.add_argument("--warmup", type=int, default=10)
+        parser.add_argument("--domain", default="bench.example.com", help="Email domain of the generated dataset.")
+        parser.add_argument("--password", default="bench-password")
+        parser.add_argument("--output", help="Result file (default: benchmarks/<date>-<commit>-<vendor>.json).")
+        parser.add_argument("--compare", help="Earlier result file to compare against.")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1.")
+        scenarios = Scenarios(options["domain"], options["password"])
+        report = {
+            "timestamp": timezone.now().isoformat(),
+            "commit": _commit(),
+            "database": _database(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "dataset": {
+                "interns": User.objects.filter(email__endswith=f"@{options['domain']}", role="INTERN").count(),
+                "tasks": Task.objects.filter(assigned_to__user__email__endswith=f"@{options['domain']}").count(),
+            },
+            "scenarios": {},
+        }
+
+        database = report["database"]
+        self.stdout.write(
+            f"{database['vendor']} {database['version']}, conn_max_age {database['conn_max_age']}, "
+            f"pool {database['pool']}"
+        )
+        for name in options["scenarios"] or SCENARIOS:
+            result = run_scenario(
+                getattr(scenarios, name), options["requests"], options["warmup"],
+                prepare=getattr(scenarios, f"prepare_{name}", None),
+            )
+            report["scenarios"][name] = result
+            self.stdout.write(
+                f"{name:<22} p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  "
+                f"{result['requests_per_sec']:>8,.0f} req/s  {result['rows_per_sec']:>10,.0f} rows/s"
+                + (f"  errors {result['errors']}" if result["errors"] else "")
+            )
+
+        if options["compare"]:
+            try:
+                baseline = json.loads(Path(options["compare"]).read_text())
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read {options['compare']}: {exc}") from exc
+            old_db = baseline.get("database", {})
+            self.stdout.write(
+                f"Compared with {baseline.get('commit')} on {old_db.get('vendor')} "
+                f"(conn_max_age {old_db.get('conn_max_age')}, pool {old_db.get('pool')}):"
+            )
+            for name, result in report["scenarios"].items():
+                old = baseline.get("scenarios", {}).get(name)
+                if old:
+                    self.stdout.write(
+                        f"{name:<22} p50 {_change(old['p50_ms'], result['p50_ms']):>8}  "
+                        f"p99 {_change(old['p99_ms'], result['p99_ms']):>8}  "
+                        f"rows/s {_change(old['rows_per_sec'], result['rows_per_sec']):>8}"
+                    )
+
+        output = Path(options["output"] or Path(settings.BASE_DIR) / "benchmarks" / (
+            f"{timezone.now():%Y%m%d-%H%M%S}-{report['commit']}-{report['database']['vendor']}.json"
+        ))
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}"))
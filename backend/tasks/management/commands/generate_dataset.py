@@ -0,0 +1,151 @@
+"""Generate a synthetic dataset for benchmarks and load tests.
+
+    python manage.py generate_dataset --interns 1000 --tasks-per-intern 50
+
+Interns get ``intern<N>@<domain>`` emails, one shared password and a
+department out of ``--departments``; their tasks get a progress drawn from
+``--progress`` (``value:weight`` pairs), timestamps consistent with it and
+due dates spread over ``--due-window``. Everything is written with
+``bulk_create`` in chunks, then the task counters are rebuilt. ``--clear``
+first deletes users of the same email domain.
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from interns.cache import invalidate_dashboard
+from interns.models import InternProfile
+from tasks.models import Task
+from users.models import User
+
+
+CHUNK_SIZE = 1000
+DEPARTMENT_NAMES = [
+    "Engineering", "Design", "Marketing", "Sales", "Finance",
+    "Operations", "Support", "Research", "Legal", "People",
+]
+TITLE_VERBS = ["Review", "Draft", "Update", "Prepare", "Analyse", "Test", "Document"]
+TITLE_NOUNS = ["report", "proposal", "dashboard", "onboarding", "release", "budget", "survey"]
+
+
+def parse_distribution(value):
+    """Parse ``"0:40,50:30,100:30"`` into ``([0, 50, 100], [40, 30, 30])``."""
+    choices = {progress for progress, _ in Task.PROGRESS_CHOICES}
+    values, weights = [], []
+    try:
+        for item in value.split(","):
+            progress, weight = item.split(":")
+            values.append(int(progress))
+            weights.append(float(weight))
+    except ValueError:
+        raise CommandError(f"Expected value:weight pairs, got {value!r}.") from None
+    if any(progress not in choices for progress in values) or sum(weights) <= 0:
+        raise CommandError(f"Progress values must be among {sorted(choices)} with positive weights.")
+    return values, weights
+
+
+def build_task(rng, intern_id, progress, now, due_window):
+    created_at = now - timedelta(days=rng.uniform(0, 90))
+    task = Task(
+        title=f"{rng.choice(TITLE_VERBS)} {rng.choice(TITLE_NOUNS)}",
+        description="Generated task.",
+        assigned_to_id=intern_id,
+        due_date=(now + timedelta(days=rng.randint(*due_window))).date(),
+        priority=rng.choice(["LOW", "MEDIUM", "HIGH"]),
+        progress=progress,
+        is_started=progress > 0,
+        status="COMPLETED" if progress == 100 else "IN_PROGRESS",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    if progress > 0:
+        task.started_at = created_at + (now - created_at) * rng.uniform(0, 0.5)
+        task.updated_at = task.started_at
+    if progress == 100:
+        task.completed_at = task.started_at + (now - task.started_at) * rng.uniform(0, 1)
+        task.updated_at = task.completed_at
+    return task
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic interns and tasks with bulk_create for benchmarking."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interns", type=int, default=1000)
+        parser.add_argument("--tasks-per-intern", type=int, default=20)
+        parser.add_argument("--departments", type=int, default=8, help=f"1-{len(DEPARTMENT_NAMES)}.")
+        parser.add_argument(
+            "--progress", default="0:35,25:15,50:15,75:10,100:25",
+            help="Progress distribution as value:weight pairs.",
+        )
+        parser.add_argument(
+            "--due-window", type=int, nargs=2, default=[-30, 60], metavar=("FROM", "TO"),
+            help="Due dates fall between these many days from today.",
+        )
+        parser.add_argument("--domain", default="bench.example.com")
+        parser.add_argument("--password", default="bench-password")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--clear", action="store_true", help="Delete existing users of --domain first.")
+
+    def handle(self, *args, **options):
+        if not 1 <= options["departments"] <= len(DEPARTMENT_NAMES):
+            raise CommandError(f"--departments must be between 1 and {len(DEPARTMENT_NAMES)}.")
+        progress_values, progress_weights = parse_distribution(options["progress"])
+        domain = options["domain"]
+        rng = random.Random(options["seed"])
+        now = timezone.now()
+
+        if options["clear"]:
+            deleted, _ = User.objects.filter(email__endswith=f"@{domain}").delete()
+            self.stdout.write(f"Deleted {deleted} existing rows for @{domain}.")
+        elif User.objects.filter(email__endswith=f"@{domain}").exists():
+            raise CommandError(f"Users @{domain} already exist; pass --clear or another --domain.")
+
+        # One hash for everyone: hashing per user would dominate the run.
+        password = make_password(options["password"])
+        departments = DEPARTMENT_NAMES[:options["departments"]]
+        tasks_created = 0
+
+        for start in range(0, options["interns"], CHUNK_SIZE):
+            count = min(CHUNK_SIZE, options["interns"] - start)
+            with transaction.atomic():
+                users = User.objects.bulk_create([
+                    User(email=f"intern{start + i}@{domain}", first_name="Intern", last_name=str(start + i),
+                         password=password, role="INTERN")
+                    for i in range(count)
+                ])
+                InternProfile.objects.bulk_create([
+                    InternProfile(user_id=user.pk, department=rng.choice(departments), status="Active")
+                    for user in users
+                ])
+                tasks = [
+                    build_task(rng, user.pk, progress, now, options["due_window"])
+                    for user in users
+                    for progress in rng.choices(progress_values, progress_weights, k=options["tasks_per_intern"])
+                ]
+                for offset in range(0, len(tasks), CHUNK_SIZE):
+                    batch = tasks[offset:offset + CHUNK_SIZE]
+                    # bulk_create applies auto_now(_add); restore the generated history.
+                    history = [(task.created_at, task.updated_at) for task in batch]
+                    Task.objects.bulk_create(batch)
+                    for task, (created_at, updated_at) in zip(batch, history):
+                        task.created_at, task.updated_at = created_at, updated_at
+                    Task.objects.bulk_update(batch, ["created_at", "updated_at"])
+                tasks_created += len(tasks)
+            self.stdout.write(f"  {start + count} interns, {tasks_created} tasks")
+
+        User.objects.get_or_create(email=f"admin@{domain}", defaults={"password": password, "role": "ADMIN"})
+        # bulk_create skips the signals that maintain the counters.
+        call_command("rebuild_task_counters", stdout=self.stdout)
+        # The rebuild only invalidates interns whose counters changed; the
+        # bulk-created interns themselves also need the admin list refreshed.
+        invalidate_dashboard()
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {options['interns']} interns and {tasks_created} tasks; "
+            f"log in as admin@{domain} or intern0@{domain} with password {options['password']!r}."
+        ))
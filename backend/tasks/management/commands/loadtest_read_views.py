@@ -0,0 +1,150 @@
+"""Compare read-endpoint throughput of running servers, e.g. WSGI against ASGI.
+
+Start both servers on the same database, then point this command at them::
+
+    gunicorn backend.wsgi -w 4 --threads 8 -b 127.0.0.1:8000
+    uvicorn backend.asgi:application --workers 4 --port 8001
+    python manage.py loadtest_read_views wsgi=http://127.0.0.1:8000 asgi=http://127.0.0.1:8001
+
+Each simulated client keeps one connection open (reconnecting when the server
+closes it) and cycles through the read paths as fast as responses arrive.
+"""
+import asyncio
+import statistics
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.models import User
+
+
+READ_PATHS = ["/api/tasks/", "/api/interns/", "/api/users/me/"]
+
+
+async def _read_response(reader):
+    status = int((await reader.readuntil(b"\r\n")).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    else:
+        await reader.read()
+        return status, False
+    return status, headers.get("connection") != "close"
+
+
+async def _client(host, port, requests, deadline, latencies, errors):
+    reader = writer = None
+    sent = 0
+    while time.perf_counter() < deadline:
+        if writer is None:
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+            except OSError:
+                errors["connect"] += 1
+                await asyncio.sleep(0.05)
+                continue
+        request = requests[sent % len(requests)]
+        sent += 1
+        started = time.perf_counter()
+        try:
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await _read_response(reader)
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            errors["io"] += 1
+            writer.close()
+            writer = None
+            continue
+        latencies.append(time.perf_counter() - started)
+        if status != 200:
+            errors[status] += 1
+        if not keep_alive:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def _run(url, paths, token, concurrency, duration):
+    parts = urlsplit(url)
+    if parts.scheme != "http" or not parts.hostname:
+        raise CommandError(f"Only plain http:// targets are supported, got {url!r}.")
+    host, port = parts.hostname, parts.port or 80
+    requests = [
+        (
+            f"GET {parts.path.rstrip('/')}{path} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            f"Authorization: Bearer {token}\r\n"
+            "Accept: application/json\r\n"
+            "\r\n"
+        ).encode()
+        for path in paths
+    ]
+    latencies, errors = [], Counter()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _client(host, port, requests[i % len(requests):] + requests[:i % len(requests)], deadline, latencies, errors)
+        for i in range(concurrency)
+    ))
+    return latencies, errors, time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the task list, intern list and users/me read paths of one or more "
+        "running servers with many concurrent keep-alive clients."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("targets", nargs="+", metavar="NAME=URL")
+        parser.add_argument("--concurrency", type=int, default=500)
+        parser.add_argument("--duration", type=float, default=20.0, help="Seconds per target.")
+        parser.add_argument("--path", action="append", dest="paths", help=f"Default: {' '.join(READ_PATHS)}")
+        parser.add_argument("--email", help="User to authenticate as (default: the first admin).")
+
+    def handle(self, *args, **options):
+        targets = []
+        for target in options["targets"]:
+            name, sep, url = target.partition("=")
+            if not sep:
+                raise CommandError(f"Expected NAME=URL, got {target!r}.")
+            targets.append((name, url))
+
+        users = User.objects.filter(email=options["email"]) if options["email"] else User.objects.filter(role="ADMIN")
+        user = users.order_by("id").first()
+        if user is None:
+            raise CommandError("No user to authenticate as; pass --email.")
+        token = str(AccessToken.for_user(user))
+        paths = options["paths"] or READ_PATHS
+
+        for name, url in targets:
+            latencies, errors, elapsed = asyncio.run(
+                _run(url, paths, token, options["concurrency"], options["duration"])
+            )
+            if len(latencies) < 2:
+                self.stdout.write(f"{name:<8} no responses ({dict(errors)})")
+                continue
+            cuts = statistics.quantiles(latencies, n=100)
+            self.stdout.write(
+                f"{name:<8} {len(latencies) / elapsed:>9,.0f} req/s  "
+                f"p50 {cuts[49] * 1000:>7.1f} ms  p95 {cuts[94] * 1000:>7.1f} ms  "
+                f"p99 {cuts[98] * 1000:>7.1f} ms  errors {sum(errors.values())}"
+                + (f" {dict(errors)}" if errors else "")
+            )
@@ -0,0 +1,85 @@
+"""Send every intern a digest of their overdue and due-soon tasks, and every
+admin a summary across interns. Schedule it daily, e.g.::
+
+    python manage.py task_digest --send
+
+Without ``--send`` the digests are only printed.
+"""
+from django.conf import settings
+from django.core.mail import send_mass_mail
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from tasks.overdue import build_digests
+from users.models import User
+
+
+USER_CHUNK_SIZE = 1000
+
+
+def _users_by_id(user_ids):
+    user_ids = list(user_ids)
+    users = {}
+    for start in range(0, len(user_ids), USER_CHUNK_SIZE):
+        chunk = user_ids[start:start + USER_CHUNK_SIZE]
+        users.update((user.pk, user) for user in User.objects.filter(pk__in=chunk).only("email", "first_name", "last_name"))
+    return users
+
+
+def _task_lines(title, rows, total):
+    lines = [f"{title} ({total}):"]
+    lines += [f"  - {row['title']} (due {row['due_date']:%Y-%m-%d}, {row['priority'].lower()} priority)" for row in rows]
+    if total > len(rows):
+        lines.append(f"  ... and {total - len(rows)} more")
+    return lines
+
+
+def _name(user):
+    return f"{user.first_name} {user.last_name}".strip() or user.email
+
+
+class Command(BaseCommand):
+    help = "Build overdue and due-soon task digests per intern and admin, and optionally email them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.TASK_DUE_SOON_DAYS, help="Due-soon horizon in days.")
+        parser.add_argument("--batch-size", type=int, default=settings.TASK_DIGEST_BATCH_SIZE)
+        parser.add_argument("--send", action="store_true", help="Email the digests instead of printing them.")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        digests, summary = build_digests(today=today, days=options["days"], batch_size=options["batch_size"])
+        users = _users_by_id(digests)
+        subject = f"Task digest for {today:%Y-%m-%d}"
+
+        messages = []
+        for intern_id, digest in sorted(digests.items()):
+            user = users.get(intern_id)
+            if user is None or not user.email:
+                continue
+            body = [f"Hi {user.first_name or user.email},", ""]
+            if digest["overdue_count"]:
+                body += _task_lines("Overdue", digest["overdue"], digest["overdue_count"]) + [""]
+            if digest["due_soon_count"]:
+                body += _task_lines(f"Due within {options['days']} days", digest["due_soon"], digest["due_soon_count"])
+            messages.append((subject, "\n".join(body), None, [user.email]))
+
+        if summary["interns"]:
+            body = [f"{summary['overdue_count']} overdue and {summary['due_soon_count']} due-soon tasks.", ""]
+            body += [
+                f"  - {_name(users[row['intern_id']]) if row['intern_id'] in users else row['intern_id']}: "
+                f"{row['overdue_count']} overdue, {row['due_soon_count']} due soon"
+                for row in summary["interns"][:settings.TASK_DIGEST_MAX_ITEMS]
+            ]
+            if len(summary["interns"]) > settings.TASK_DIGEST_MAX_ITEMS:
+                body.append(f"  ... and {len(summary['interns']) - settings.TASK_DIGEST_MAX_ITEMS} more interns")
+            admin_emails = User.objects.filter(role="ADMIN").exclude(email="").values_list("email", flat=True)
+            messages += [(subject, "\n".join(body), None, [email]) for email in admin_emails]
+
+        if options["send"]:
+            sent = send_mass_mail(messages, fail_silently=False)
+            self.stdout.write(self.style.SUCCESS(f"Sent {sent} digests."))
+            return
+        for _, body, _, recipients in messages:
+            self.stdout.write(f"To: {recipients[0]}\n{body}\n")
+        self.stdout.write(self.style.SUCCESS(f"Built {len(messages)} digests."))
@@ -1,9 +1,32 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import models, transaction
 from django.conf import settings
 from django.utils import timezone
 from interns.models import InternProfile
 
 
+# Task search document; tasks.filters queries with this exact expression so
+# PostgreSQL can use the GIN index built on it.
+TASK_SEARCH_CONFIG = "english"
+TASK_SEARCH_VECTOR = SearchVector("title", "description", config=TASK_SEARCH_CONFIG)
+
+
+class TaskQuerySet(models.QuerySet):
+    def visible_to(self, user):
+        """Tasks ``user`` may see and act on: all for admins, otherwise their own.
+
+        Interns are matched on ``assigned_to_id`` (an intern profile's primary
+        key is its user id), so the filter needs no join and uses the
+        assignee indexes.
+        """
+        if getattr(user, "role", None) == "ADMIN":
+            return self.all()
+        if user is None or not user.is_authenticated:
+            return self.none()
+        return self.filter(assigned_to_id=user.pk)
+
+
 class Task(models.Model):
     PRIORITY_CHOICES = [
         ("LOW", "Low"),
@@ -58,20 +81,66 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def save(self, *args, **kwargs):
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        # Composite indexes follow the real query shapes: interns list their
+        # own tasks newest first, the admin list pages on (created_at, id),
+        # dashboards bucket by status/progress and overdue checks scan only
+        # open tasks by due date.
+        indexes = [
+            models.Index(fields=["assigned_to", "-created_at", "-id"], name="task_assignee_created_idx"),
+            models.Index(fields=["assigned_to", "status"], name="task_assignee_status_idx"),
+            models.Index(fields=["-created_at", "-id"], name="task_created_idx"),
+            models.Index(fields=["status", "progress"], name="task_status_progress_idx"),
+            models.Index(fields=["due_date", "status"], name="task_due_status_idx"),
+            models.Index(
+                fields=["due_date"],
+                condition=~models.Q(status="COMPLETED"),
+                name="task_open_due_idx",
+            ),
+            models.Index(fields=["started_at"], name="task_started_at_idx"),
+            models.Index(fields=["completed_at"], name="task_completed_at_idx"),
+            # Delta sync (/api/tasks/changes/) walks (updated_at, id).
+            models.Index(fields=["updated_at", "id"], name="task_updated_idx"),
+            models.Index(fields=["assigned_to", "updated_at", "id"], name="task_assignee_updated_idx"),
+            # Full-text search (tasks.filters.search_tasks); created on PostgreSQL only.
+            GinIndex(TASK_SEARCH_VECTOR, name="task_search_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the original assignee so a reassignment can refresh the
+        # counters of both the old and the new intern.
+        instance._loaded_assigned_to_id = instance.__dict__.get("assigned_to_id")
+        return instance
+
+    def apply_progress_rules(self, now=None):
+        """Derive timestamps and status from ``is_started``/``progress``.
+
+        Called by ``save()``; bulk paths that skip ``save()`` call it directly.
+        """
+        now = now or timezone.now()
         # Set started_at when task is first marked as started
         if self.is_started and not self.started_at:
-            self.started_at = timezone.now()
-        
+            self.started_at = now
+
         # Set completed_at when progress reaches 100%
         if self.progress == 100 and not self.completed_at:
-            self.completed_at = timezone.now()
+            self.completed_at = now
             self.status = "COMPLETED"
         elif self.progress < 100 and self.status == "COMPLETED":
             self.status = "IN_PROGRESS"
             self.completed_at = None
-            
-        super().save(*args, **kwargs)
+
+    def save(self, *args, **kwargs):
+        self.apply_progress_rules()
+
+        # post_save refreshes the intern counters; keep both writes atomic.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self._loaded_assigned_to_id = self.assigned_to_id
 
     def __str__(self) -> str:
         try:
@@ -79,3 +148,33 @@ class Task(models.Model):
         except Exception:
             return f"Task(title={self.title})"
 
+
+
+class TaskTombstone(models.Model):
+    """A task leaving someone's view, reported by ``/api/tasks/changes/``.
+
+    ``DELETED`` is recorded when a task is deleted, ``REASSIGNED`` (for the
+    previous assignee only) when it moves to another intern. Plain integer
+    columns, not foreign keys: the task is gone and the intern may be too.
+    """
+
+    DELETED = "DELETED"
+    REASSIGNED = "REASSIGNED"
+    REASON_CHOICES = [
+        (DELETED, "Deleted"),
+        (REASSIGNED, "Reassigned"),
+    ]
+
+    task_id = models.BigIntegerField()
+    intern_id = models.BigIntegerField(null=True)
+    reason = models.CharField(max_length=10, choices=REASON_CHOICES, default=DELETED)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["deleted_at"], name="tombstone_deleted_at_idx"),
+            models.Index(fields=["intern_id", "deleted_at"], name="tombstone_intern_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"TaskTombstone(task_id={self.task_id}, reason={self.reason})"
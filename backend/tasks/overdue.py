@@ -0,0 +1,133 @@
+"""Overdue and due-soon task detection.
+
+A task is overdue once its due date has passed without it being completed,
+and due soon while it is open and due within ``TASK_DUE_SOON_DAYS``. Every
+query here filters open tasks by ``due_date``, which the partial
+``task_open_due_idx`` index covers, so neither the list filters nor the
+digest scan touch completed tasks.
+
+``build_digests`` walks the open tasks due up to the horizon in keyset
+batches of ``(due_date, id)`` and keeps only per-intern counters plus the
+first few tasks of each intern, so memory stays bounded on large tables.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from .models import Task
+
+
+DIGEST_FIELDS = ["id", "title", "due_date", "priority", "progress", "assigned_to_id"]
+
+
+def open_tasks(queryset=None):
+    queryset = Task.objects.all() if queryset is None else queryset
+    return queryset.exclude(status="COMPLETED")
+
+
+def overdue_tasks(queryset=None, today=None):
+    today = today or timezone.localdate()
+    return open_tasks(queryset).filter(due_date__lt=today)
+
+
+def due_soon_tasks(queryset=None, today=None, days=None):
+    """Open tasks due from ``today`` up to ``days`` days ahead (inclusive)."""
+    today = today or timezone.localdate()
+    days = settings.TASK_DUE_SOON_DAYS if days is None else days
+    return open_tasks(queryset).filter(due_date__gte=today, due_date__lte=today + timedelta(days=days))
+
+
+def date_param(params, name):
+    """Return ``?name=`` parsed as a date, None if absent; raise ``ValidationError`` if malformed."""
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ValidationError({name: ["Enter a date as YYYY-MM-DD."]})
+    return day
+
+
+def filter_due(queryset, params, today=None):
+    """Apply the task list's ``?overdue=`` and ``?due_before=`` filters.
+
+    ``overdue=1`` keeps overdue tasks and ``overdue=0`` everything else;
+    ``due_before=YYYY-MM-DD`` keeps tasks due strictly before that date.
+    Raises ``ValidationError`` on malformed values.
+    """
+    today = today or timezone.localdate()
+    overdue = params.get("overdue")
+    if overdue:
+        if overdue not in ("0", "1", "true", "false"):
+            raise ValidationError({"overdue": ["Use 1 or 0."]})
+        if overdue in ("1", "true"):
+            queryset = overdue_tasks(queryset, today)
+        else:
+            queryset = queryset.filter(Q(status="COMPLETED") | Q(due_date__gte=today))
+    due_before = date_param(params, "due_before")
+    if due_before:
+        queryset = queryset.filter(due_date__lt=due_before)
+    return queryset
+
+
+def iter_due_batches(horizon, batch_size=None):
+    """Yield lists of open tasks due on or before ``horizon`` in ``(due_date, id)`` order."""
+    batch_size = batch_size or settings.TASK_DIGEST_BATCH_SIZE
+    tasks = open_tasks().filter(due_date__lte=horizon).order_by("due_date", "id")
+    last = None
+    while True:
+        batch = tasks
+        if last is not None:
+            batch = batch.filter(Q(due_date__gt=last[0]) | Q(due_date=last[0], id__gt=last[1]))
+        rows = list(batch.values(*DIGEST_FIELDS)[:batch_size])
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        last = rows[-1]["due_date"], rows[-1]["id"]
+
+
+def _new_digest():
+    return {"overdue_count": 0, "due_soon_count": 0, "overdue": [], "due_soon": []}
+
+
+def build_digests(today=None, days=None, batch_size=None, max_items=None):
+    """Return ``(intern_digests, admin_digest)`` for the overdue and due-soon tasks.
+
+    ``intern_digests`` maps intern id to its counts and first ``max_items``
+    overdue and due-soon tasks (most overdue first). ``admin_digest`` holds
+    the totals and per-intern counts, worst first.
+    """
+    today = today or timezone.localdate()
+    days = settings.TASK_DUE_SOON_DAYS if days is None else days
+    max_items = settings.TASK_DIGEST_MAX_ITEMS if max_items is None else max_items
+
+    digests = defaultdict(_new_digest)
+    for rows in iter_due_batches(today + timedelta(days=days), batch_size):
+        for row in rows:
+            kind = "overdue" if row["due_date"] < today else "due_soon"
+            digest = digests[row["assigned_to_id"]]
+            digest[f"{kind}_count"] += 1
+            if len(digest[kind]) < max_items:
+                digest[kind].append(row)
+
+    interns = sorted(
+        ({"intern_id": intern_id, "overdue_count": d["overdue_count"], "due_soon_count": d["due_soon_count"]}
+         for intern_id, d in digests.items()),
+        key=lambda row: (-row["overdue_count"], -row["due_soon_count"], row["intern_id"]),
+    )
+    admin_digest = {
+        "overdue_count": sum(row["overdue_count"] for row in interns),
+        "due_soon_count": sum(row["due_soon_count"] for row in interns),
+        "interns": interns,
+    }
+    return dict(digests), admin_digest
@@ -1,11 +1,18 @@
 from rest_framework import serializers
+from rest_framework.settings import ISO_8601, api_settings
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from interns.models import InternProfile
 from .models import Task
 
 
 User = get_user_model()
 
+PRIORITY_DISPLAY = dict(Task.PRIORITY_CHOICES)
+STATUS_DISPLAY = dict(Task.STATUS_CHOICES)
+PROGRESS_OPTIONS = dict(Task.PROGRESS_CHOICES)
+
 
 class TaskSerializer(serializers.ModelSerializer):
     assigned_to_user_id = serializers.IntegerField(write_only=True)
@@ -75,18 +82,23 @@ class TaskSerializer(serializers.ModelSerializer):
         return name or user.email
 
     def get_priority_display(self, obj) -> str:
-        mapping = {"LOW": "Low", "MEDIUM": "Medium", "HIGH": "High"}
-        return mapping.get(obj.priority, obj.priority)
+        return PRIORITY_DISPLAY.get(obj.priority, obj.priority)
 
     def get_status_display(self, obj) -> str:
-        mapping = {"IN_PROGRESS": "In Progress", "COMPLETED": "Completed"}
-        return mapping.get(obj.status, obj.status)
-        
+        return STATUS_DISPLAY.get(obj.status, obj.status)
+
     def get_progress_options(self, obj):
-        return dict(Task.PROGRESS_CHOICES)
+        return dict(PROGRESS_OPTIONS)
 
     def validate_assigned_to_user_id(self, user_id: int) -> int:
-        if not InternProfile.objects.filter(user_id=user_id).exists():
+        # Bulk callers resolve every id with one IN query and pass the result in
+        # ``valid_intern_ids`` so validation does not query once per item.
+        valid_ids = self.context.get("valid_intern_ids")
+        if valid_ids is not None:
+            exists = user_id in valid_ids
+        else:
+            exists = InternProfile.objects.filter(user_id=user_id).exists()
+        if not exists:
             raise serializers.ValidationError("Invalid intern user id")
         return user_id
 
@@ -119,7 +131,78 @@ class TaskSerializer(serializers.ModelSerializer):
         ret.pop("status_display", None)
         ret.pop("due_date", None)
         return ret
-    
-
 
 
+# Read-only fast path for list traffic. Rows are projected with
+# ``Task.objects.values(*TASK_READ_FIELDS)`` and rendered straight into the
+# dict TaskSerializer.to_representation produces, without building model
+# instances or running the field machinery per row.
+TASK_READ_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "due_date",
+    "priority",
+    "status",
+    "progress",
+    "assigned_to__user__first_name",
+    "assigned_to__user__last_name",
+    "assigned_to__user__email",
+    "started_at",
+    "completed_at",
+    "is_started",
+    "created_at",
+    "updated_at",
+)
+
+def _datetime_formatter():
+    """Return a callable formatting datetimes exactly like ``DateTimeField``.
+
+    The current timezone is resolved once per call instead of once per value,
+    which is where ``DateTimeField.to_representation`` spends most of its time.
+    """
+    field = serializers.DateTimeField()
+    output_format = api_settings.DATETIME_FORMAT
+    if not settings.USE_TZ or output_format is None or output_format.lower() != ISO_8601:
+        return lambda value: None if value is None else field.to_representation(value)
+
+    tz = timezone.get_current_timezone()
+
+    def format_datetime(value):
+        if value is None:
+            return None
+        if timezone.is_naive(value):
+            return field.to_representation(value)
+        text = value.astimezone(tz).isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return format_datetime
+
+
+def task_rows_representation(rows) -> list:
+    """Render ``TASK_READ_FIELDS`` values() rows exactly like ``TaskSerializer``."""
+    format_datetime = _datetime_formatter()
+    result = []
+    for row in rows:
+        first_name = row["assigned_to__user__first_name"]
+        last_name = row["assigned_to__user__last_name"]
+        priority = row["priority"]
+        status = row["status"]
+        result.append({
+            "id": row["id"],
+            "title": row["title"],
+            "description": row["description"],
+            "dueDate": row["due_date"],
+            "priority": PRIORITY_DISPLAY.get(priority, priority),
+            "status": STATUS_DISPLAY.get(status, status),
+            "progress": row["progress"],
+            "assignedTo": f"{first_name} {last_name}".strip() or row["assigned_to__user__email"],
+            "started_at": format_datetime(row["started_at"]),
+            "completed_at": format_datetime(row["completed_at"]),
+            "is_started": row["is_started"],
+            # Shared across rows; renderers only read it.
+            "progress_options": PROGRESS_OPTIONS,
+            "created_at": format_datetime(row["created_at"]),
+            "updated_at": format_datetime(row["updated_at"]),
+        })
+    return result
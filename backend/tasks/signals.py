@@ -0,0 +1,65 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from interns.counters import refresh_task_counters
+from .events import TASK_CREATED, TASK_UPDATED, publish_tasks, publish_tasks_deleted
+from .models import Task, TaskTombstone
+
+
+@receiver(post_save, sender=Task)
+def refresh_counters_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_task_counters(
+        {instance.assigned_to_id, getattr(instance, "_loaded_assigned_to_id", None)}
+    )
+
+
+@receiver(post_save, sender=Task)
+def publish_event_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_loaded_assigned_to_id", None)
+    publish_tasks(TASK_CREATED if created else TASK_UPDATED, [instance.pk], {instance.pk: previous})
+
+
+@receiver(post_save, sender=Task)
+def record_reassignment(sender, instance, created, raw=False, **kwargs):
+    previous = getattr(instance, "_loaded_assigned_to_id", None)
+    if raw or created or previous is None or previous == instance.assigned_to_id:
+        return
+    TaskTombstone.objects.create(task_id=instance.pk, intern_id=previous, reason=TaskTombstone.REASSIGNED)
+
+
+# Deletes are handled per delete() call, not per row: a cascade (deleting an
+# intern, or a queryset of tasks) sends every pre_delete before the first
+# post_delete, so the batch is complete when the rows start disappearing and
+# is flushed after the last one with a fixed number of queries.
+
+@receiver(pre_delete, sender=Task)
+def collect_deletion(sender, instance, origin=None, **kwargs):
+    holder = instance if origin is None else origin
+    batch = holder.__dict__.setdefault("_task_delete_batch", {"pending": 0, "tasks": []})
+    batch["pending"] += 1
+    batch["tasks"].append((instance.pk, instance.assigned_to_id))
+    instance._task_delete_holder = holder
+
+
+@receiver(post_delete, sender=Task)
+def record_deletions(sender, instance, **kwargs):
+    holder = instance.__dict__.pop("_task_delete_holder", None)
+    batch = getattr(holder, "_task_delete_batch", None)
+    if batch is None:
+        return
+    batch["pending"] -= 1
+    if batch["pending"]:
+        return
+    del holder._task_delete_batch
+    deleted = batch["tasks"]
+    TaskTombstone.objects.bulk_create(
+        TaskTombstone(task_id=task_id, intern_id=intern_id) for task_id, intern_id in deleted
+    )
+    # Interns deleted in the same cascade still have their profile row here;
+    # it goes right after, so refreshing it is wasted but harmless.
+    refresh_task_counters({intern_id for _, intern_id in deleted})
+    publish_tasks_deleted(deleted)
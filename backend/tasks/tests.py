@@ -1,3 +1,984 @@
-from django.test import TestCase
+import base64
+import csv
+import io
+import json
+import logging
+import re
+import tempfile
+import threading
+from unittest import mock
+from datetime import date, timedelta
+from urllib.parse import parse_qsl, urlsplit
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from backend.async_api import split_read_view
+from interns.counters import task_counter_aggregates
+from interns.models import InternProfile
+from users.authentication import QueryToken
+from . import events
+from .events import AsyncSubscription, InProcessBroker, SyncSubscription
+from .models import Task, TaskTombstone
+from .overdue import build_digests
+from .serializers import TASK_READ_FIELDS, TaskSerializer, task_rows_representation
+from .views import TaskListCreateView, task_list_async
+
+
+User = get_user_model()
+
+
+class TaskListPaginationTests(TestCase):
+    url = "/api/tasks/"
+
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        intern_user = User.objects.create(email="intern@example.com", role="INTERN")
+        self.intern = InternProfile.objects.create(user=intern_user, department="Engineering")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _walk(self, page_size):
+        ids = []
+        response = self.client.get(self.url, {"page_size": page_size})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            ids.extend(row["id"] for row in body["results"])
+            if not body["next"]:
+                return ids
+            response = self.client.get(body["next"])
+
+    def test_pages_are_stable_when_created_at_ties(self):
+        tasks = [
+            Task.objects.create(title=f"t{i}", assigned_to=self.intern, due_date=date.today())
+            for i in range(7)
+        ]
+        # Force identical created_at values so ordering relies on the id tiebreaker.
+        Task.objects.update(created_at=tasks[0].created_at)
+        expected = sorted((task.id for task in tasks), reverse=True)
+        self.assertEqual(self._walk(page_size=3), expected)
+        self.assertEqual(self._walk(page_size=100), expected)
+
+    def _walk_ties(self, **params):
+        """Walk every page of 1500 rows tied on the leading ordering field.
+
+        1500 is more than CursorPagination's offset_cutoff, so this fails if
+        ties are paged by offset. Returns the ids and the last response body.
+        """
+        ids = []
+        response = self.client.get(self.url, {"page_size": 100, **params})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            ids.extend(row["id"] for row in body["results"])
+            if not body["next"]:
+                return ids, body
+            response = self.client.get(body["next"])
+
+    def _create_ties(self):
+        created_at = timezone.now()
+        Task.objects.bulk_create(
+            Task(title=f"t{i}", assigned_to=self.intern, due_date=date.today(), priority="HIGH")
+            for i in range(1500)
+        )
+        # bulk_create rows share a created_at in practice; make it exact.
+        Task.objects.update(created_at=created_at)
+        return sorted(Task.objects.values_list("id", flat=True), reverse=True)
+
+    def test_created_at_ties_beyond_the_offset_cutoff_page_by_id(self):
+        expected = self._create_ties()
+        ids, last = self._walk_ties()
+        self.assertEqual(ids, expected)
+        # Walking back from the last page returns the page before it.
+        back = self.client.get(last["previous"]).json()
+        self.assertEqual([row["id"] for row in back["results"]], ids[-200:-100])
+
+    def test_priority_and_due_date_ties_page_by_id(self):
+        expected = set(self._create_ties())
+        for ordering in ("priority", "-priority", "due_date", "-due_date"):
+            ids, _ = self._walk_ties(ordering=ordering)
+            self.assertEqual(len(ids), len(expected), ordering)
+            self.assertEqual(set(ids), expected, ordering)
+
+    def test_forged_cursor_is_not_found(self):
+        for cursor in ("not-base64!", "cD1bMV0=", "cD1bImEiLCJiIl0="):
+            response = self.client.get(self.url, {"cursor": cursor})
+            self.assertEqual(response.status_code, 404, cursor)
+
+
+class TaskExportTests(TestCase):
+    url = "/api/tasks/export/"
+
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.intern_user = User.objects.create(
+            email="intern@example.com", first_name="Ada", last_name="Lovelace", role="INTERN"
+        )
+        intern = InternProfile.objects.create(user=self.intern_user, department="Engineering")
+        other = InternProfile.objects.create(
+            user=User.objects.create(email="other@example.com", role="INTERN"), department="Design"
+        )
+        self.own = Task.objects.create(title="own", assigned_to=intern, due_date=date.today())
+        Task.objects.create(title="other", assigned_to=other, due_date=date.today())
+        self.client = APIClient()
+
+    def _export(self, user, **params):
+        self.client.force_authenticate(user)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_respects_intern_visibility(self):
+        rows = [json.loads(line) for line in self._export(self.intern_user).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.own.id])
+        self.assertEqual(rows[0]["assignedTo"], "Ada Lovelace")
+        self.assertEqual(rows[0]["assigned_to_user_id"], self.intern_user.id)
+
+    def test_csv_lists_all_tasks_for_admin(self):
+        rows = list(csv.DictReader(io.StringIO(self._export(self.admin, output="csv"))))
+        self.assertEqual([row["title"] for row in rows], ["own", "other"])
+        self.assertEqual(rows[0]["due_date"], date.today().isoformat())
+
+    def test_unknown_format_is_rejected(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(self.url, {"output": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskFastPathRepresentationTests(TestCase):
+    def test_matches_task_serializer_byte_for_byte(self):
+        named = InternProfile.objects.create(
+            user=User.objects.create(email="ada@example.com", first_name="Ada", last_name="Lovelace"),
+            department="Engineering",
+        )
+        unnamed = InternProfile.objects.create(
+            user=User.objects.create(email="anon@example.com"), department="Design"
+        )
+        Task.objects.create(title="fresh", assigned_to=named, due_date=date.today(), priority="LOW")
+        Task.objects.create(
+            title="done", description="x", assigned_to=unnamed, due_date=date.today(),
+            priority="HIGH", progress=100, is_started=True,
+        )
+        Task.objects.create(title="half", assigned_to=named, due_date=date.today(), progress=50)
+
+        qs = Task.objects.select_related("assigned_to__user").order_by("id")
+        renderer = JSONRenderer()
+        expected = renderer.render(TaskSerializer(qs, many=True).data)
+        actual = renderer.render(task_rows_representation(qs.values(*TASK_READ_FIELDS)))
+        self.assertEqual(actual, expected)
+
+
+class TaskBulkCreateTests(TestCase):
+    url = "/api/tasks/bulk/"
+
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.interns = [
+            InternProfile.objects.create(
+                user=User.objects.create(email=f"intern{i}@example.com", role="INTERN"),
+                department="Engineering",
+            )
+            for i in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_template_fans_out_to_cohort(self):
+        ids = [intern.user_id for intern in self.interns]
+        payload = {
+            "template": {"title": "Onboarding", "due_date": "2030-01-01", "priority": "HIGH", "progress": 100},
+            "assigned_to_user_ids": ids,
+        }
+        # Constant in the number of interns: one IN lookup, one INSERT, one counter refresh.
+        with self.assertNumQueries(10):
+            response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()), 3)
+
+        tasks = Task.objects.order_by("assigned_to_id")
+        self.assertEqual([task.assigned_to_id for task in tasks], ids)
+        for task in tasks:
+            self.assertEqual(task.priority, "HIGH")
+            self.assertEqual(task.status, "COMPLETED")
+            self.assertIsNotNone(task.completed_at)
+            self.assertEqual(task.assigned_by, self.admin)
+        self.interns[0].refresh_from_db()
+        self.assertEqual(self.interns[0].completed_task_count, 1)
+
+    def test_invalid_intern_rejects_whole_batch(self):
+        payload = {
+            "tasks": [
+                {"title": "ok", "due_date": "2030-01-01", "assigned_to_user_id": self.interns[0].user_id},
+                {"title": "bad", "due_date": "2030-01-01", "assigned_to_user_id": self.admin.id},
+            ]
+        }
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["tasks"][0], {})
+        self.assertIn("assigned_to_user_id", response.json()["tasks"][1])
+        self.assertFalse(Task.objects.exists())
+
+    def test_rejects_non_object_body(self):
+        response = self.client.post(self.url, [{"title": "a", "due_date": "2030-01-01"}], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.exists())
+
+    def test_interns_cannot_bulk_create(self):
+        self.client.force_authenticate(self.interns[0].user)
+        response = self.client.post(self.url, {"tasks": []}, format="json")
+        self.assertEqual(response.status_code, 403)
+
+
+class TaskInteractionBulkTests(TestCase):
+    url = "/api/tasks/interact/"
+
+    def setUp(self):
+        self.user = User.objects.create(email="intern@example.com", role="INTERN")
+        self.intern = InternProfile.objects.create(user=self.user, department="Engineering")
+        other = InternProfile.objects.create(
+            user=User.objects.create(email="other@example.com", role="INTERN"), department="Design"
+        )
+        self.first = Task.objects.create(title="a", assigned_to=self.intern, due_date=date.today())
+        self.second = Task.objects.create(title="b", assigned_to=self.intern, due_date=date.today())
+        self.foreign = Task.objects.create(title="c", assigned_to=other, due_date=date.today())
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_applies_operations_and_reports_per_item(self):
+        operations = [
+            {"task_id": self.first.id, "action": "start"},
+            {"task_id": self.second.id, "action": "complete"},
+            {"task_id": self.foreign.id, "action": "complete"},
+            {"task_id": 9999, "action": "start"},
+            {"task_id": self.first.id, "action": "update_progress", "progress": "abc"},
+            {"task_id": self.first.id, "action": "update_progress", "progress": 50},
+        ]
+        response = self.client.post(self.url, {"operations": operations}, format="json")
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([r["status"] for r in results], [200, 200, 404, 404, 400, 200])
+        self.assertEqual(results[5]["task"]["progress"], 50)
+
+        self.first.refresh_from_db()
+        self.assertTrue(self.first.is_started)
+        self.assertIsNotNone(self.first.started_at)
+        self.assertEqual(self.first.progress, 50)
+        self.second.refresh_from_db()
+        self.assertEqual(self.second.status, "COMPLETED")
+        self.assertIsNotNone(self.second.completed_at)
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.progress, 0)
+
+        self.intern.refresh_from_db()
+        self.assertEqual(self.intern.completed_task_count, 1)
+        self.assertEqual(self.intern.started_task_count, 1)
+
+    def test_rejects_non_object_body(self):
+        response = self.client.post(self.url, [{"task_id": self.first.id, "action": "start"}], format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_query_count_is_independent_of_batch_size(self):
+        extra = [
+            Task.objects.create(title=f"t{i}", assigned_to=self.intern, due_date=date.today())
+            for i in range(10)
+        ]
+        # Lookup, bulk update and counter refresh (lock, aggregate, update) plus savepoints.
+        with self.assertNumQueries(9):
+            response = self.client.post(
+                self.url,
+                {"operations": [{"task_id": task.id, "action": "complete"} for task in extra]},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+
+
+def _scans(plan):
+    """Scans of ``tasks_task`` in an EXPLAIN plan as (index name or None, line)."""
+    if connection.vendor == "postgresql":
+        patterns = [
+            r"Seq Scan on tasks_task\b()",
+            r"Index (?:Only )?Scan (?:Backward )?using (\w+) on tasks_task\b",
+            r"Bitmap Index Scan on (\w+)",
+        ]
+    else:
+        # SQLite: "SCAN tasks_task" without "USING ... INDEX" is a full table scan.
+        patterns = [r"(?:SCAN|SEARCH) tasks_task\b(?:.*USING (?:COVERING )?INDEX (\w+))?"]
+    scans = []
+    for line in plan.splitlines():
+        for pattern in patterns:
+            match = re.search(pattern, line)
+            if match:
+                scans.append((match.group(1) or None, line))
+                break
+    return scans
+
+
+class TaskQueryPlanTests(TestCase):
+    """EXPLAIN the task access patterns against a seeded table; each must use
+    one of the indexes meant for it under the default planner settings.
+
+    The data is shaped like a long-running deployment, so that the filters
+    are as selective as in production and a full scan would lose on cost:
+    most tasks are completed and long untouched, a few are open and recent.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        users = User.objects.bulk_create(
+            User(email=f"intern{i}@example.com", role="INTERN") for i in range(200)
+        )
+        cls.interns = InternProfile.objects.bulk_create(
+            InternProfile(user=user, department="Engineering") for user in users
+        )
+        today = date.today()
+        now = timezone.now()
+        Task.objects.bulk_create(
+            Task(
+                title=f"t{i}",
+                assigned_to=cls.interns[i % 200],
+                due_date=today + timedelta(days=i % 60 - 30),
+                progress=(25, 50, 75)[i % 3],
+                status="IN_PROGRESS",
+            )
+            if i % 50 == 0 else
+            Task(
+                title=f"t{i}",
+                assigned_to=cls.interns[i % 200],
+                due_date=today - timedelta(days=i % 365 + 7),
+                progress=100,
+                status="COMPLETED",
+                completed_at=now - timedelta(days=i % 365, hours=1),
+            )
+            for i in range(20000)
+        )
+        # auto_now fields: completed tasks were last touched when completed.
+        Task.objects.filter(status="COMPLETED").update(
+            created_at=F("completed_at"), updated_at=F("completed_at")
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def assertIndexed(self, queryset, *indexes):
+        plan = queryset.explain()
+        scans = _scans(plan)
+        self.assertTrue(scans, plan)
+        for index, _ in scans:
+            self.assertIn(index, indexes, plan)
+
+    def test_intern_task_list_page(self):
+        user = self.interns[0].user
+        qs = Task.objects.visible_to(user).order_by(*TaskListCreateView.ordering).values(*TASK_READ_FIELDS)
+        self.assertIndexed(qs[:101], "task_assignee_created_idx")
+
+    def test_admin_task_list_page(self):
+        qs = Task.objects.visible_to(self.admin).order_by(*TaskListCreateView.ordering).values(*TASK_READ_FIELDS)
+        self.assertIndexed(qs[:101], "task_created_idx")
+
+    def test_counter_refresh_aggregate(self):
+        qs = (
+            Task.objects.filter(assigned_to_id__in=[intern.pk for intern in self.interns[:3]])
+            .order_by()
+            .values("assigned_to_id")
+            .annotate(**task_counter_aggregates())
+        )
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Task._meta.db_table)
+        # Any assignee index serves, including the one Django adds for the foreign key.
+        assignee_indexes = [
+            name for name, constraint in constraints.items()
+            if constraint["index"] and constraint["columns"][0] == "assigned_to_id"
+        ]
+        self.assertIndexed(qs, *assignee_indexes)
+
+    def test_dashboard_status_progress_filter(self):
+        self.assertIndexed(Task.objects.filter(status="IN_PROGRESS", progress__gt=0), "task_status_progress_idx")
+
+    def test_open_tasks_by_due_date(self):
+        qs = Task.objects.filter(due_date__lt=date.today()).exclude(status="COMPLETED")
+        self.assertIndexed(qs, "task_open_due_idx", "task_due_status_idx")
+
+    def test_completed_in_range(self):
+        now = timezone.now()
+        self.assertIndexed(
+            Task.objects.filter(completed_at__range=(now - timedelta(days=7), now)), "task_completed_at_idx"
+        )
+
+    def test_delta_sync_page(self):
+        since = timezone.now() - timedelta(hours=1)
+        for user, index in ((self.admin, "task_updated_idx"), (self.interns[0].user, "task_assignee_updated_idx")):
+            qs = Task.objects.visible_to(user).filter(updated_at__gt=since).order_by("updated_at", "id")
+            self.assertIndexed(qs.values(*TASK_READ_FIELDS)[:101], index)
+
+
+class TaskConditionalRequestTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        intern = InternProfile.objects.create(
+            user=User.objects.create(email="intern@example.com", role="INTERN"), department="Engineering"
+        )
+        self.task = Task.objects.create(title="t", assigned_to=intern, due_date=date.today())
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_list_revalidates_with_one_query(self):
+        etag = self.client.get("/api/tasks/")["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/tasks/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        self.task.progress = 50
+        self.task.save()
+        response = self.client.get("/api/tasks/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_changes_on_delete(self):
+        etag = self.client.get("/api/tasks/")["ETag"]
+        Task.objects.create(title="x", assigned_to=self.task.assigned_to, due_date=date.today()).delete()
+        self.assertEqual(self.client.get("/api/tasks/", headers={"If-None-Match": etag}).status_code, 304)
+        self.task.delete()
+        self.assertEqual(self.client.get("/api/tasks/", headers={"If-None-Match": etag}).status_code, 200)
+
+    def test_list_etag_changes_when_assignee_is_renamed(self):
+        etag = self.client.get("/api/tasks/")["ETag"]
+        user = self.task.assigned_to.user
+        user.first_name = "Renamed"
+        user.save()
+        response = self.client.get("/api/tasks/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["assignedTo"], "Renamed")
+
+    def test_detail_revalidation_and_if_match(self):
+        url = f"/api/tasks/{self.task.id}/"
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url, headers={"If-None-Match": etag}).status_code, 304)
+
+        response = self.client.patch(url, {"progress": 25}, format="json", headers={"If-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        new_etag = response["ETag"]
+        self.assertNotEqual(new_etag, etag)
+        self.assertEqual(self.client.get(url)["ETag"], new_etag)
+
+        # A second writer still holding the old version is rejected.
+        response = self.client.patch(url, {"progress": 75}, format="json", headers={"If-Match": etag})
+        self.assertEqual(response.status_code, 412)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.progress, 25)
+
+
+class TaskVisibilityTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.user = User.objects.create(email="intern@example.com", role="INTERN")
+        intern = InternProfile.objects.create(user=self.user, department="Engineering")
+        other = InternProfile.objects.create(
+            user=User.objects.create(email="other@example.com", role="INTERN"), department="Design"
+        )
+        self.own = Task.objects.create(title="own", assigned_to=intern, due_date=date.today())
+        self.foreign = Task.objects.create(title="foreign", assigned_to=other, due_date=date.today())
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_visible_to(self):
+        self.assertEqual(set(Task.objects.visible_to(self.admin)), {self.own, self.foreign})
+        self.assertEqual(list(Task.objects.visible_to(self.user)), [self.own])
+        self.assertEqual(list(Task.objects.visible_to(AnonymousUser())), [])
+        # Filtered on the assignee column itself, without a join.
+        self.assertNotIn("JOIN", str(Task.objects.visible_to(self.user).query))
+
+    def test_other_interns_tasks_are_not_found(self):
+        url = f"/api/tasks/{self.foreign.id}/"
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.patch(url, {"progress": 50}, format="json").status_code, 404)
+        self.assertEqual(self.client.delete(url).status_code, 403)
+        with self.assertNumQueries(1):
+            response = self.client.post(f"/api/tasks/{self.foreign.id}/interact/", {"action": "complete"})
+        self.assertEqual(response.status_code, 404)
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.progress, 0)
+
+        response = self.client.get("/api/tasks/")
+        self.assertEqual([task["id"] for task in response.json()["results"]], [self.own.id])
+
+    def test_own_task_is_authorized_by_its_lookup(self):
+        # The lookup that finds the task is the whole permission check.
+        with self.assertNumQueries(1):
+            response = self.client.post(f"/api/tasks/{self.own.id}/interact/", {"action": "bogus"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.patch(f"/api/tasks/{self.own.id}/", {"progress": 50, "title": "x"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.own.refresh_from_db()
+        self.assertEqual((self.own.progress, self.own.title), (50, "own"))
+
+    def test_put_applies_the_same_intern_restrictions(self):
+        payload = {"title": "hijacked", "description": "x", "progress": 75, "due_date": "2030-01-01",
+                   "assigned_to_user_id": self.foreign.assigned_to_id}
+        response = self.client.put(f"/api/tasks/{self.own.id}/", payload, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.own.refresh_from_db()
+        self.assertEqual((self.own.title, self.own.progress, self.own.assigned_to_id), ("own", 75, self.user.id))
+        self.assertEqual(self.client.put(f"/api/tasks/{self.foreign.id}/", payload, format="json").status_code, 404)
+
+    def test_default_queryset_is_scoped(self):
+        view = TaskListCreateView(request=mock.Mock(user=self.user), format_kwarg=None)
+        self.assertEqual(list(view.get_queryset()), [self.own])
+
+
+class TaskAsyncListViewTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        intern_user = User.objects.create(email="intern@example.com", role="INTERN")
+        intern = InternProfile.objects.create(user=intern_user, department="Engineering")
+        other = InternProfile.objects.create(
+            user=User.objects.create(email="other@example.com", role="INTERN"), department="Design"
+        )
+        for i in range(5):
+            Task.objects.create(title=f"t{i}", assigned_to=intern if i % 2 else other, due_date=date.today())
+        self.intern_user = intern_user
+        self.client = APIClient()
+
+    def _both(self, user, params, **headers):
+        auth = f"Bearer {AccessToken.for_user(user)}"
+        sync = self.client.get("/api/tasks/", params, HTTP_AUTHORIZATION=auth, **headers)
+        request = RequestFactory().get("/api/tasks/", params, HTTP_AUTHORIZATION=auth, **headers)
+        return sync, async_to_sync(task_list_async)(request)
+
+    def test_matches_sync_view(self):
+        for user in (self.admin, self.intern_user):
+            sync, response = self._both(user, {"page_size": 1})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.content, sync.content)
+            self.assertEqual(response["ETag"], sync["ETag"])
+
+            next_params = dict(parse_qsl(urlsplit(sync.json()["next"]).query))
+            sync, response = self._both(user, next_params)
+            self.assertEqual(response.content, sync.content)
+
+    def test_conditional_and_unauthenticated_requests(self):
+        sync, _ = self._both(self.admin, {})
+        _, response = self._both(self.admin, {}, HTTP_IF_NONE_MATCH=sync["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        response = async_to_sync(task_list_async)(RequestFactory().get("/api/tasks/"))
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("Bearer", response["WWW-Authenticate"])
+
+    def test_split_read_view_follows_setting(self):
+        sync_view = TaskListCreateView.as_view()
+        self.assertIs(split_read_view(sync_view, task_list_async), sync_view)
+        with override_settings(ASYNC_READ_VIEWS=True):
+            self.assertTrue(iscoroutinefunction(split_read_view(sync_view, task_list_async)))
+
+
+@override_settings(TASK_EVENTS_HEARTBEAT=0.05)
+class TaskEventTests(TestCase):
+    def setUp(self):
+        self.broker = InProcessBroker()
+        self.enterContext(mock.patch.object(events, "_broker", self.broker))
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.intern_user = User.objects.create(email="intern@example.com", role="INTERN")
+        self.intern = InternProfile.objects.create(user=self.intern_user, department="Engineering")
+        self.other = InternProfile.objects.create(
+            user=User.objects.create(email="other@example.com", role="INTERN"), department="Design"
+        )
+
+    def _drain(self, subscription):
+        received = []
+        while not subscription._queue.empty():
+            received.append(subscription.render(subscription._queue.get_nowait()))
+        return received
+
+    def test_events_are_published_on_commit_and_filtered_per_user(self):
+        admin_sub = SyncSubscription(self.admin, self.broker)
+        intern_sub = SyncSubscription(self.intern_user, self.broker)
+        self.broker.subscribe(admin_sub)
+        self.broker.subscribe(intern_sub)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            own = Task.objects.create(title="own", assigned_to=self.intern, due_date=date.today())
+            Task.objects.create(title="other", assigned_to=self.other, due_date=date.today())
+        self.assertEqual(len(self._drain(admin_sub)), 2)
+        [created] = self._drain(intern_sub)
+        self.assertTrue(created.startswith("event: task.created\n"))
+        expected = task_rows_representation(Task.objects.filter(id=own.id).values(*TASK_READ_FIELDS))[0]
+        self.assertEqual(json.loads(created.split("data: ", 1)[1]), json.loads(JSONRenderer().render(expected)))
+
+        # Reassigning the task away shows up as a delete for the previous assignee.
+        own = Task.objects.get(id=own.id)
+        own.assigned_to = self.other
+        with self.captureOnCommitCallbacks(execute=True):
+            own.save()
+        [moved] = self._drain(intern_sub)
+        self.assertTrue(moved.startswith("event: task.deleted\n"))
+        self.assertIn(f'"id":{own.id}', moved)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            own.delete()
+        self.assertEqual(self._drain(intern_sub), [])
+        self.assertTrue(self._drain(admin_sub)[-1].startswith("event: task.deleted\n"))
+
+    def test_nothing_is_loaded_without_subscribers(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(title="t", assigned_to=self.intern, due_date=date.today())
+        with self.assertNumQueries(0), self.captureOnCommitCallbacks(execute=True):
+            events.publish_tasks(events.TASK_UPDATED, [task.id])
+
+    @override_settings(TASK_EVENTS_QUEUE_SIZE=1)
+    def test_slow_subscriber_is_told_to_resync(self):
+        subscription = SyncSubscription(self.admin, self.broker)
+        self.broker.subscribe(subscription)
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(2):
+                Task.objects.create(title=f"t{i}", assigned_to=self.intern, due_date=date.today())
+        self.assertEqual(self._drain(subscription), ["event: resync\ndata: {}\n\n"])
+        self.assertFalse(self.broker.has_subscribers())
+
+    def test_async_subscription_receives_events_from_other_threads(self):
+        event = {"type": events.TASK_UPDATED, "intern_id": self.intern.pk, "previous_intern_id": None, "data": {"id": 1}}
+
+        async def consume():
+            stream = AsyncSubscription(self.intern_user, self.broker).stream()
+            chunks = [await anext(stream)]
+            publisher = threading.Thread(target=self.broker.publish, args=(event,))
+            publisher.start()
+            chunk = await anext(stream)
+            while chunk.startswith(":"):  # keep-alive comments
+                chunk = await anext(stream)
+            chunks.append(chunk)
+            publisher.join()
+            await stream.aclose()
+            return chunks
+
+        preamble, received = async_to_sync(consume)()
+        self.assertTrue(preamble.startswith("retry: "))
+        self.assertEqual(received, 'event: task.updated\nid: 1\ndata: {"id":1}\n\n')
+        self.assertFalse(self.broker.has_subscribers())
+
+    def test_stream_endpoint_accepts_query_token(self):
+        client = APIClient()
+        self.assertEqual(client.get("/api/tasks/events/", HTTP_ACCEPT="text/event-stream").status_code, 401)
+
+        client.force_authenticate(self.intern_user)
+        issued = client.post("/api/tasks/events/token/").json()
+        self.assertEqual(issued["expires_in"], 60)
+        # Usable as ?since= for the delta sync after a reconnect.
+        self.assertEqual(client.get("/api/tasks/changes/", {"since": issued["since"]}).status_code, 200)
+        client.force_authenticate(None)
+        response = client.get("/api/tasks/events/", {"access_token": issued["token"]}, HTTP_ACCEPT="text/event-stream")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = iter(response.streaming_content)
+        self.assertTrue(next(stream).startswith(b"retry: "))
+        self.assertEqual(next(stream), b": keep-alive\n\n")
+        self.assertTrue(self.broker.has_subscribers())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(title="t", assigned_to=self.intern, due_date=date.today())
+        self.assertTrue(next(stream).startswith(b"event: task.created\n"))
+        response.close()
+        self.assertFalse(self.broker.has_subscribers())
+
+    def test_query_tokens_are_scoped_to_the_stream(self):
+        client = APIClient()
+        access = AccessToken.for_user(self.intern_user)
+        query = QueryToken.for_scope(self.intern_user, events.EVENTS_TOKEN_SCOPE)
+        other_scope = QueryToken.for_scope(self.intern_user, "reports.export")
+
+        def stream(token):
+            return client.get("/api/tasks/events/", {"access_token": str(token)}, HTTP_ACCEPT="text/event-stream")
+
+        # Long-lived access tokens never go in the URL.
+        self.assertEqual(stream(access).status_code, 401)
+        self.assertEqual(stream(other_scope).status_code, 401)
+        # The query token is refused as a bearer token everywhere else.
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {query}")
+        self.assertEqual(client.get("/api/tasks/").status_code, 401)
+        client.credentials()
+        response = stream(query)
+        self.assertEqual(response.status_code, 200)
+        response.close()
+
+    def test_query_tokens_are_redacted_from_access_logs(self):
+        with self.assertLogs("django.server", level="INFO") as logs:
+            logging.getLogger("django.server").info(
+                '"%s" %s %s', "GET /api/tasks/events/?access_token=abc.def&x=1 HTTP/1.1", "200", "0"
+            )
+        self.assertIn("access_token=[redacted]&x=1", logs.output[0])
+        self.assertNotIn("abc.def", logs.output[0])
+
+
+@override_settings(TASK_CHANGES_SETTLE_SECONDS=0)
+class TaskChangesTests(TestCase):
+    url = "/api/tasks/changes/"
+
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.intern_user = User.objects.create(email="intern@example.com", role="INTERN")
+        self.intern = InternProfile.objects.create(user=self.intern_user, department="Engineering")
+        self.other = InternProfile.objects.create(
+            user=User.objects.create(email="other@example.com", role="INTERN"), department="Design"
+        )
+        self.tasks = [
+            Task.objects.create(title=f"t{i}", assigned_to=self.intern, due_date=date.today()) for i in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _sync(self, since=None, **params):
+        if since:
+            params["since"] = since
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_full_then_incremental_sync(self):
+        body = self._sync()
+        self.assertEqual([row["id"] for row in body["changed"]], [task.id for task in self.tasks])
+        self.assertEqual(body["deleted"], [])
+        self.assertFalse(body["has_more"])
+
+        self.assertEqual(self._sync(body["cursor"])["changed"], [])
+
+        updated, removed_id = self.tasks[0], self.tasks[1].id
+        updated.progress = 50
+        updated.save()
+        self.tasks[1].delete()
+        created = Task.objects.create(title="new", assigned_to=self.other, due_date=date.today())
+
+        delta = self._sync(body["cursor"])
+        self.assertEqual([row["id"] for row in delta["changed"]], [updated.id, created.id])
+        self.assertEqual(delta["changed"][0]["progress"], 50)
+        self.assertEqual(delta["deleted"], [removed_id])
+
+    def test_pages_follow_the_cursor(self):
+        body = self._sync(page_size=2)
+        self.assertTrue(body["has_more"])
+        rest = self._sync(body["cursor"], page_size=2)
+        self.assertFalse(rest["has_more"])
+        ids = [row["id"] for row in body["changed"] + rest["changed"]]
+        self.assertEqual(ids, [task.id for task in self.tasks])
+
+    def _delete_intern_queries(self, task_count):
+        profile = InternProfile.objects.create(
+            user=User.objects.create(email=f"n{task_count}@example.com", role="INTERN"), department="Design"
+        )
+        Task.objects.bulk_create(
+            Task(title=f"t{i}", assigned_to=profile, due_date=date.today()) for i in range(task_count)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            profile.user.delete()
+        self.assertEqual(TaskTombstone.objects.filter(intern_id=profile.pk).count(), task_count)
+        return len(queries)
+
+    def test_deletes_are_batched_per_delete_call(self):
+        # Cascades cost the same number of queries however many tasks go.
+        self.assertEqual(self._delete_intern_queries(3), self._delete_intern_queries(60))
+
+        # A queryset spanning interns refreshes each intern's counters once.
+        Task.objects.create(title="other", assigned_to=self.other, due_date=date.today())
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.filter(title__in=["t0", "t1", "other"]).delete()
+        self.intern.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual((self.intern.task_count, self.other.task_count), (1, 0))
+        self.assertEqual(
+            set(TaskTombstone.objects.filter(task_id__in=[t.id for t in self.tasks[:2]]).values_list("intern_id", flat=True)),
+            {self.intern.pk},
+        )
+
+    def test_reassignment_is_a_deletion_for_the_previous_intern_only(self):
+        self.client.force_authenticate(self.intern_user)
+        cursor = self._sync()["cursor"]
+        task = Task.objects.get(id=self.tasks[0].id)
+        task.assigned_to = self.other
+        task.save()
+
+        delta = self._sync(cursor)
+        self.assertEqual((delta["changed"], delta["deleted"]), ([], [task.id]))
+        self.client.force_authenticate(self.admin)
+        delta = self._sync(cursor)
+        self.assertEqual(([row["id"] for row in delta["changed"]], delta["deleted"]), ([task.id], []))
+        self.assertEqual(TaskTombstone.objects.get().reason, TaskTombstone.REASSIGNED)
+
+    def test_timestamp_invalid_and_expired_since(self):
+        since = (timezone.now() - timedelta(minutes=1)).isoformat()
+        self.assertEqual(len(self._sync(since)["changed"]), 3)
+        self.assertEqual(self.client.get(self.url, {"since": "not-a-cursor"}).status_code, 400)
+        forged = [
+            {"t": "2024-01-01T00:00:00", "id": None},  # naive
+            {"t": "yesterday", "id": None},
+            {"t": timezone.now().isoformat(), "id": "1"},
+            ["t"],
+        ]
+        for payload in forged:
+            cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+            self.assertEqual(self.client.get(self.url, {"since": cursor}).status_code, 400, payload)
+        expired = (timezone.now() - timedelta(days=365)).isoformat()
+        self.assertEqual(self.client.get(self.url, {"since": expired}).status_code, 410)
+
+
+class TaskOverdueTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.intern_user = User.objects.create(email="intern@example.com", first_name="Ada", role="INTERN")
+        intern = InternProfile.objects.create(user=self.intern_user, department="Engineering")
+        today = date.today()
+        self.late = Task.objects.create(title="late", assigned_to=intern, due_date=today - timedelta(days=2))
+        self.later = Task.objects.create(title="later", assigned_to=intern, due_date=today - timedelta(days=1))
+        Task.objects.create(title="done", assigned_to=intern, due_date=today - timedelta(days=3), progress=100)
+        self.soon = Task.objects.create(title="soon", assigned_to=intern, due_date=today + timedelta(days=1))
+        Task.objects.create(title="far", assigned_to=intern, due_date=today + timedelta(days=30))
+        self.client = APIClient()
+
+    def _titles(self, params):
+        response = self.client.get("/api/tasks/", params)
+        self.assertEqual(response.status_code, 200)
+        return sorted(row["title"] for row in response.json()["results"])
+
+    def test_list_filters(self):
+        self.client.force_authenticate(self.intern_user)
+        self.assertEqual(self._titles({"overdue": "1"}), ["late", "later"])
+        self.assertEqual(self._titles({"overdue": "0"}), ["done", "far", "soon"])
+        due_before = (date.today() + timedelta(days=2)).isoformat()
+        self.assertEqual(self._titles({"due_before": due_before, "overdue": "0"}), ["done", "soon"])
+        self.assertEqual(self.client.get("/api/tasks/", {"due_before": "soon"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/tasks/", {"overdue": "maybe"}).status_code, 400)
+
+    def test_async_list_applies_filters(self):
+        auth = f"Bearer {AccessToken.for_user(self.admin)}"
+        request = RequestFactory().get("/api/tasks/", {"overdue": "1"}, HTTP_AUTHORIZATION=auth)
+        response = async_to_sync(task_list_async)(request)
+        self.assertEqual(sorted(row["title"] for row in json.loads(response.content)["results"]), ["late", "later"])
+        request = RequestFactory().get("/api/tasks/", {"due_before": "x"}, HTTP_AUTHORIZATION=auth)
+        self.assertEqual(async_to_sync(task_list_async)(request).status_code, 400)
+
+    def test_digests_scan_in_batches(self):
+        # Three open tasks due by the horizon: a full batch, then a short one.
+        with self.assertNumQueries(2):
+            digests, summary = build_digests(days=3, batch_size=2, max_items=1)
+        digest = digests[self.intern_user.id]
+        self.assertEqual((digest["overdue_count"], digest["due_soon_count"]), (2, 1))
+        self.assertEqual([row["id"] for row in digest["overdue"]], [self.late.id])
+        self.assertEqual(summary["interns"], [{"intern_id": self.intern_user.id, "overdue_count": 2, "due_soon_count": 1}])
+
+    def test_digest_command_sends_mail(self):
+        call_command("task_digest", "--send", stdout=io.StringIO())
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ["admin@example.com", "intern@example.com"])
+        intern_mail = next(message for message in mail.outbox if message.to == ["intern@example.com"])
+        self.assertIn("Overdue (2):", intern_mail.body)
+        self.assertIn("late", intern_mail.body)
+
+
+class TaskFilterTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create(email="admin@example.com", role="ADMIN")
+        self.ada = InternProfile.objects.create(
+            user=User.objects.create(email="ada@example.com", role="INTERN"), department="Engineering"
+        )
+        bob = InternProfile.objects.create(
+            user=User.objects.create(email="bob@example.com", role="INTERN"), department="Design"
+        )
+        today = date.today()
+        Task.objects.create(title="Write report", assigned_to=self.ada, due_date=today, priority="HIGH")
+        Task.objects.create(
+            title="Review", description="the quarterly report", assigned_to=bob,
+            due_date=today + timedelta(days=5), priority="LOW", progress=100,
+        )
+        Task.objects.create(title="Plan", assigned_to=self.ada, due_date=today + timedelta(days=9), priority="MEDIUM")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _titles(self, params):
+        response = self.client.get("/api/tasks/", params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [row["title"] for row in response.json()["results"]]
+
+    def test_filters(self):
+        self.assertEqual(self._titles({"status": "completed"}), ["Review"])
+        self.assertEqual(self._titles({"priority": "high,medium", "ordering": "due_date"}), ["Write report", "Plan"])
+        self.assertEqual(self._titles({"progress": "100"}), ["Review"])
+        self.assertEqual(self._titles({"assignee": str(self.ada.pk), "ordering": "due_date"}), ["Write report", "Plan"])
+        self.assertEqual(self._titles({"department": "Design"}), ["Review"])
+        self.assertEqual(self._titles({"due_after": date.today().isoformat(), "ordering": "-due_date"}), ["Plan", "Review"])
+        self.assertEqual(sorted(self._titles({"search": "report"})), ["Review", "Write report"])
+
+    def test_invalid_filters_are_rejected(self):
+        for params in ({"status": "DONE"}, {"progress": "33"}, {"assignee": "ada"}, {"due_after": "2024-13-01"}):
+            response = self.client.get("/api/tasks/", params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn(next(iter(params)), response.json())
+
+    def test_priority_ordering_pages_by_rank(self):
+        titles, params = [], {"ordering": "-priority", "page_size": 1}
+        while True:
+            response = self.client.get("/api/tasks/", params)
+            body = response.json()
+            titles += [row["title"] for row in body["results"]]
+            if not body["next"]:
+                break
+            params = dict(parse_qsl(urlsplit(body["next"]).query))
+        self.assertEqual(titles, ["Write report", "Plan", "Review"])
+        self.assertNotIn("priority_rank", body["results"][0])
+
+    def test_async_list_matches_sync(self):
+        auth = f"Bearer {AccessToken.for_user(self.admin)}"
+        params = {"ordering": "priority", "search": "report"}
+        sync = self.client.get("/api/tasks/", params)
+        request = RequestFactory().get("/api/tasks/", params, HTTP_AUTHORIZATION=auth)
+        response = async_to_sync(task_list_async)(request)
+        self.assertEqual(response.content, sync.content)
+
+
+class BenchmarkCommandTests(TestCase):
+    def test_generate_dataset_and_benchmark(self):
+        call_command(
+            "generate_dataset", "--interns", "3", "--tasks-per-intern", "4", "--progress", "0:1,100:1",
+            stdout=io.StringIO(),
+        )
+        tasks = Task.objects.filter(assigned_to__user__email__endswith="@bench.example.com")
+        self.assertEqual(tasks.count(), 12)
+        # Generated history survives bulk_create's auto_now_add.
+        self.assertTrue(tasks.filter(created_at__lt=timezone.now() - timedelta(hours=1)).exists())
+        self.assertFalse(tasks.filter(progress=100, completed_at__isnull=True).exists())
+        profile = InternProfile.objects.get(user__email="intern0@bench.example.com")
+        self.assertEqual(profile.task_count, 4)
+        # Outside the benchmark domain, so not part of the reported dataset.
+        other = InternProfile.objects.create(
+            user=User.objects.create(email="other@example.com", role="INTERN"), department="Design"
+        )
+        Task.objects.create(title="other", assigned_to=other, due_date=date.today())
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = f"{directory}/result.json"
+            call_command(
+                "benchmark", "--requests", "2", "--warmup", "0", "--scenario", "tasks",
+                "--scenario", "task_interaction", "--scenario", "health",
+                "--scenario", "interns_with_progress", "--output", output,
+                stdout=io.StringIO(),
+            )
+            with open(output) as f:
+                report = json.load(f)
+        self.assertEqual(set(report["scenarios"]), {"tasks", "task_interaction", "health", "interns_with_progress"})
+        self.assertEqual(report["scenarios"]["interns_with_progress"]["errors"], 0)
+        self.assertEqual(report["scenarios"]["health"]["errors"], 0)
+        self.assertIn("conn_max_age", report["database"])
+        self.assertEqual(report["scenarios"]["tasks"]["errors"], 0)
+        self.assertEqual(report["dataset"]["interns"], 3)
+        self.assertEqual(report["dataset"]["tasks"], 12)
+        self.assertIn("p99_ms", report["scenarios"]["task_interaction"])
@@ -1,11 +1,31 @@
 from django.urls import path
-from .views import TaskListCreateView, TaskRetrieveUpdateDestroyView, task_interaction
+
+from backend.async_api import split_read_view
+from .views import (
+    TaskBulkCreateView,
+    TaskChangesView,
+    TaskEventStreamView,
+    TaskEventTokenView,
+    TaskExportView,
+    TaskListCreateView,
+    TaskRetrieveUpdateDestroyView,
+    task_interaction,
+    task_events_async,
+    task_interaction_bulk,
+    task_list_async,
+)
 
 
 app_name = "tasks"
 
 urlpatterns = [
-    path("", TaskListCreateView.as_view(), name="task-list-create"),
+    path("", split_read_view(TaskListCreateView.as_view(), task_list_async), name="task-list-create"),
+    path("bulk/", TaskBulkCreateView.as_view(), name="task-bulk-create"),
+    path("interact/", task_interaction_bulk, name="task-interact-bulk"),
+    path("changes/", TaskChangesView.as_view(), name="task-changes"),
+    path("export/", TaskExportView.as_view(), name="task-export"),
+    path("events/", split_read_view(TaskEventStreamView.as_view(), task_events_async), name="task-events"),
+    path("events/token/", TaskEventTokenView.as_view(), name="task-events-token"),
     path("<int:pk>/", TaskRetrieveUpdateDestroyView.as_view(), name="task-detail"),
     path("<int:task_id>/interact/", task_interaction, name="task-interact"),
 ]
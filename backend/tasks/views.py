@@ -1,3 +1,8 @@
+import base64
+import hashlib
+import json
+from datetime import timedelta
+
 from rest_framework import permissions, status, generics
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
@@ -5,10 +10,38 @@ from django.contrib.auth import get_user_model
 from rest_framework import permissions, status, generics
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.conf import settings
+from django.db.models import Count, Max, Q
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import quote_etag
 
-from .models import Task
-from .serializers import TaskSerializer
+from backend.async_api import async_api_view, json_response
+from backend.exports import export_format, iterate_values, streaming_export
+from backend.metrics import query_budget
+from backend.visibility import VisibleToUserMixin
+from interns.counters import refresh_task_counters
+from interns.models import InternProfile
+from users.authentication import CachedJWTAuthentication, QueryToken, QueryTokenJWTAuthentication
+from .events import (
+    EVENTS_TOKEN_SCOPE,
+    TASK_CREATED,
+    TASK_UPDATED,
+    AsyncSubscription,
+    EventStreamRenderer,
+    SyncSubscription,
+    publish_tasks,
+)
+from .models import Task, TaskTombstone
+from .filters import TaskFilter, TaskOrderingFilter, filter_tasks
+from .serializers import TASK_READ_FIELDS, TaskSerializer, task_rows_representation
 
 
 User = get_user_model()
@@ -18,17 +51,118 @@ def _is_admin(user) -> bool:
     return getattr(user, "role", None) == "ADMIN"
 
 
-class TaskListCreateView(generics.ListCreateAPIView):
+TASK_EXPORT_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "assigned_to_id",
+    "assigned_to__user__first_name",
+    "assigned_to__user__last_name",
+    "assigned_to__user__email",
+    "due_date",
+    "priority",
+    "status",
+    "progress",
+    "is_started",
+    "started_at",
+    "completed_at",
+    "created_at",
+    "updated_at",
+]
+TASK_EXPORT_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "assigned_to_user_id",
+    "assignedTo",
+    "due_date",
+    "priority",
+    "status",
+    "progress",
+    "is_started",
+    "started_at",
+    "completed_at",
+    "created_at",
+    "updated_at",
+]
+
+
+def _export_row(row):
+    first = row.pop("assigned_to__user__first_name")
+    last = row.pop("assigned_to__user__last_name")
+    email = row.pop("assigned_to__user__email")
+    row["assigned_to_user_id"] = row.pop("assigned_to_id")
+    row["assignedTo"] = f"{first} {last}".strip() or email
+    return row
+
+
+def _task_etag(task_id, updated_at) -> str:
+    return quote_etag(hashlib.md5(f"{task_id}:{updated_at.isoformat()}".encode()).hexdigest())
+
+
+# Edits bump max(updated_at), deletes lower the count, renaming an assignee
+# bumps their user's updated_at (rows show the name), and the query string
+# separates pages and filters.
+_LIST_ETAG_AGGREGATES = {
+    "count": Count("id"),
+    "last_updated": Max("updated_at"),
+    "assignee_updated": Max("assigned_to__user__updated_at"),
+}
+
+
+def _task_list_etag(request, queryset) -> str:
+    return _list_etag(request, queryset.order_by().aggregate(**_LIST_ETAG_AGGREGATES))
+
+
+async def _atask_list_etag(request, queryset) -> str:
+    return _list_etag(request, await queryset.order_by().aaggregate(**_LIST_ETAG_AGGREGATES))
+
+
+def _list_etag(request, stats) -> str:
+    last_updated, assignee_updated = (
+        stats[name].isoformat() if stats[name] else "" for name in ("last_updated", "assignee_updated")
+    )
+    key = f"{request.get_full_path()}:{stats['count']}:{last_updated}:{assignee_updated}"
+    if "overdue" in request.GET:
+        # Tasks become overdue without being written; start over each day.
+        key += f":{timezone.localdate()}"
+    return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+
+def _task_list_values(queryset):
+    # Ordering annotations (e.g. priority_rank) stay in the rows so the
+    # cursor paginator can read its position from them.
+    return queryset.values(*TASK_READ_FIELDS, *queryset.query.annotation_select)
+
+
+@query_budget(4)
+class TaskListCreateView(VisibleToUserMixin, generics.ListCreateAPIView):
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
+    queryset = Task.objects.select_related("assigned_to", "assigned_to__user")
+    # Newest first; id breaks ties so cursor pages are stable.
+    ordering = ("-created_at", "-id")
+    filter_backends = [TaskFilter, TaskOrderingFilter]
 
-    def get_queryset(self):
-        user = self.request.user
-        qs = Task.objects.select_related("assigned_to", "assigned_to__user").all()
-        if _is_admin(user):
-            return qs
-        # Interns only see their own tasks
-        return qs.filter(assigned_to__user=user)
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Polling clients revalidate with If-None-Match; answer from one
+        # aggregate query before any rows are fetched or rendered.
+        etag = _task_list_etag(request, queryset)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        # Reads bypass TaskSerializer: values() rows are rendered by
+        # task_rows_representation, which produces the same JSON far cheaper.
+        queryset = _task_list_values(queryset)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            response = self.get_paginated_response(task_rows_representation(page))
+        else:
+            response = Response(task_rows_representation(queryset))
+        response["ETag"] = etag
+        return response
 
     def create(self, request, *args, **kwargs):
         if not _is_admin(request.user):
@@ -40,27 +174,344 @@ class TaskListCreateView(generics.ListCreateAPIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
-class TaskRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+
+@async_api_view
+async def task_list_async(request):
+    """Async GET for ``TaskListCreateView``, served under ASGI."""
+    queryset = filter_tasks(request, Task.objects.visible_to(request.user), TaskListCreateView)
+    etag = await _atask_list_etag(request, queryset)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
+    queryset = _task_list_values(queryset)
+    paginator = TaskListCreateView.pagination_class()
+    page = await paginator.apaginate_queryset(queryset, request, view=TaskListCreateView)
+    if page is not None:
+        data = paginator.get_paginated_response(task_rows_representation(page)).data
+    else:
+        data = task_rows_representation([row async for row in queryset])
+    return json_response(data, headers={"ETag": etag})
+
+BULK_TASK_LIMIT = 5000
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TaskBulkCreateView(APIView):
+    """Create many tasks in one request (admin only).
+
+    Accepts either ``{"tasks": [<task>, ...]}`` or a template fanned out to a
+    cohort: ``{"template": <task without assignee>, "assigned_to_user_ids": [...]}``.
+    All intern ids are validated with a single query and the tasks are
+    inserted with ``bulk_create`` in one transaction; any invalid item rejects
+    the whole batch.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        if not _is_admin(request.user):
+            return Response({"detail": "Only admins can create tasks."}, status=status.HTTP_403_FORBIDDEN)
+
+        items = self._items(request.data)
+        if isinstance(items, Response):
+            return items
+
+        user_ids = {
+            _int_or_none(item.get("assigned_to_user_id")) for item in items if isinstance(item, dict)
+        }
+        user_ids.discard(None)
+        valid_ids = set(
+            InternProfile.objects.filter(user_id__in=user_ids).values_list("user_id", flat=True)
+        )
+        context = {"request": request, "valid_intern_ids": valid_ids}
+        validated, errors = [], []
+        for item in items:
+            serializer = TaskSerializer(data=item, context=context)
+            if serializer.is_valid():
+                validated.append(serializer.validated_data)
+                errors.append({})
+            else:
+                errors.append(serializer.errors)
+        if any(errors):
+            # Errors are positional so clients can map them back to their items.
+            return Response({"tasks": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        now = timezone.now()
+        tasks = []
+        for data in validated:
+            data = dict(data)
+            task = Task(assigned_to_id=data.pop("assigned_to_user_id"), assigned_by=request.user, **data)
+            task.apply_progress_rules(now)
+            tasks.append(task)
+
+        with transaction.atomic():
+            created = Task.objects.bulk_create(tasks, batch_size=500)
+            # bulk_create skips post_save, so refresh counters and publish explicitly.
+            refresh_task_counters({task.assigned_to_id for task in created})
+            publish_tasks(TASK_CREATED, [task.pk for task in created])
+
+        rows = (
+            Task.objects.filter(id__in=[task.id for task in created])
+            .order_by("id")
+            .values(*TASK_READ_FIELDS)
+        )
+        return Response(task_rows_representation(rows), status=status.HTTP_201_CREATED)
+
+    def _items(self, data):
+        if not isinstance(data, dict):
+            return Response({"detail": "Expected a JSON object."}, status=status.HTTP_400_BAD_REQUEST)
+        if "template" in data:
+            template = data.get("template")
+            user_ids = data.get("assigned_to_user_ids")
+            if not isinstance(template, dict) or not isinstance(user_ids, list) or not user_ids:
+                return Response(
+                    {"detail": "Provide a template object and a non-empty assigned_to_user_ids list."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            items = [{**template, "assigned_to_user_id": user_id} for user_id in user_ids]
+        else:
+            items = data.get("tasks")
+            if not isinstance(items, list) or not items:
+                return Response({"detail": "Provide a non-empty tasks list."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > BULK_TASK_LIMIT:
+            return Response(
+                {"detail": f"At most {BULK_TASK_LIMIT} tasks can be created per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return items
+
+
+@query_budget(3)
+class TaskExportView(APIView):
+    """Stream every visible task as NDJSON (default) or CSV (``?output=csv``)."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        fmt = export_format(request)
+        if fmt is None:
+            return Response({"detail": "Unsupported export format."}, status=status.HTTP_400_BAD_REQUEST)
+
+        qs = Task.objects.visible_to(request.user).order_by("id")
+        rows = map(_export_row, iterate_values(qs, TASK_EXPORT_FIELDS))
+        return streaming_export(rows, TASK_EXPORT_COLUMNS, fmt, filename="tasks")
+
+
+def _encode_change_cursor(updated_at, task_id=None) -> str:
+    payload = json.dumps({"t": updated_at.isoformat(), "id": task_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_since(value):
+    """Return ``(timestamp, last_task_id or None)`` from a cursor or an ISO timestamp."""
+    when = parse_datetime(value)
+    if when is not None:
+        return (timezone.make_aware(when) if timezone.is_naive(when) else when), None
+    payload = json.loads(base64.urlsafe_b64decode(value.encode()))
+    when = parse_datetime(payload["t"])
+    # Cursors we hand out are always aware; anything else was forged.
+    if when is None or timezone.is_naive(when) or not (payload["id"] is None or isinstance(payload["id"], int)):
+        raise ValueError(value)
+    return when, payload["id"]
+
+
+@query_budget(3)
+class TaskChangesView(APIView):
+    """Delta sync: tasks changed and deleted since ``?since=``.
+
+    ``since`` is the ``cursor`` of a previous response or an ISO timestamp;
+    without it every visible task is returned. Responses hold at most
+    ``page_size`` changed tasks in ``(updated_at, id)`` order; while
+    ``has_more`` is true, call again with the returned cursor. ``deleted``
+    lists ids that left the caller's view (deleted, or reassigned away from
+    an intern) and are not in ``changed``.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        now = timezone.now()
+        # Rows newer than the settle window are left for the next sync, so a
+        # transaction that commits late cannot slip behind a handed-out cursor.
+        until = now - timedelta(seconds=settings.TASK_CHANGES_SETTLE_SECONDS)
+        since = None
+        if request.query_params.get("since"):
+            try:
+                since = _decode_since(request.query_params["since"])
+            except (ValueError, TypeError, KeyError):
+                return Response({"since": ["Invalid cursor or timestamp."]}, status=status.HTTP_400_BAD_REQUEST)
+            if since[0] < now - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS):
+                return Response(
+                    {"detail": "Cursor is too old; sync again without 'since'."}, status=status.HTTP_410_GONE
+                )
+
+        paginator = api_settings.DEFAULT_PAGINATION_CLASS()
+        page_size = paginator.get_page_size(request)
+
+        tasks = Task.objects.visible_to(request.user).filter(updated_at__lte=until)
+        if since is not None:
+            since_at, last_id = since
+            after = Q(updated_at__gt=since_at)
+            if last_id is not None:
+                after |= Q(updated_at=since_at, id__gt=last_id)
+            tasks = tasks.filter(after)
+        rows = list(tasks.order_by("updated_at", "id").values(*TASK_READ_FIELDS)[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if has_more:
+            cursor_at, cursor_id = rows[-1]["updated_at"], rows[-1]["id"]
+        else:
+            cursor_at, cursor_id = until, None
+
+        deleted = []
+        if since is not None:
+            tombstones = TaskTombstone.objects.filter(deleted_at__gt=since[0], deleted_at__lte=cursor_at)
+            if _is_admin(request.user):
+                tombstones = tombstones.filter(reason=TaskTombstone.DELETED)
+            else:
+                tombstones = tombstones.filter(intern_id=request.user.id)
+            changed_ids = {row["id"] for row in rows}
+            deleted = sorted(set(tombstones.values_list("task_id", flat=True)) - changed_ids)
+
+        return Response({
+            "changed": task_rows_representation(rows),
+            "deleted": deleted,
+            "cursor": _encode_change_cursor(cursor_at, cursor_id),
+            "has_more": has_more,
+        })
+
+
+def _event_stream_response(stream):
+    response = StreamingHttpResponse(stream, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Keep reverse proxies (nginx) from buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+class EventStreamTokenAuthentication(QueryTokenJWTAuthentication):
+    scope = EVENTS_TOKEN_SCOPE
+
+
+class TaskEventTokenView(APIView):
+    """Issues a short-lived query token for ``TaskEventStreamView``.
+
+    ``since`` is a ``TaskChangesView`` timestamp taken before the stream
+    opens: after a reconnect, changes since the previous connection's
+    ``since`` cover whatever was missed in between.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        token = QueryToken.for_scope(request.user, EVENTS_TOKEN_SCOPE)
+        since = timezone.now() - timedelta(seconds=settings.TASK_CHANGES_SETTLE_SECONDS)
+        return Response({
+            "token": str(token),
+            "expires_in": int(token.lifetime.total_seconds()),
+            "since": since.isoformat(),
+        })
+
+
+class TaskEventStreamView(APIView):
+    """Server-Sent Events stream of task create/update/delete events.
+
+    Admins receive every event; interns only those for their own tasks. The
+    browser's EventSource cannot set headers, so it passes a token from
+    ``TaskEventTokenView`` as ``?access_token=``. See ``tasks.events``.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [CachedJWTAuthentication, EventStreamTokenAuthentication]
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request):
+        return _event_stream_response(SyncSubscription(request.user).stream())
+
+
+_event_authenticators = [CachedJWTAuthentication(), EventStreamTokenAuthentication()]
+
+
+@async_api_view(authenticators=_event_authenticators)
+async def task_events_async(request):
+    """Async GET for ``TaskEventStreamView``, served under ASGI."""
+    return _event_stream_response(AsyncSubscription(request.user).stream())
+
+@query_budget(4)
+class TaskRetrieveUpdateDestroyView(VisibleToUserMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Tasks the user may not see are not found, so every lookup below is
+    # already authorized by its single query.
     queryset = Task.objects.select_related("assigned_to", "assigned_to__user").all()
 
-    def patch(self, request, *args, **kwargs):
-        # Admin can update anything; intern can update only own and limited fields
-        instance = self.get_object()
-        if _is_admin(request.user):
-            return super().patch(request, *args, **kwargs)
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.request.method in ("PUT", "PATCH"):
+            # Lock the row so the If-Match check and the write are atomic.
+            qs = qs.select_for_update(of=("self",))
+        return qs
+
+    def retrieve(self, request, *args, **kwargs):
+        updated_at = (
+            self.get_queryset().filter(pk=kwargs["pk"]).values_list("updated_at", flat=True).first()
+        )
+        if updated_at is not None:
+            etag = _task_etag(kwargs["pk"], updated_at)
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+            response = super().retrieve(request, *args, **kwargs)
+            response["ETag"] = etag
+            return response
+        return super().retrieve(request, *args, **kwargs)
+
+    @transaction.atomic
+    def put(self, request, *args, **kwargs):
+        return self._update(request, partial=False)
 
-        if instance.assigned_to.user_id != request.user.id:
-            return Response({"detail": "Not allowed."}, status=status.HTTP_403_FORBIDDEN)
+    @transaction.atomic
+    def patch(self, request, *args, **kwargs):
+        return self._update(request, partial=True)
 
-        # Limit intern-updatable fields to status/progress/time tracking only
-        allowed_fields = {"status", "progress", "started_at", "completed_at", "is_started"}
-        data = {k: v for k, v in request.data.items() if k in allowed_fields}
-        serializer = self.get_serializer(instance, data=data, partial=True)
+    def _update(self, request, partial):
+        # Admin can update anything; intern can update only own (the only
+        # tasks get_object() finds for them) and limited fields
+        instance = self.get_object()
+        # Optimistic concurrency: If-Match must name the current version.
+        failed = get_conditional_response(request, etag=_task_etag(instance.pk, instance.updated_at))
+        if failed is not None:
+            return failed
+        data = request.data
+        if not _is_admin(request.user):
+            if not isinstance(data, dict):
+                return Response({"detail": "Expected a JSON object."}, status=status.HTTP_400_BAD_REQUEST)
+            # Limit intern-updatable fields to status/progress/time tracking
+            # only, whatever the method; a PUT is applied as a partial update.
+            allowed_fields = {"status", "progress", "started_at", "completed_at", "is_started"}
+            data = {k: v for k, v in data.items() if k in allowed_fields}
+            partial = True
+        serializer = self.get_serializer(instance, data=data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
-        return Response(serializer.data)
+        return self._with_etag(Response(serializer.data))
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self._updated = serializer.instance
+
+    def _with_etag(self, response):
+        updated = getattr(self, "_updated", None)
+        if response.status_code == status.HTTP_200_OK and updated is not None:
+            response["ETag"] = _task_etag(updated.pk, updated.updated_at)
+        return response
 
     def delete(self, request, *args, **kwargs):
         if not _is_admin(request.user):
@@ -68,56 +519,100 @@ class TaskRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         return super().delete(request, *args, **kwargs)
 
 
+def _apply_interaction(task, action, progress):
+    """Apply an interaction to ``task`` in memory; return an error detail or None."""
+    if action == 'start':
+        task.is_started = True
+    elif action == 'update_progress':
+        if progress is None:
+            return "Progress value required."
+        try:
+            progress = int(progress)
+        except (TypeError, ValueError):
+            return "Invalid progress value."
+        task.progress = max(0, min(100, progress))
+    elif action == 'complete':
+        task.progress = 100
+    else:
+        return "Invalid action."
+    return None
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def task_interaction(request, task_id):
+    # Tasks of other interns are not found, as if they did not exist.
     try:
-        task = Task.objects.get(id=task_id)
-
-        # Check if the task belongs to the current user or the user is admin
-        if task.assigned_to.user != request.user and not _is_admin(request.user):
-            return Response({"detail": "Not allowed."}, status=status.HTTP_403_FORBIDDEN)
-
-        action = request.data.get('action')
-
-        if action == 'start':
-            task.is_started = True
-            task.save()
-            serializer = TaskSerializer(task)
-            return Response(serializer.data)
-
-        elif action == 'update_progress':
-            progress = request.data.get('progress')
-            if progress is not None:
-                try:
-                    progress = int(progress)
-                except (TypeError, ValueError):
-                    return Response({"detail": "Invalid progress value."}, status=status.HTTP_400_BAD_REQUEST)
-                task.progress = max(0, min(100, progress))
-                task.save()
-                serializer = TaskSerializer(task)
-                return Response(serializer.data)
-            else:
-                return Response({"detail": "Progress value required."}, status=status.HTTP_400_BAD_REQUEST)
+        task = Task.objects.visible_to(request.user).select_related("assigned_to__user").get(id=task_id)
+    except Task.DoesNotExist:
+        return Response({"detail": "Task not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        elif action == 'complete':
-            task.progress = 100
-            task.save()
-            serializer = TaskSerializer(task)
-            return Response(serializer.data)
+    error = _apply_interaction(task, request.data.get('action'), request.data.get('progress'))
+    if error:
+        return Response({"detail": error}, status=status.HTTP_400_BAD_REQUEST)
+    task.save()
+    serializer = TaskSerializer(task)
+    return Response(serializer.data)
 
-        else:
-            return Response({"detail": "Invalid action."}, status=status.HTTP_400_BAD_REQUEST)
 
-    except Task.DoesNotExist:
-        return Response({"detail": "Task not found."}, status=status.HTTP_404_NOT_FOUND)
-from django.utils import timezone
+BULK_INTERACTION_LIMIT = 500
+INTERACTION_FIELDS = ["is_started", "progress", "status", "started_at", "completed_at", "updated_at"]
 
 
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def task_interaction_bulk(request):
+    """Apply many interactions in one round trip.
 
-from .models import Task
+    Body: ``{"operations": [{"task_id", "action", "progress"}, ...]}``. All tasks
+    are loaded and authorized with one query and written with one
+    ``bulk_update``; the response lists a result per operation, in order, with
+    the HTTP status that operation would have produced on its own.
+    """
+    if not isinstance(request.data, dict):
+        return Response({"detail": "Expected a JSON object."}, status=status.HTTP_400_BAD_REQUEST)
+    operations = request.data.get('operations')
+    if not isinstance(operations, list) or not operations:
+        return Response({"detail": "Provide a non-empty operations list."}, status=status.HTTP_400_BAD_REQUEST)
+    if len(operations) > BULK_INTERACTION_LIMIT:
+        return Response(
+            {"detail": f"At most {BULK_INTERACTION_LIMIT} operations are allowed per request."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
-from .serializers import TaskSerializer
+    task_ids = {
+        _int_or_none(op.get('task_id')) for op in operations if isinstance(op, dict)
+    }
+    task_ids.discard(None)
+    tasks = Task.objects.visible_to(request.user).select_related("assigned_to__user").in_bulk(task_ids)
 
+    now = timezone.now()
+    results, changed = [], {}
+    for op in operations:
+        op = op if isinstance(op, dict) else {}
+        task_id = _int_or_none(op.get('task_id'))
+        task = tasks.get(task_id)
+        if task is None:
+            results.append({"task_id": op.get('task_id'), "status": 404, "detail": "Task not found."})
+            continue
+        error = _apply_interaction(task, op.get('action'), op.get('progress'))
+        if error:
+            results.append({"task_id": task_id, "status": 400, "detail": error})
+            continue
+        # Same timestamp/status rules Task.save() applies.
+        task.apply_progress_rules(now)
+        task.updated_at = now
+        changed[task_id] = task
+        results.append({"task_id": task_id, "status": 200})
 
+    if changed:
+        with transaction.atomic():
+            Task.objects.bulk_update(changed.values(), INTERACTION_FIELDS)
+            # bulk_update skips post_save, so refresh counters and publish explicitly.
+            refresh_task_counters({task.assigned_to_id for task in changed.values()})
+            publish_tasks(TASK_UPDATED, list(changed))
 
+    for result in results:
+        if result["status"] == 200:
+            result["task"] = TaskSerializer(changed[result["task_id"]]).data
+    return Response({"results": results})
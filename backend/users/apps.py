@@ -1,6 +1,19 @@
+import logging
+
 from django.apps import AppConfig
 
 
+# Loggers that write request lines, query string included.
+ACCESS_LOGGERS = ("django.server", "uvicorn.access", "gunicorn.access")
+
+
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .authentication import QueryTokenLogFilter
+
+        for name in ACCESS_LOGGERS:
+            logging.getLogger(name).addFilter(QueryTokenLogFilter())
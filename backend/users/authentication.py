@@ -0,0 +1,187 @@
+import copy
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class UserCache:
+    """Thread-safe LRU of user rows with a short TTL.
+
+    Entries are dropped on ``User`` save/delete (see ``users.signals``); the
+    TTL bounds staleness for changes made by other processes.
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+        # Callers get their own copy so per-request attribute changes never leak.
+        return copy.copy(user)
+
+    def set(self, user_id, user):
+        with self._lock:
+            self._entries[user_id] = (copy.copy(user), time.monotonic() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache(
+    max_size=settings.AUTH_USER_CACHE_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL,
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` that resolves the token's user through ``user_cache``.
+
+    The signed token already identifies the user (and carries ``role`` and
+    ``email`` claims), so the database is only consulted on a cache miss.
+    """
+
+    def get_user(self, validated_token):
+        user_id = self._user_id(validated_token)
+        user = user_cache.get(str(user_id))
+        if user is None:
+            try:
+                user = get_user_model().objects.get(**{jwt_settings.USER_ID_FIELD: user_id})
+            except get_user_model().DoesNotExist as e:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+            user_cache.set(str(user_id), user)
+        return self._check_user(user, validated_token)
+
+    async def aauthenticate(self, request):
+        """Async ``authenticate`` for the ASGI read views (see ``backend.async_api``)."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user_id = self._user_id(validated_token)
+        user = user_cache.get(str(user_id))
+        if user is None:
+            try:
+                user = await get_user_model().objects.aget(**{jwt_settings.USER_ID_FIELD: user_id})
+            except get_user_model().DoesNotExist as e:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+            user_cache.set(str(user_id), user)
+        return self._check_user(user, validated_token)
+
+    def _user_id(self, validated_token):
+        try:
+            return validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    def _check_user(self, user, validated_token):
+        # Same checks as JWTAuthentication.get_user.
+        if jwt_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if jwt_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(jwt_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+        return user
+
+
+class QueryToken(AccessToken):
+    """Short-lived token for ``?access_token=``, valid for a single ``scope``.
+
+    Its token type keeps it out of header authentication, so a query token
+    that leaks from a URL cannot be used on any other endpoint.
+    """
+
+    token_type = "query"
+    lifetime = settings.QUERY_TOKEN_LIFETIME
+
+    @classmethod
+    def for_scope(cls, user, scope):
+        token = cls.for_user(user)
+        token["scope"] = scope
+        return token
+
+
+class QueryTokenJWTAuthentication(CachedJWTAuthentication):
+    """Reads a ``QueryToken`` for ``scope`` from ``?access_token=``.
+
+    Only for endpoints whose clients cannot set headers, such as the browser's
+    ``EventSource`` on the task event stream; subclasses set ``scope``.
+    Regular access tokens are refused here, since URLs end up in logs.
+    """
+
+    scope = None
+
+    def get_header(self, request):
+        token = request.GET.get("access_token")
+        if not token:
+            return None
+        return f"{jwt_settings.AUTH_HEADER_TYPES[0]} {token}".encode()
+
+    def get_validated_token(self, raw_token):
+        try:
+            token = QueryToken(raw_token)
+        except TokenError as e:
+            raise InvalidToken(e.args[0]) from e
+        if self.scope is None or token.get("scope") != self.scope:
+            raise InvalidToken(_("Token is not valid for this endpoint"))
+        return token
+
+
+_QUERY_TOKEN = re.compile(r"(access_token=)[^&\s\"']+")
+
+
+def _redact(value):
+    return _QUERY_TOKEN.sub(r"\1[redacted]", value) if isinstance(value, str) else value
+
+
+class QueryTokenLogFilter(logging.Filter):
+    """Masks ``access_token=`` values in access-log records.
+
+    Installed on the development server, uvicorn and gunicorn access loggers
+    (see ``users.apps``); ``args`` keep their shape for their formatters.
+    """
+
+    def filter(self, record):
+        record.msg = _redact(record.msg)
+        if isinstance(record.args, dict):
+            record.args = {key: _redact(value) for key, value in record.args.items()}
+        elif isinstance(record.args, tuple):
+            record.args = tuple(_redact(value) for value in record.args)
+        return True
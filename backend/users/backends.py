@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import make_password, verify_password
+
+from .login import arun_hash, run_hash
+
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """``ModelBackend`` that runs password hashing under the login limits of ``users.login``.
+
+    ``authenticate`` hashes on the request thread; ``aauthenticate`` (used by
+    the async login view) awaits the hashing pool. Stale hashes (other
+    algorithm or outdated cost) are transparently rehashed on a successful
+    login.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user (#20760).
+            run_hash(make_password, password)
+            return
+
+        is_correct, must_update = run_hash(verify_password, password, user.password)
+        if not is_correct:
+            return
+        if must_update:
+            user.password = run_hash(make_password, password)
+            user.save(update_fields=["password"])
+        if self.user_can_authenticate(user):
+            return user
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        try:
+            user = await UserModel._default_manager.aget_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            await arun_hash(make_password, password)
+            return
+
+        is_correct, must_update = await arun_hash(verify_password, password, user.password)
+        if not is_correct:
+            return
+        if must_update:
+            user.password = await arun_hash(make_password, password)
+            await user.asave(update_fields=["password"])
+        if self.user_can_authenticate(user):
+            return user
@@ -0,0 +1,45 @@
+"""Password hashers whose cost comes from ``settings.PASSWORD_HASHER_PARAMS``.
+
+Each class keeps Django's algorithm name, so hashes stay interchangeable with
+the stock hashers. When a parameter changes (or ``PASSWORD_HASHER_PROFILE``
+picks a different algorithm), ``must_update`` reports stored hashes as stale
+and they are rehashed the next time the user logs in.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+def _param(name):
+    return settings.PASSWORD_HASHER_PARAMS[name]
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return _param("pbkdf2_iterations")
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return _param("scrypt_work_factor")
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Requires the optional ``argon2-cffi`` package."""
+
+    @property
+    def time_cost(self):
+        return _param("argon2_time_cost")
+
+    @property
+    def memory_cost(self):
+        return _param("argon2_memory_cost")
+
+    @property
+    def parallelism(self):
+        return _param("argon2_parallelism")
@@ -0,0 +1,79 @@
+"""Login load shedding: a cap on concurrent password hashing and a
+per-account failed-attempt counter.
+
+Hash verification is CPU bound and (for PBKDF2, scrypt and Argon2) runs with
+the GIL released, so at most ``LOGIN_HASH_WORKERS`` hashes run at once, which
+caps how much CPU a login storm can take. Logins beyond
+``LOGIN_HASH_QUEUE`` waiting ones are rejected immediately with
+``HashPoolBusy`` instead of piling up.
+
+Under WSGI the request thread has to wait for its login anyway, so
+``run_hash`` hashes on that thread and only limits concurrency. The async
+login view (``users.views.login_async``, served under ASGI) uses
+``arun_hash``, which runs the hash on a pool of ``LOGIN_HASH_WORKERS``
+threads and awaits it, so the event loop and its other requests keep going.
+"""
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+class HashPoolBusy(Exception):
+    """Raised when every hashing slot and queue place is taken."""
+
+
+_executor = ThreadPoolExecutor(max_workers=settings.LOGIN_HASH_WORKERS, thread_name_prefix="password-hash")
+_workers = threading.BoundedSemaphore(settings.LOGIN_HASH_WORKERS)
+_slots = threading.BoundedSemaphore(settings.LOGIN_HASH_WORKERS + settings.LOGIN_HASH_QUEUE)
+
+
+def _limited(fn, *args):
+    with _workers:
+        return fn(*args)
+
+
+def run_hash(fn, *args):
+    """Run ``fn(*args)`` on the calling thread once a hashing slot is free."""
+    if not _slots.acquire(blocking=False):
+        raise HashPoolBusy
+    try:
+        return _limited(fn, *args)
+    finally:
+        _slots.release()
+
+
+async def arun_hash(fn, *args):
+    """Run ``fn(*args)`` on the hashing pool without blocking the event loop."""
+    if not _slots.acquire(blocking=False):
+        raise HashPoolBusy
+    try:
+        return await asyncio.wrap_future(_executor.submit(_limited, fn, *args))
+    finally:
+        _slots.release()
+
+
+def _failure_key(email):
+    digest = hashlib.sha256((email or "").strip().lower().encode()).hexdigest()
+    return f"login:failures:{digest}"
+
+
+def is_locked_out(email) -> bool:
+    return cache.get(_failure_key(email), 0) >= settings.LOGIN_FAILURE_LIMIT
+
+
+def record_failure(email):
+    key = _failure_key(email)
+    # add() starts the window; incr() keeps its original expiry.
+    if not cache.add(key, 1, timeout=settings.LOGIN_FAILURE_WINDOW):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=settings.LOGIN_FAILURE_WINDOW)
+
+
+def reset_failures(email):
+    cache.delete(_failure_key(email))
@@ -0,0 +1,57 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, verify_password
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password verifications (logins) per second for each hasher "
+        "profile, on one thread and on a pool of LOGIN_HASH_WORKERS threads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each measurement.")
+        parser.add_argument(
+            "--profile",
+            action="append",
+            dest="profiles",
+            help="Profile(s) to measure (default: all configured profiles).",
+        )
+
+    def handle(self, *args, **options):
+        profiles = options["profiles"] or list(settings.PASSWORD_HASHER_PROFILES)
+        workers = settings.LOGIN_HASH_WORKERS
+        for profile in profiles:
+            hasher_path = settings.PASSWORD_HASHER_PROFILES[profile]
+            with override_settings(PASSWORD_HASHERS=[hasher_path]):
+                try:
+                    encoded = get_hasher().encode("correct horse battery staple", get_hasher().salt())
+                except ValueError as exc:
+                    # e.g. argon2-cffi not installed
+                    self.stdout.write(f"{profile:>7}: skipped ({exc})")
+                    continue
+                single = self._rate(encoded, options["seconds"], threads=1)
+                pooled = self._rate(encoded, options["seconds"], threads=workers)
+            self.stdout.write(
+                f"{profile:>7}: {single:8.1f} logins/s per core, "
+                f"{pooled:8.1f} logins/s with {workers} workers"
+            )
+
+    def _rate(self, encoded, seconds, threads):
+        deadline = time.perf_counter() + seconds
+
+        def worker():
+            count = 0
+            while time.perf_counter() < deadline:
+                verify_password("correct horse battery staple", encoded)
+                count += 1
+            return count
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            total = sum(pool.map(lambda _: worker(), range(threads)))
+        return total / (time.perf_counter() - start)
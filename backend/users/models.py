@@ -26,6 +26,8 @@ class User(AbstractUser):
     
     username = None
     email = models.EmailField(unique=True)
+    # Task list ETags include the assignees' latest change (name, email).
+    updated_at = models.DateTimeField(auto_now=True)
     
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
@@ -5,21 +5,36 @@ from django.contrib.auth import get_user_model
 User = get_user_model()
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        # Signed identity claims, so clients and services need no lookup
+        token = super().get_token(user)
+        token['email'] = user.email
+        token['role'] = user.role
+        return token
+
     def validate(self, attrs):
         # Default behavior but use email instead of username
         data = super().validate(attrs)
-        refresh = self.get_token(self.user)
-        
-        # Add custom claims
-        data['user'] = {
-            'id': self.user.id,
-            'first_name': self.user.first_name,
-            'last_name': self.user.last_name,
-            'email': self.user.email,
-            'role': self.user.role,
-        }
+        data['user'] = self.user_data(self.user)
         return data
 
+    @classmethod
+    def login_data(cls, user):
+        """The login response for an already authenticated ``user`` (async login path)."""
+        refresh = cls.get_token(user)
+        return {'refresh': str(refresh), 'access': str(refresh.access_token), 'user': cls.user_data(user)}
+
+    @staticmethod
+    def user_data(user):
+        return {
+            'id': user.id,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'email': user.email,
+            'role': user.role,
+        }
+
 class RegisterSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=8)
     name = serializers.CharField(write_only=True)
@@ -0,0 +1,10 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def drop_cached_user(sender, instance, **kwargs):
+    user_cache.discard(str(instance.pk))
@@ -1,3 +1,191 @@
-from django.test import TestCase
+import json
+import threading
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import PBKDF2SHA1PasswordHasher
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import user_cache
+from .login import HashPoolBusy
+from .views import login_async, user_detail_async
+
+
+def hasher_params(**overrides):
+    return override_settings(PASSWORD_HASHER_PARAMS={**settings.PASSWORD_HASHER_PARAMS, **overrides})
+
+
+User = get_user_model()
+
+
+@hasher_params(pbkdf2_iterations=1000)
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(
+            email="admin@example.com", password="password123", first_name="Ada", role="ADMIN"
+        )
+        self.client = APIClient()
+
+    def _login(self):
+        response = self.client.post(
+            "/api/users/login/", {"email": "admin@example.com", "password": "password123"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()["access"]
+
+    def test_token_carries_identity_claims(self):
+        token = AccessToken(self._login())
+        self.assertEqual(token["role"], "ADMIN")
+        self.assertEqual(token["email"], "admin@example.com")
+
+    def test_repeat_requests_skip_user_lookup(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._login()}")
+        self.assertEqual(self.client.get("/api/users/me/").status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/users/me/")
+        self.assertEqual(response.json()["first_name"], "Ada")
+
+    def test_user_save_invalidates_cache(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._login()}")
+        self.client.get("/api/users/me/")
+
+        self.user.first_name = "Grace"
+        self.user.save()
+        self.assertEqual(self.client.get("/api/users/me/").json()["first_name"], "Grace")
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get("/api/users/me/").status_code, 401)
+
+
+@hasher_params(pbkdf2_iterations=1000)
+class LoginTests(TestCase):
+    url = "/api/users/login/"
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="intern@example.com", password="password123")
+        self.client = APIClient()
+
+    def _login(self, password):
+        return self.client.post(self.url, {"email": "intern@example.com", "password": password}, format="json")
+
+    def test_stale_hash_is_upgraded_on_login(self):
+        with hasher_params(pbkdf2_iterations=2000):
+            self.assertEqual(self._login("password123").status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$2000$"))
+
+    @override_settings(PASSWORD_HASHER_PROFILE="scrypt", PASSWORD_HASHERS=[
+        "users.hashers.TunedScryptPasswordHasher",
+        "users.hashers.TunedPBKDF2PasswordHasher",
+    ])
+    def test_profile_switch_rehashes_with_new_algorithm(self):
+        self.assertEqual(self._login("password123").status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$"))
+
+    @override_settings(LOGIN_FAILURE_LIMIT=2)
+    def test_repeated_failures_lock_the_account_without_hashing(self):
+        self.assertEqual(self._login("wrong").status_code, 401)
+        self.assertEqual(self._login("wrong").status_code, 401)
+        with mock.patch("users.backends.run_hash") as run_hash:
+            response = self._login("password123")
+        self.assertEqual(response.status_code, 429)
+        run_hash.assert_not_called()
+
+    def test_success_resets_failures(self):
+        with override_settings(LOGIN_FAILURE_LIMIT=2):
+            self._login("wrong")
+            self.assertEqual(self._login("password123").status_code, 200)
+            self._login("wrong")
+            self.assertEqual(self._login("password123").status_code, 200)
+
+    def test_busy_pool_sheds_load(self):
+        with mock.patch("users.backends.run_hash", side_effect=HashPoolBusy):
+            response = self._login("password123")
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Retry-After", response)
+
+
+    def test_non_object_body_is_rejected(self):
+        for body in ([], "email"):
+            response = self.client.post(self.url, body, format="json")
+            self.assertEqual(response.status_code, 400, body)
+            self.assertEqual(self._login_async(body).status_code, 400, body)
+
+    def test_django_default_hashers_still_verify(self):
+        self.assertIn("django.contrib.auth.hashers.BCryptSHA256PasswordHasher", settings.PASSWORD_HASHERS)
+        self.user.password = PBKDF2SHA1PasswordHasher().encode("password123", "salt", iterations=1000)
+        self.user.save()
+        self.assertEqual(self._login("password123").status_code, 200)
+
+    def _login_async(self, body):
+        request = RequestFactory().post(self.url, json.dumps(body), content_type="application/json")
+        return async_to_sync(login_async)(request)
+
+    def test_async_login_matches_sync_view(self):
+        response = self._login_async({"email": "intern@example.com", "password": "password123"})
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.content)
+        self.assertEqual(set(body), set(self._login("password123").json()))
+        self.assertEqual(body["user"]["email"], "intern@example.com")
+
+        response = self._login_async({"email": "intern@example.com"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("password", json.loads(response.content))
+
+    @override_settings(LOGIN_FAILURE_LIMIT=1)
+    def test_async_login_failures_and_lockout(self):
+        response = self._login_async({"email": "intern@example.com", "password": "wrong"})
+        self.assertEqual(response.status_code, 401)
+        response = self._login_async({"email": "intern@example.com", "password": "password123"})
+        self.assertEqual(response.status_code, 429)
+
+    def test_async_login_hashes_on_the_pool(self):
+        threads = []
+
+        def verify(password, encoded):
+            threads.append(threading.current_thread().name)
+            return True, False
+
+        with mock.patch("users.backends.verify_password", verify):
+            response = self._login_async({"email": "intern@example.com", "password": "password123"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(threads[0].startswith("password-hash"), threads)
+
+        with mock.patch("users.backends.arun_hash", side_effect=HashPoolBusy):
+            response = self._login_async({"email": "intern@example.com", "password": "password123"})
+        self.assertEqual(response.status_code, 503)
+
+
+class AsyncUserDetailTests(TestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create(email="ada@example.com", first_name="Ada", role="INTERN")
+
+    def _get(self, **headers):
+        return async_to_sync(user_detail_async)(RequestFactory().get("/api/users/me/", **headers))
+
+    def test_matches_sync_view_and_uses_user_cache(self):
+        auth = f"Bearer {AccessToken.for_user(self.user)}"
+        response = self._get(HTTP_AUTHORIZATION=auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, APIClient().get("/api/users/me/", HTTP_AUTHORIZATION=auth).content)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._get(HTTP_AUTHORIZATION=auth).status_code, 200)
+
+    def test_rejects_missing_and_invalid_tokens(self):
+        response = self._get()
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["WWW-Authenticate"], 'Bearer realm="api"')
+        response = self._get(HTTP_AUTHORIZATION="Bearer not-a-token")
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(json.loads(response.content)["code"], "token_not_valid")
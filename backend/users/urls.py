@@ -1,10 +1,11 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from .views import RegisterView, UserDetailView
+from rest_framework_simplejwt.views import TokenRefreshView
+from backend.async_api import split_async_view, split_read_view
+from .views import CustomTokenObtainPairView, RegisterView, UserDetailView, login_async, user_detail_async
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
-    path('login/', TokenObtainPairView.as_view(), name='login'),
+    path('login/', split_async_view(CustomTokenObtainPairView.as_view(), login_async, methods=('POST',)), name='login'),
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-    path('me/', UserDetailView.as_view(), name='me'),
+    path('me/', split_read_view(UserDetailView.as_view(), user_detail_async), name='me'),
 ]
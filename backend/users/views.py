@@ -1,16 +1,78 @@
 from rest_framework import generics, permissions, status
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
-from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.contrib.auth import aauthenticate, get_user_model
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from backend.async_api import async_api_view, json_response
+from backend.metrics import query_budget
+from .login import HashPoolBusy, is_locked_out, record_failure, reset_failures
 from .serializers import RegisterSerializer, UserSerializer, CustomTokenObtainPairSerializer
 
 User = get_user_model()
 
+LOCKED_OUT = 'Too many failed login attempts. Try again later.'
+BUSY = 'Login service is busy. Try again shortly.'
+
+
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
+    def post(self, request, *args, **kwargs):
+        if not isinstance(request.data, dict):
+            # The serializer rejects it with a 400; there is no email to track.
+            return super().post(request, *args, **kwargs)
+        email = request.data.get('email')
+        # Accounts with too many recent failures are refused before any hashing
+        if is_locked_out(email):
+            return Response(
+                {'detail': LOCKED_OUT},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={'Retry-After': str(settings.LOGIN_FAILURE_WINDOW)},
+            )
+        try:
+            response = super().post(request, *args, **kwargs)
+        except HashPoolBusy:
+            return Response({'detail': BUSY}, status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '1'})
+        except AuthenticationFailed:
+            record_failure(email)
+            raise
+        reset_failures(email)
+        return response
+
+
+@async_api_view(public=True)
+async def login_async(request):
+    """Async POST for ``CustomTokenObtainPairView``, served under ASGI.
+
+    Same responses as the sync view, but password hashing is awaited on the
+    login pool (``users.login.arun_hash``) instead of holding a thread.
+    """
+    serializer = CustomTokenObtainPairSerializer(context={'request': request})
+    # Field validation only; validate() would authenticate synchronously.
+    attrs = serializer.to_internal_value(request.data)
+    email = attrs[serializer.username_field]
+    if await sync_to_async(is_locked_out)(email):
+        return json_response(
+            {'detail': LOCKED_OUT},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={'Retry-After': str(settings.LOGIN_FAILURE_WINDOW)},
+        )
+    try:
+        user = await aauthenticate(request._request, email=email, password=attrs['password'])
+    except HashPoolBusy:
+        return json_response({'detail': BUSY}, status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '1'})
+    if not jwt_settings.USER_AUTHENTICATION_RULE(user):
+        await sync_to_async(record_failure)(email)
+        raise AuthenticationFailed(serializer.error_messages['no_active_account'], 'no_active_account')
+    await sync_to_async(reset_failures)(email)
+    return json_response(CustomTokenObtainPairSerializer.login_data(user))
+
+
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
@@ -41,6 +103,7 @@ class RegisterView(generics.CreateAPIView):
             'access': str(refresh.access_token),
         }, status=status.HTTP_201_CREATED)
 
+@query_budget(2)
 class UserDetailView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -48,6 +111,11 @@ class UserDetailView(APIView):
         serializer = UserSerializer(request.user)
         return Response(serializer.data)
 
+@async_api_view
+async def user_detail_async(request):
+    """Async GET for ``UserDetailView``; the user usually comes from the auth cache."""
+    return json_response(UserSerializer(request.user).data)
+
 class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
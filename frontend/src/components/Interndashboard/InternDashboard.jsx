@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from "react";
 import { useAuth } from "../../hooks/useAuth";
-import { tasksAPI } from "../../services/api";
+import { applyTaskEvent, internsAPI, nextPage, tasksAPI } from "../../services/api";
 import {
   FiClock,
   FiCheck,
@@ -14,6 +14,7 @@ import {
 const InternDashboard = () => {
   const { user } = useAuth();
   const [tasks, setTasks] = useState([]);
+  const [next, setNext] = useState(null);
   const [loading, setLoading] = useState(true);
   const [stats, setStats] = useState({
     total: 0,
@@ -25,16 +26,27 @@ const InternDashboard = () => {
 
   useEffect(() => {
     fetchTasks();
+    fetchStats();
+    // Live updates instead of polling; see tasksAPI.subscribe. A burst of
+    // events refreshes the stats once, a second after the last one.
+    let statsTimer = null;
+    const unsubscribe = tasksAPI.subscribe((type, task) => {
+      if (type === 'resync') fetchTasks();
+      else setTasks((prev) => applyTaskEvent(prev, type, task));
+      clearTimeout(statsTimer);
+      statsTimer = setTimeout(fetchStats, 1000);
+    });
+    return () => {
+      clearTimeout(statsTimer);
+      unsubscribe();
+    };
   }, []);
 
-  useEffect(() => {
-    calculateStats();
-  }, [  tasks]);
-
   const fetchTasks = async () => {
     try {
-      const res = await tasksAPI.list();
-      setTasks(res);
+      const page = await tasksAPI.list();
+      setTasks(page.results);
+      setNext(page.next);
     } catch (error) {
       console.error("Error fetching tasks:", error);
     } finally {
@@ -42,20 +54,33 @@ const InternDashboard = () => {
     }
   };
 
-  const calculateStats = () => {
-    const total = tasks.length;
-    const completed = tasks.filter((t) => t.status === "Completed").length;
-    const inProgress = tasks.filter((t) => t.status === "In Progress" && t.progress > 0).length;
-    const notStarted = tasks.filter((t) => t.progress === 0).length;
-    const overallProgress = total > 0 ? Math.round((completed / total) * 100) : 0;
+  const loadMoreTasks = async () => {
+    try {
+      const page = await nextPage(next);
+      setTasks((prev) => [...prev, ...page.results]);
+      setNext(page.next);
+    } catch (error) {
+      console.error("Error fetching tasks:", error);
+    }
+  };
 
-    setStats({
-      total,
-      completed,
-      inProgress,
-      notStarted,
-      overallProgress,
-    });
+  // Totals come from the server-side task counters (the intern's own row),
+  // so they cover every task, not just the pages loaded so far.
+  const fetchStats = async () => {
+    try {
+      const page = await internsAPI.listWithProgress();
+      const own = page.results[0]?.task_stats;
+      if (!own) return;
+      setStats({
+        total: own.total,
+        completed: own.completed,
+        inProgress: own.in_progress,
+        notStarted: own.not_started,
+        overallProgress: own.total > 0 ? Math.round((own.completed / own.total) * 100) : 0,
+      });
+    } catch (error) {
+      console.error("Error fetching task stats:", error);
+    }
   };
 
   const handleTaskAction = async (taskId, action, progress = null) => {
@@ -66,9 +91,10 @@ const InternDashboard = () => {
       }
       
       // Use the interact API for task actions
-      await tasksAPI.interact(taskId, action, data);
-      // Refresh tasks after action
-      await fetchTasks();
+      const updated = await tasksAPI.interact(taskId, action, data);
+      // Update the row in place instead of reloading every page
+      setTasks((prev) => applyTaskEvent(prev, 'task.updated', updated));
+      await fetchStats();
     } catch (error) {
       console.error("Error performing task action:", error);
     }
@@ -260,6 +286,15 @@ const InternDashboard = () => {
             ))}
           </ul>
         )}
+
+        {next && (
+          <button
+            onClick={loadMoreTasks}
+            className="mt-4 w-full px-4 py-2 text-sm text-blue-700 bg-blue-50 rounded-md hover:bg-blue-100"
+          >
+            Load more tasks
+          </button>
+        )}
       </section>
     </div>
   );
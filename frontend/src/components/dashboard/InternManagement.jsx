@@ -4,26 +4,33 @@ import {
   FiMail, FiUsers, FiActivity,
   FiCheck, FiClock, FiTrendingUp
 } from 'react-icons/fi';
-import { internsAPI, tasksAPI } from "../../services/api";
+import { internsAPI, nextPage, reportsAPI } from "../../services/api";
 
 
 const InternManagement = () => {
   const [interns, setInterns] = useState([]);
-  const [tasks, setTasks] = useState([]);
+  const [next, setNext] = useState(null);
+  const [totals, setTotals] = useState({ interns: 0, tasks: 0, completed: 0 });
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
 
-  // Fetch interns + tasks
+  // Fetch the first page of interns (with server-side task counters) and
+  // the department totals; more interns are loaded on demand.
   useEffect(() => {
     const fetchData = async () => {
       try {
         setLoading(true);
-        const [internsData, tasksData] = await Promise.all([
-          internsAPI.list(),
-          tasksAPI.list()
+        const [page, departments] = await Promise.all([
+          internsAPI.listWithProgress(),
+          reportsAPI.departments()
         ]);
-        setInterns(internsData);
-        setTasks(tasksData);
+        setInterns(page.results);
+        setNext(page.next);
+        setTotals(departments.reduce((sum, row) => ({
+          interns: sum.interns + row.intern_count,
+          tasks: sum.tasks + row.task_count,
+          completed: sum.completed + row.completed_task_count,
+        }), { interns: 0, tasks: 0, completed: 0 }));
       } catch (err) {
         console.error("Error fetching data:", err);
         setError("Failed to load interns or tasks.");
@@ -34,28 +41,26 @@ const InternManagement = () => {
     fetchData();
   }, []);
 
-  // Calculate intern progress based on their tasks
-  const calculateInternProgress = (internId) => {
-    const internTasks = tasks.filter(task => task.assigned_to === internId);
-    if (internTasks.length === 0) return 0;
-    
-    const completedTasks = internTasks.filter(task => task.status === "Completed");
-    return Math.round((completedTasks.length / internTasks.length) * 100);
+  const loadMore = async () => {
+    try {
+      const page = await nextPage(next);
+      setInterns((prev) => [...prev, ...page.results]);
+      setNext(page.next);
+    } catch (err) {
+      console.error("Error fetching interns:", err);
+      setError("Failed to load more interns.");
+    }
   };
 
-  // Calculate task statistics for each intern
-  const getInternStats = (internId) => {
-    const internTasks = tasks.filter(task => task.assigned_to === internId);
-    const completed = internTasks.filter(task => task.status === "Completed").length;
-    const inProgress = internTasks.filter(task => task.status === "In Progress" && task.progress > 0).length;
-    const notStarted = internTasks.filter(task => task.progress === 0).length;
-    
-    return {
-      total: internTasks.length,
-      completed,
-      inProgress,
-      notStarted
-    };
+  // Completion percentage from the intern's task counters
+  const calculateInternProgress = (intern) => {
+    const { total = 0, completed = 0 } = intern.task_stats || {};
+    return total > 0 ? Math.round((completed / total) * 100) : 0;
+  };
+
+  const getInternStats = (intern) => {
+    const { total = 0, completed = 0, in_progress = 0, not_started = 0 } = intern.task_stats || {};
+    return { total, completed, inProgress: in_progress, notStarted: not_started };
   };
 
   return (
@@ -93,7 +98,7 @@ const InternManagement = () => {
               <FiUsers className="text-blue-600 mr-2" />
               <span className="text-sm font-medium">Total Interns</span>
             </div>
-            <div className="text-2xl font-bold mt-1">{interns.length}</div>
+            <div className="text-2xl font-bold mt-1">{totals.interns}</div>
           </div>
           
           <div className="bg-green-50 p-4 rounded-lg">
@@ -102,7 +107,7 @@ const InternManagement = () => {
               <span className="text-sm font-medium">Active Interns</span>
             </div>
             <div className="text-2xl font-bold mt-1">
-              {interns.filter(i => i.status === "Active").length}
+              {interns.filter(i => i.status === "Active").length}{next ? '+' : ''}
             </div>
           </div>
           
@@ -112,9 +117,7 @@ const InternManagement = () => {
               <span className="text-sm font-medium">Avg. Progress</span>
             </div>
             <div className="text-2xl font-bold mt-1">
-              {interns.length > 0 
-                ? Math.round(interns.reduce((sum, intern) => sum + calculateInternProgress(intern.id), 0) / interns.length) 
-                : 0}%
+              {totals.tasks > 0 ? Math.round((totals.completed / totals.tasks) * 100) : 0}%
             </div>
           </div>
           
@@ -123,7 +126,7 @@ const InternManagement = () => {
               <FiTrendingUp className="text-purple-600 mr-2" />
               <span className="text-sm font-medium">Total Tasks</span>
             </div>
-            <div className="text-2xl font-bold mt-1">{tasks.length}</div>
+            <div className="text-2xl font-bold mt-1">{totals.tasks}</div>
           </div>
         </div>
       )}
@@ -155,8 +158,8 @@ const InternManagement = () => {
                 interns.map((intern) => {
                   if (!intern.id) return null;
                   
-                  const stats = getInternStats(intern.id);
-                  const progress = calculateInternProgress(intern.id);
+                  const stats = getInternStats(intern);
+                  const progress = calculateInternProgress(intern);
                   
                   return (
                     <tr
@@ -272,6 +275,15 @@ const InternManagement = () => {
           </table>
         </div>
       )}
+
+      {!loading && !error && next && (
+        <button
+          onClick={loadMore}
+          className="mt-4 w-full px-4 py-2 text-sm text-blue-700 bg-blue-50 rounded-lg hover:bg-blue-100"
+        >
+          Load more interns
+        </button>
+      )}
     </div>
   );
 };
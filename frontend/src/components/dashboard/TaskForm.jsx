@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import { FiX, FiUser, FiCalendar, FiAlertCircle, FiFileText, FiAlignLeft } from 'react-icons/fi';
-import { internsAPI, tasksAPI } from '../../services/api';
+import { internsAPI, nextPage, tasksAPI } from '../../services/api';
 
 const priorities = ['HIGH', 'MEDIUM', 'LOW'];
 
@@ -13,14 +13,16 @@ const TaskForm = ({ onClose, onSuccess }) => {
     priority: 'MEDIUM',
   });
   const [interns, setInterns] = useState([]);
+  const [internsNext, setInternsNext] = useState(null);
   const [loading, setLoading] = useState(false);
   const [errors, setErrors] = useState({});
 
   useEffect(() => {
   const loadInterns = async () => {
     try {
-      const data = await internsAPI.list();
-      setInterns(Array.isArray(data) ? data : []);
+      const page = await internsAPI.list();
+      setInterns(page.results);
+      setInternsNext(page.next);
     } catch (err) {
       console.error('Failed to load interns:', err);
       setInterns([]);
@@ -29,6 +31,16 @@ const TaskForm = ({ onClose, onSuccess }) => {
   loadInterns();
 }, []);
 
+  const loadMoreInterns = async () => {
+    try {
+      const page = await nextPage(internsNext);
+      setInterns((prev) => [...prev, ...page.results]);
+      setInternsNext(page.next);
+    } catch (err) {
+      console.error('Failed to load interns:', err);
+    }
+  };
+
   const handleChange = (e) => {
     const { name, value } = e.target;
     setFormData((prev) => ({ ...prev, [name]: value }));
@@ -149,6 +161,16 @@ const TaskForm = ({ onClose, onSuccess }) => {
                 </option>
               ))}
             </select>
+            {internsNext && (
+              <button
+                type="button"
+                onClick={loadMoreInterns}
+                className="mt-2 text-sm text-blue-600 hover:underline"
+                disabled={loading}
+              >
+                Load more interns
+              </button>
+            )}
             {errors.assigned_to_user_id && (
               <p className="text-red-500 text-sm mt-1">{errors.assigned_to_user_id}</p>
             )}
@@ -5,7 +5,7 @@ import {
   FiClock, FiActivity, FiPlay, FiCheckCircle
 } from 'react-icons/fi';
 
-const TaskManagement = ({ tasks = [], onCreateTask, onDeleteTask, onEditTask }) => {
+const TaskManagement = ({ tasks = [], hasMore = false, onLoadMore, onCreateTask, onDeleteTask, onEditTask }) => {
   const formatDate = (dateString) => {
     if (!dateString) return 'N/A';
     const options = { year: 'numeric', month: 'short', day: 'numeric' };
@@ -133,6 +133,15 @@ const TaskManagement = ({ tasks = [], onCreateTask, onDeleteTask, onEditTask })
           );
         })}
       </div>
+
+      {hasMore && (
+        <button
+          onClick={() => onLoadMore?.()}
+          className="mt-6 w-full px-4 py-2 text-sm text-blue-700 bg-blue-50 rounded-lg hover:bg-blue-100 transition"
+        >
+          Load more tasks
+        </button>
+      )}
     </div>
   );
 };
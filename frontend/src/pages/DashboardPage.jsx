@@ -5,7 +5,7 @@ import InternManagement from '../components/dashboard/InternManagement';
 import TaskManagement from '../components/dashboard/TaskManagement';
 import InternForm from '../components/dashboard/InternForm';
 import TaskForm from '../components/dashboard/TaskForm';
-import { internsAPI, tasksAPI } from '../services/api';
+import { applyTaskEvent, internsAPI, nextPage, tasksAPI } from '../services/api';
 import { 
   FiUsers, FiFileText, FiPieChart, FiCheckCircle, 
   FiBell, FiLogOut, FiHome, FiUser, FiClipboard, FiFile 
@@ -20,6 +20,7 @@ const DashboardPage = () => {
   const [loadingInterns, setLoadingInterns] = useState(false);
   const [internsError, setInternsError] = useState('');
   const [showTaskForm, setShowTaskForm] = useState(false);
+  const [tasksNext, setTasksNext] = useState(null);
   const [tasks, setTasks] = useState([
     { 
       id: 1, 
@@ -79,8 +80,8 @@ const DashboardPage = () => {
       setLoadingInterns(true);
       setInternsError('');
       try {
-        const data = await internsAPI.list();
-        setInterns(data || []);
+        const page = await internsAPI.list();
+        setInterns(page.results);
       } catch (err) {
         console.error('Failed to load interns:', err);
         setInternsError('Failed to load interns');
@@ -95,17 +96,34 @@ const DashboardPage = () => {
     const fetchTasks = async () => {
       if (activeSection !== 'tasks') return;
       try {
-        const data = await tasksAPI.list();
-        if (Array.isArray(data) && data.length) {
-          setTasks(data);
+        const page = await tasksAPI.list();
+        if (page.results.length) {
+          setTasks(page.results);
+          setTasksNext(page.next);
         }
       } catch {
         // Keep existing demo tasks if backend not ready
       }
     };
     fetchTasks();
+    if (activeSection !== 'tasks') return undefined;
+    // Live updates while the task section is open; see tasksAPI.subscribe.
+    return tasksAPI.subscribe((type, task) => {
+      if (type === 'resync') fetchTasks();
+      else setTasks((prev) => applyTaskEvent(prev, type, task));
+    });
   }, [activeSection]);
 
+  const loadMoreTasks = async () => {
+    try {
+      const page = await nextPage(tasksNext);
+      setTasks((prev) => [...prev, ...page.results]);
+      setTasksNext(page.next);
+    } catch (err) {
+      console.error('Failed to load more tasks', err);
+    }
+  };
+
   const handleDeleteTask = async (task) => {
     try {
       await tasksAPI.delete(task.id);
@@ -228,6 +246,8 @@ const DashboardPage = () => {
         {activeSection === 'tasks' && (
           <TaskManagement 
             tasks={tasks}
+            hasMore={Boolean(tasksNext)}
+            onLoadMore={loadMoreTasks}
             onCreateTask={() => setShowTaskForm(true)}
             onDeleteTask={handleDeleteTask}
             onEditTask={handleEditTask}
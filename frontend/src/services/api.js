@@ -138,12 +138,18 @@ export const authAPI = {
   }
 };
 
+// List endpoints are cursor-paginated: list calls resolve to one page,
+// { results, next, previous }. Pass `next` to nextPage() to load more.
+const listPage = (url, params) => api.get(url, { params }).then(res => res.data);
+
+export const nextPage = (next) => api.get(next).then(res => res.data);
+
 export const internsAPI = {
-  // List all interns (admin only)
-  list: () => api.get('interns/').then(res => res.data),
+  // First page of interns (admin only); params may set page_size
+  list: (params) => listPage('interns/', params),
 
-  // List interns with progress data
-  listWithProgress: () => api.get('interns-with-progress/').then(res => res.data),
+  // First page of interns with their task_stats (admin: all, intern: own row)
+  listWithProgress: (params) => listPage('interns/with-progress/', params),
 
   // Retrieve a single intern by user id (admin or self)
   retrieve: (id) => api.get(`interns/${id}/`).then(res => res.data),
@@ -154,8 +160,10 @@ export const internsAPI = {
 };
 
 export const tasksAPI = {
-  // List tasks (admin: all, intern: own)
-  list: (params) => api.get('tasks/', { params }).then(res => res.data),
+  // First page of tasks (admin: all, intern: own). params may filter by status,
+  // priority, progress, assignee, department, due_after/due_before, overdue
+  // and search, and sort with ordering=due_date|priority|created_at (- for desc)
+  list: (params) => listPage('tasks/', params),
   
   // Create a task (admin only)
   create: (data) => api.post('tasks/', data).then(res => res.data),
@@ -172,6 +180,92 @@ export const tasksAPI = {
   // Task interaction (start, update progress, complete)
   interact: (taskId, action, data = {}) => 
     api.post(`tasks/${taskId}/interact/`, { action, ...data }).then(res => res.data),
+
+  // Delta sync: { changed, deleted, cursor, has_more } since a previous cursor
+  changes: (since, params = {}) =>
+    api.get('tasks/changes/', { params: since ? { ...params, since } : params }).then(res => res.data),
+
+  // Stream task changes over Server-Sent Events. onEvent(type, task) gets
+  // 'task.created' / 'task.updated' (full list row) or 'task.deleted' ({ id }),
+  // and 'resync' when events may have been missed and the list should be
+  // refetched. Returns a function that closes the stream.
+  //
+  // EventSource cannot send headers, so each connection uses a short-lived
+  // token scoped to the stream (never the access token); as it expires, the
+  // stream is reopened with a fresh one instead of EventSource's own retry.
+  // The server does not replay events, so after a reconnect whatever was
+  // missed is fetched from the changes endpoint since the previous token's
+  // `since`; only when that is not possible is 'resync' emitted.
+  subscribe: (onEvent) => {
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
+    let lastSince = null;
+
+    const catchUp = async (since) => {
+      const createdAfter = Date.parse(since);
+      try {
+        let cursor = since;
+        let page;
+        do {
+          page = await tasksAPI.changes(cursor);
+          if (closed) return;
+          page.changed.forEach((task) => {
+            onEvent(Date.parse(task.created_at) > createdAfter ? 'task.created' : 'task.updated', task);
+          });
+          page.deleted.forEach((id) => onEvent('task.deleted', { id }));
+          cursor = page.cursor;
+        } while (page.has_more);
+      } catch {
+        if (!closed) onEvent('resync', null);
+      }
+    };
+
+    const open = async () => {
+      let since;
+      try {
+        const { data } = await api.post('tasks/events/token/');
+        if (closed) return;
+        since = data.since;
+        source = new EventSource(`${API_URL}tasks/events/?access_token=${encodeURIComponent(data.token)}`);
+      } catch {
+        if (!closed) retryTimer = setTimeout(open, 3000);
+        return;
+      }
+      source.onopen = () => {
+        if (lastSince) catchUp(lastSince);
+        lastSince = since;
+      };
+      source.onerror = () => {
+        source.close();
+        if (!closed) retryTimer = setTimeout(open, 3000);
+      };
+      ['task.created', 'task.updated', 'task.deleted'].forEach((type) => {
+        source.addEventListener(type, (e) => onEvent(type, JSON.parse(e.data)));
+      });
+      source.addEventListener('resync', () => onEvent('resync', null));
+    };
+
+    open();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      source?.close();
+    };
+  },
+};
+
+export const reportsAPI = {
+  // Per-department intern and task totals (admin only); params may hold
+  // created_after / created_before / completed_after / completed_before dates
+  departments: (params) => api.get('reports/departments/', { params }).then(res => res.data),
+};
+
+// Apply a task event from tasksAPI.subscribe to a list of task rows.
+export const applyTaskEvent = (tasks, type, task) => {
+  if (type === 'task.deleted') return tasks.filter((t) => t.id !== task.id);
+  if (tasks.some((t) => t.id === task.id)) return tasks.map((t) => (t.id === task.id ? task : t));
+  return type === 'task.created' ? [task, ...tasks] : tasks;
 };
 
 export default api;
\ No newline at end of file